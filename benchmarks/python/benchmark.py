@@ -0,0 +1,169 @@
+"""
+Throughput benchmark for the lakhua Python SDK.
+
+Compares a per-call geocode() loop against the batch geocode_many() API on
+reproducible random points inside India's bounding box, using the bundled data,
+and measures per-call latency with and without the coordinate cache on a skewed
+workload where a few thousand hot points make up every call. It also reports
+request latency percentiles for bursts of concurrent coroutines calling plain
+geocode(), geocode_async(), and a micro-batching AsyncGeocoder.
+
+Usage:
+    python benchmarks/python/benchmark.py [--points N] [--seed S]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from lakhua import (
+    AsyncGeocoder,
+    DataLoader,
+    GeocodeResult,
+    ReverseGeocoder,
+    geocode,
+    geocode_async,
+    geocode_many,
+)
+
+INDIA_BBOX = (6.5, 35.5, 68.0, 97.5)  # min_lat, max_lat, min_lon, max_lon
+
+
+def make_points(count: int, seed: int) -> Tuple[List[float], List[float]]:
+    """Generate reproducible uniform points over the India bounding box."""
+    rng = random.Random(seed)
+    min_lat, max_lat, min_lon, max_lon = INDIA_BBOX
+    lats = [rng.uniform(min_lat, max_lat) for _ in range(count)]
+    lons = [rng.uniform(min_lon, max_lon) for _ in range(count)]
+    return lats, lons
+
+
+def bench_per_call(lats: List[float], lons: List[float]) -> float:
+    """Return points/sec for a geocode() loop."""
+    start = time.perf_counter()
+    for lat, lon in zip(lats, lons):
+        geocode(lat, lon)
+    return len(lats) / (time.perf_counter() - start)
+
+
+def bench_batch(lats: List[float], lons: List[float]) -> float:
+    """Return points/sec for a single geocode_many() call."""
+    start = time.perf_counter()
+    geocode_many(lats, lons)
+    return len(lats) / (time.perf_counter() - start)
+
+
+def make_hot_points(count: int, hot_points: int, seed: int) -> Tuple[List[float], List[float]]:
+    """
+    Generate a skewed workload: count calls drawn from hot_points distinct points.
+
+    Hot points are locations with a match, like real pickup points. Uniform box
+    points would mostly be rejected by the coverage filter before the cache.
+    """
+    hot_lats: List[float] = []
+    hot_lons: List[float] = []
+    candidate_seed = seed
+    while len(hot_lats) < hot_points:
+        for lat, lon in zip(*make_points(hot_points, candidate_seed)):
+            if len(hot_lats) < hot_points and geocode(lat, lon) is not None:
+                hot_lats.append(lat)
+                hot_lons.append(lon)
+        candidate_seed += 1
+    rng = random.Random(seed + 1)
+    picks = [rng.randrange(hot_points) for _ in range(count)]
+    return [hot_lats[i] for i in picks], [hot_lons[i] for i in picks]
+
+
+def bench_latency_ns(lats: List[float], lons: List[float]) -> float:
+    """Return mean nanoseconds per geocode() call."""
+    start = time.perf_counter_ns()
+    for lat, lon in zip(lats, lons):
+        geocode(lat, lon)
+    return (time.perf_counter_ns() - start) / len(lats)
+
+
+async def _blocking_geocode(lat: float, lon: float) -> Optional[GeocodeResult]:
+    return geocode(lat, lon)
+
+
+def bench_bursts(
+    lats: List[float],
+    lons: List[float],
+    burst: int,
+    lookup: Callable[[float, float], Awaitable[Optional[GeocodeResult]]],
+) -> Tuple[float, float, float]:
+    """
+    Return (points/sec, p50 ms, p99 ms) for bursts of concurrent lookup() requests.
+
+    Requests arrive burst at a time; latency runs from a burst's arrival to each
+    response, so it includes time spent queued behind the rest of the burst.
+    """
+    latencies: List[float] = []
+
+    async def request(arrival: float, lat: float, lon: float) -> None:
+        await lookup(lat, lon)
+        latencies.append(time.perf_counter() - arrival)
+
+    async def run() -> float:
+        await lookup(lats[0], lons[0])  # warm up
+        start = time.perf_counter()
+        for offset in range(0, len(lats), burst):
+            arrival = time.perf_counter()
+            points = zip(lats[offset : offset + burst], lons[offset : offset + burst])
+            await asyncio.gather(*(request(arrival, lat, lon) for lat, lon in points))
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(run())
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    return len(lats) / elapsed, p50, p99
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--points", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--hot-points", type=int, default=2_000)
+    parser.add_argument("--burst", type=int, default=100)
+    args = parser.parse_args()
+
+    lats, lons = make_points(args.points, args.seed)
+    DataLoader.get_instance().load_resolution_store(4)  # keep load time out of the numbers
+
+    per_call = bench_per_call(lats, lons)
+    batch = bench_batch(lats, lons)
+
+    print(f"points:            {args.points}")
+    print(f"geocode() loop:    {per_call:,.0f} points/sec")
+    print(f"geocode_many():    {batch:,.0f} points/sec")
+    print(f"speedup:           {batch / per_call:.2f}x")
+
+    hot_lats, hot_lons = make_hot_points(args.points, args.hot_points, args.seed)
+    geocoder = ReverseGeocoder.get_instance()
+    uncached_ns = bench_latency_ns(hot_lats, hot_lons)
+    geocoder.enable_coordinate_cache(max_size=args.hot_points * 2)
+    bench_latency_ns(hot_lats, hot_lons)  # warm the cache
+    cached_ns = bench_latency_ns(hot_lats, hot_lons)
+    stats = geocoder.coordinate_cache_stats()
+    geocoder.disable_coordinate_cache()
+
+    print(f"hot points:        {args.hot_points} (all in coverage)")
+    print(f"uncached geocode:  {uncached_ns:,.0f} ns/call")
+    print(f"cached geocode:    {cached_ns:,.0f} ns/call (hit rate {stats.hit_rate:.1%})")
+
+    async_lats, async_lons = lats[:50_000], lons[:50_000]
+    print(f"burst:             {args.burst} concurrent requests")
+    for name, lookup in (
+        ("geocode()", _blocking_geocode),
+        ("geocode_async()", geocode_async),
+        ("micro-batched", AsyncGeocoder(batch_window=0).geocode),
+    ):
+        rate, p50, p99 = bench_bursts(async_lats, async_lons, args.burst, lookup)
+        print(f"{name + ':':<19}{rate:,.0f} points/sec, p50 {p50:.3f} ms, p99 {p99:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
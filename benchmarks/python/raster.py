@@ -0,0 +1,101 @@
+"""
+Raster lookup benchmark for the lakhua Python SDK.
+
+Builds a lookup raster (ReverseGeocoder.enable_raster()) at each grid step and
+prints its memory, build time, and sampled accuracy, then compares per-call
+geocode() latency through the raster against the H3 path on reproducible random
+points: uniform over India's bounding box, and clustered around the metros where
+most real traffic is. Use it to pick the grid step for a deployment.
+
+Usage:
+    python benchmarks/python/raster.py [--points N] [--seed S] [--steps 0.05 0.02 0.01]
+"""
+
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+from lakhua import DataLoader, ReverseGeocoder
+from lakhua.core.raster import raster_report
+
+INDIA_BBOX = (6.5, 35.5, 68.0, 97.5)  # min_lat, max_lat, min_lon, max_lon
+
+METROS = (
+    (28.6139, 77.2090),  # Delhi
+    (19.0760, 72.8777),  # Mumbai
+    (22.5726, 88.3639),  # Kolkata
+    (12.9716, 77.5946),  # Bengaluru
+    (13.0827, 80.2707),  # Chennai
+    (17.3850, 78.4867),  # Hyderabad
+)
+METRO_SPREAD_DEGREES = 0.15
+
+
+def make_points(count: int, seed: int) -> Tuple[List[float], List[float]]:
+    """Generate reproducible uniform points over the India bounding box."""
+    rng = random.Random(seed)
+    min_lat, max_lat, min_lon, max_lon = INDIA_BBOX
+    lats = [rng.uniform(min_lat, max_lat) for _ in range(count)]
+    lons = [rng.uniform(min_lon, max_lon) for _ in range(count)]
+    return lats, lons
+
+
+def make_metro_points(count: int, seed: int) -> Tuple[List[float], List[float]]:
+    """Generate reproducible points scattered around the metros."""
+    rng = random.Random(seed)
+    lats: List[float] = []
+    lons: List[float] = []
+    for _ in range(count):
+        lat, lon = rng.choice(METROS)
+        lats.append(lat + rng.gauss(0, METRO_SPREAD_DEGREES))
+        lons.append(lon + rng.gauss(0, METRO_SPREAD_DEGREES))
+    return lats, lons
+
+
+def bench_latency_ns(geocoder: ReverseGeocoder, lats: List[float], lons: List[float]) -> float:
+    """Return mean nanoseconds per geocode() call."""
+    geocode = geocoder.geocode
+    start = time.perf_counter_ns()
+    for lat, lon in zip(lats, lons):
+        geocode(lat, lon)
+    return (time.perf_counter_ns() - start) / len(lats)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--points", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--samples", type=int, default=100_000)
+    parser.add_argument("--steps", type=float, nargs="+", default=[0.05, 0.03, 0.02, 0.01])
+    args = parser.parse_args()
+
+    DataLoader.get_instance().load_fallback_index()  # keep load time out of the numbers
+    geocoder = ReverseGeocoder.get_instance()
+
+    print(f"{'step':>6} {'pixels':>10} {'memory':>9} {'build':>7} {'via H3':>7} {'accuracy':>9}")
+    for report in raster_report(args.steps, samples=args.samples, seed=args.seed):
+        print(
+            f"{report.step:>6} {report.rows * report.cols:>10,} "
+            f"{report.memory_bytes / 2**20:>7.1f}MB {report.build_seconds:>6.2f}s "
+            f"{1 - report.fast_share:>7.1%} {report.accuracy:>9.4%}"
+        )
+
+    workloads = {
+        "uniform": make_points(args.points, args.seed),
+        "metros": make_metro_points(args.points, args.seed),
+    }
+    print(f"points:            {args.points} per workload")
+    for name, (lats, lons) in workloads.items():
+        h3_ns = bench_latency_ns(geocoder, lats, lons)
+        print(f"{name} via H3:{'':<{10 - len(name)}}{h3_ns:,.0f} ns/call")
+    for step in args.steps:
+        geocoder.enable_raster(step)
+        for name, (lats, lons) in workloads.items():
+            raster_ns = bench_latency_ns(geocoder, lats, lons)
+            print(f"{name} raster {step}: {raster_ns:,.0f} ns/call")
+    geocoder.disable_raster()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+"""
+Regression benchmark suite for the lakhua Python SDK.
+
+Runs against the bundled reverse_geo_4/5 data and reports numbers meant to be
+compared across commits:
+
+- load: cold start in a fresh interpreter (import + load both resolutions and
+  the fallback index) from the binary store and from JSON, plus warm reloads
+  in-process with the files already in the page cache
+- memory: peak RSS of a process that loaded the data, and the Python objects
+  and allocations the loaded stores hold
+- latency: per-call geocode() p50/p99 for exact hits, fallback (parent) hits,
+  and misses
+- throughput: geocode() loops and geocode_many() batches on three seeded
+  workloads: uniform over India, skewed towards metros, and out of coverage
+
+Usage:
+    python benchmarks/python/suite.py [--points N] [--seed S] [--json out.json]
+    python benchmarks/python/suite.py --compare baseline.json
+
+Save a run from the base commit with --json and pass it to --compare on the
+branch under review; every metric is printed next to the baseline with the
+relative change. Latencies are noisy on shared machines, so compare runs from
+the same host and look for consistent shifts rather than single-digit
+percentages.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+INDIA_BBOX = (6.5, 35.5, 68.0, 97.5)  # min_lat, max_lat, min_lon, max_lon
+
+METROS = (
+    # (lat, lon, weight) for the largest urban areas
+    (28.6139, 77.2090, 32),  # Delhi
+    (19.0760, 72.8777, 22),  # Mumbai
+    (22.5726, 88.3639, 15),  # Kolkata
+    (12.9716, 77.5946, 13),  # Bengaluru
+    (13.0827, 80.2707, 11),  # Chennai
+    (17.3850, 78.4867, 10),  # Hyderabad
+    (23.0225, 72.5714, 8),  # Ahmedabad
+    (18.5204, 73.8567, 7),  # Pune
+    (21.1702, 72.8311, 7),  # Surat
+    (26.9124, 75.7873, 4),  # Jaipur
+)
+METRO_SHARE = 0.8
+METRO_SPREAD_DEGREES = 0.15
+
+OUT_OF_COVERAGE_BOXES = (
+    # (min_lat, max_lat, min_lon, max_lon): open sea around the peninsula
+    (8.0, 20.0, 60.0, 68.0),  # Arabian Sea
+    (8.0, 16.0, 84.0, 90.0),  # Bay of Bengal
+    (0.0, 5.0, 70.0, 95.0),  # Indian Ocean
+)
+
+Points = Tuple[List[float], List[float]]
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def uniform_points(count: int, seed: int) -> Points:
+    """Reproducible points spread uniformly over India's bounding box."""
+    rng = random.Random(seed)
+    min_lat, max_lat, min_lon, max_lon = INDIA_BBOX
+    return (
+        [rng.uniform(min_lat, max_lat) for _ in range(count)],
+        [rng.uniform(min_lon, max_lon) for _ in range(count)],
+    )
+
+
+def metro_points(count: int, seed: int) -> Points:
+    """Reproducible points concentrated around metros, the shape of real user traffic."""
+    rng = random.Random(seed + 1)
+    weights = [weight for _, _, weight in METROS]
+    min_lat, max_lat, min_lon, max_lon = INDIA_BBOX
+    lats: List[float] = []
+    lons: List[float] = []
+    for _ in range(count):
+        if rng.random() < METRO_SHARE:
+            lat, lon, _ = rng.choices(METROS, weights)[0]
+            lats.append(rng.gauss(lat, METRO_SPREAD_DEGREES))
+            lons.append(rng.gauss(lon, METRO_SPREAD_DEGREES))
+        else:
+            lats.append(rng.uniform(min_lat, max_lat))
+            lons.append(rng.uniform(min_lon, max_lon))
+    return lats, lons
+
+
+def out_of_coverage_points(count: int, seed: int) -> Points:
+    """Reproducible points at sea, where every lookup should miss."""
+    rng = random.Random(seed + 2)
+    lats: List[float] = []
+    lons: List[float] = []
+    for _ in range(count):
+        min_lat, max_lat, min_lon, max_lon = rng.choice(OUT_OF_COVERAGE_BOXES)
+        lats.append(rng.uniform(min_lat, max_lat))
+        lons.append(rng.uniform(min_lon, max_lon))
+    return lats, lons
+
+
+WORKLOADS: Dict[str, Callable[[int, int], Points]] = {
+    "uniform": uniform_points,
+    "metro": metro_points,
+    "out_of_coverage": out_of_coverage_points,
+}
+
+
+# --- cold load (runs in a fresh interpreter) ---------------------------------
+
+
+def _rss_kb() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        return None
+
+
+def _peak_rss_kb() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # bytes on macOS
+
+
+def probe(source: str, trace: bool) -> Dict[str, Any]:
+    """
+    Measure a cold start in this (fresh) interpreter and return the numbers.
+
+    Args:
+        source: "binary" to memory-map reverse_geo.bin, "json" to parse the JSON files
+            (through DataLoader.from_directory(..., cache=False), so validation is included).
+        trace: Count allocations with tracemalloc instead of timing (slows loading).
+    """
+    if trace:
+        import tracemalloc
+
+        tracemalloc.start()
+    rss_before = _rss_kb()
+    start = time.perf_counter()
+    from lakhua import DataLoader, ReverseGeocoder
+    from lakhua.core.constants import get_data_file_path
+
+    import_ms = (time.perf_counter() - start) * 1000
+    if source == "json":
+        # The bundled JSON files as a custom source: parsed and validated, never
+        # read from or written to a compiled cache, and the binary store untouched.
+        data_dir = get_data_file_path(5).parent
+        loader = DataLoader.from_directory(data_dir, cache=False)
+    else:
+        loader = DataLoader.get_instance()
+    geocoder = ReverseGeocoder.from_loader(loader)
+    gc.collect()
+    objects_before = len(gc.get_objects())
+    if trace:
+        traced_before = tracemalloc.take_snapshot()
+
+    start = time.perf_counter()
+    loader.preload()
+    loader.load_fallback_index()
+    load_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    geocoder.geocode(28.6139, 77.2090)
+    first_lookup_ms = (time.perf_counter() - start) * 1000
+
+    gc.collect()
+    if trace:
+        stats = tracemalloc.take_snapshot().compare_to(traced_before, "filename")
+        return {
+            "alloc_blocks": sum(stat.count_diff for stat in stats),
+            "alloc_kb": sum(stat.size_diff for stat in stats) // 1024,
+        }
+    rss_after = _rss_kb()
+    return dict(
+        gc_objects=len(gc.get_objects()) - objects_before,
+        import_ms=import_ms,
+        load_ms=load_ms,
+        first_lookup_ms=first_lookup_ms,
+        peak_rss_kb=_peak_rss_kb(),
+        load_rss_kb=None if rss_before is None or rss_after is None else rss_after - rss_before,
+    )
+
+
+def run_probe(source: str, trace: bool = False, repeat: int = 1) -> Dict[str, Any]:
+    """Run probe() in fresh interpreters; keep the run with the median load time."""
+    command = [sys.executable, os.path.abspath(__file__), "--probe", source]
+    if trace:
+        command.append("--trace")
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(command, check=True, capture_output=True, text=True)
+        runs.append(json.loads(output.stdout))
+    runs.sort(key=lambda run: run.get("load_ms", 0.0))
+    return runs[len(runs) // 2]
+
+
+# --- in-process measurements -------------------------------------------------
+
+
+def warm_load_ms(repeat: int) -> float:
+    """Median time to reload both resolutions and the fallback index from cached files."""
+    from lakhua import DataLoader
+
+    loader = DataLoader.get_instance()
+    timings = []
+    for _ in range(repeat):
+        loader.clear_store_cache()
+        start = time.perf_counter()
+        loader.preload()
+        loader.load_fallback_index()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def _percentile(sorted_values: List[int], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return float(sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))])
+
+
+def call_latencies(workloads: Dict[str, Points], rounds: int) -> Dict[str, Dict[str, float]]:
+    """
+    Per-call geocode() latency percentiles, split by how each point matched.
+
+    Every point is timed rounds times and keeps its fastest time, which filters
+    out scheduler noise without hiding systematic slowdowns.
+    """
+    from lakhua import geocode
+
+    timer = time.perf_counter_ns
+    by_kind: Dict[str, List[int]] = {"hit": [], "fallback": [], "miss": []}
+    labels = {"exact": "hit", "parent": "fallback", None: "miss"}
+    for lats, lons in workloads.values():
+        for lat, lon in zip(lats, lons):
+            result = geocode(lat, lon)
+            best = None
+            for _ in range(rounds):
+                start = timer()
+                geocode(lat, lon)
+                elapsed = timer() - start
+                best = elapsed if best is None or elapsed < best else best
+            kind = labels.get(result.match_kind if result is not None else None, "hit")
+            by_kind[kind].append(best or 0)
+
+    overhead = min(-(timer() - timer()) for _ in range(1000))
+    summary: Dict[str, Dict[str, float]] = {}
+    for kind, values in by_kind.items():
+        values.sort()
+        summary[kind] = {
+            "count": len(values),
+            "p50_ns": _percentile(values, 0.50),
+            "p99_ns": _percentile(values, 0.99),
+        }
+    summary["timer_overhead_ns"] = {"p50_ns": float(overhead)}
+    return summary
+
+
+def throughput(lats: List[float], lons: List[float]) -> Dict[str, float]:
+    """Points/sec for a geocode() loop and for one geocode_many() batch."""
+    from lakhua import geocode, geocode_many
+
+    start = time.perf_counter()
+    for lat, lon in zip(lats, lons):
+        geocode(lat, lon)
+    loop = len(lats) / (time.perf_counter() - start)
+    start = time.perf_counter()
+    batch = geocode_many(lats, lons)
+    many = len(lats) / (time.perf_counter() - start)
+    matched = sum(1 for code in batch.codes if code >= 0)
+    return {
+        "geocode_per_sec": loop,
+        "geocode_many_per_sec": many,
+        "match_rate": matched / len(lats),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def run_suite(points: int, latency_points: int, seed: int, repeat: int) -> Dict[str, Any]:
+    """Run every benchmark and return the results as a JSON-serializable dict."""
+    import lakhua
+
+    cold_binary = run_probe("binary", repeat=repeat)
+    cold_json = run_probe("json", repeat=repeat)
+    traced_binary = run_probe("binary", trace=True)
+    traced_json = run_probe("json", trace=True)
+
+    workloads = {name: make(points, seed) for name, make in WORKLOADS.items()}
+    latency_workloads = {
+        name: (lats[:latency_points], lons[:latency_points])
+        for name, (lats, lons) in workloads.items()
+    }
+    warm_ms = warm_load_ms(repeat)
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "lakhua_version": lakhua.__version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "points": points,
+            "latency_points": latency_points,
+            "seed": seed,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "load": {
+            "cold_binary": cold_binary,
+            "cold_json": cold_json,
+            "warm_ms": warm_ms,
+        },
+        "memory": {
+            # Python objects and allocations held by the loaded stores and index.
+            "binary": {"gc_objects": cold_binary.pop("gc_objects"), **traced_binary},
+            "json": {"gc_objects": cold_json.pop("gc_objects"), **traced_json},
+        },
+        "latency": call_latencies(latency_workloads, rounds=3),
+        "throughput": {name: throughput(*points_) for name, points_ in workloads.items()},
+    }
+
+
+# --- reporting ---------------------------------------------------------------
+
+
+def flatten(results: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Flatten nested results into dotted metric names."""
+    flat: Dict[str, Any] = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, name + "."))
+        else:
+            flat[name] = value
+    return flat
+
+
+def _format(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:,.3f}" if abs(value) < 100 else f"{value:,.0f}"
+    if isinstance(value, int):
+        return f"{value:,}"
+    return str(value)
+
+
+def report(results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> str:
+    """Render results as aligned text, with baseline values and changes when given."""
+    current = flatten(results)
+    previous = flatten(baseline) if baseline is not None else {}
+    width = max(len(name) for name in current)
+    lines = []
+    for name, value in current.items():
+        line = f"{name:<{width}}  {_format(value):>16}"
+        if name in previous:
+            old = previous[name]
+            line += f"  {_format(old):>16}"
+            numeric = isinstance(value, (int, float)) and isinstance(old, (int, float))
+            if numeric and not isinstance(value, bool) and old:
+                line += f"  {(value - old) / abs(old):+8.1%}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--points", type=int, default=100_000, help="points per workload")
+    parser.add_argument(
+        "--latency-points",
+        type=int,
+        default=20_000,
+        help="points per workload timed one call at a time",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5, help="cold/warm load repetitions")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="baseline JSON to compare against")
+    parser.add_argument("--probe", choices=["binary", "json"], help=argparse.SUPPRESS)
+    parser.add_argument("--trace", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.probe:
+        print(json.dumps(probe(args.probe, args.trace)))
+        return
+
+    results = run_suite(args.points, args.latency_points, args.seed, args.repeat)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+    print(report(results, baseline))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+
+
+if __name__ == "__main__":
+    main()
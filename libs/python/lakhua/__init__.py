@@ -2,26 +2,97 @@
 lakhua: Fast, offline reverse geocoding for India.
 
 This library provides in-memory reverse geocoding using H3 spatial indexing.
-"""
 
-from typing import Optional
+Importing lakhua is cheap: the public names below are resolved on first access,
+so h3, the data loader, and the geocoder singletons are only imported when a
+program actually uses them.
+"""
 
-from lakhua.core import (
-    DATA_DIR_NAME,
-    DATA_FILE_PREFIX,
-    DEFAULT_RESOLUTION,
-    MAX_RESOLUTION,
-    MIN_RESOLUTION,
-    SUPPORTED_RESOLUTIONS,
-    DataLoader,
-    ReverseGeocoder,
-    default_data_loader,
-    default_geocoder,
-)
-from lakhua.types import GeocodeOptions, GeocodeResult, LocationDetails
+import importlib
+
+# Static type checkers see the imports below; at runtime __getattr__ resolves
+# them lazily. Defined locally so that importing lakhua doesn't import typing.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from lakhua.api import (
+        geocode,
+        geocode_async,
+        geocode_h3,
+        geocode_iter,
+        geocode_many,
+        geocode_many_async,
+        is_ready,
+        warmup,
+    )
+    from lakhua.core import (
+        DATA_DIR_NAME,
+        DATA_FILE_PREFIX,
+        DEFAULT_RESOLUTION,
+        MAX_RESOLUTION,
+        MIN_RESOLUTION,
+        SUPPORTED_RESOLUTIONS,
+        AsyncGeocoder,
+        DataLoader,
+        DataSource,
+        GeocodeObserver,
+        ReverseGeocoder,
+        StatsCollector,
+        default_async_geocoder,
+        default_data_loader,
+        default_geocoder,
+    )
+    from lakhua.types import (
+        BatchGeocodeResult,
+        BuildStats,
+        BulkStats,
+        CacheStats,
+        GeocodeOptions,
+        GeocodeResult,
+        LoadEvent,
+        LocationDetails,
+        RasterReport,
+        StatsSnapshot,
+    )
 
 __version__ = "1.0.0"
 
+_LAZY_ATTRIBUTES = {
+    "DATA_DIR_NAME": "lakhua.core.constants",
+    "DATA_FILE_PREFIX": "lakhua.core.constants",
+    "DEFAULT_RESOLUTION": "lakhua.core.constants",
+    "MAX_RESOLUTION": "lakhua.core.constants",
+    "MIN_RESOLUTION": "lakhua.core.constants",
+    "SUPPORTED_RESOLUTIONS": "lakhua.core.constants",
+    "DataLoader": "lakhua.core.data_loader",
+    "default_data_loader": "lakhua.core.data_loader",
+    "DataSource": "lakhua.core.sources",
+    "ReverseGeocoder": "lakhua.core.geocoder",
+    "default_geocoder": "lakhua.core.geocoder",
+    "AsyncGeocoder": "lakhua.core.async_geocoder",
+    "default_async_geocoder": "lakhua.core.async_geocoder",
+    "GeocodeObserver": "lakhua.core.observer",
+    "StatsCollector": "lakhua.core.observer",
+    "BatchGeocodeResult": "lakhua.types",
+    "BuildStats": "lakhua.types",
+    "BulkStats": "lakhua.types",
+    "CacheStats": "lakhua.types",
+    "GeocodeOptions": "lakhua.types",
+    "GeocodeResult": "lakhua.types",
+    "LoadEvent": "lakhua.types",
+    "LocationDetails": "lakhua.types",
+    "RasterReport": "lakhua.types",
+    "StatsSnapshot": "lakhua.types",
+    "geocode": "lakhua.api",
+    "geocode_h3": "lakhua.api",
+    "geocode_many": "lakhua.api",
+    "geocode_iter": "lakhua.api",
+    "geocode_async": "lakhua.api",
+    "geocode_many_async": "lakhua.api",
+    "warmup": "lakhua.api",
+    "is_ready": "lakhua.api",
+}
+"""Public name -> module defining it, imported on first access."""
+
 __all__ = [
     "__version__",
     "DATA_DIR_NAME",
@@ -31,65 +102,50 @@ __all__ = [
     "MIN_RESOLUTION",
     "SUPPORTED_RESOLUTIONS",
     "DataLoader",
+    "DataSource",
     "ReverseGeocoder",
     "default_data_loader",
     "default_geocoder",
+    "AsyncGeocoder",
+    "default_async_geocoder",
+    "GeocodeObserver",
+    "StatsCollector",
+    "BatchGeocodeResult",
+    "BuildStats",
+    "BulkStats",
+    "CacheStats",
     "GeocodeOptions",
     "GeocodeResult",
+    "LoadEvent",
     "LocationDetails",
+    "RasterReport",
+    "StatsSnapshot",
     "geocode",
     "geocode_h3",
+    "geocode_many",
+    "geocode_iter",
+    "geocode_async",
+    "geocode_many_async",
+    "warmup",
+    "is_ready",
 ]
 
 
-def geocode(
-    lat: float,
-    lon: float,
-    options: Optional[GeocodeOptions] = None,
-) -> Optional[GeocodeResult]:
+def __getattr__(name: str) -> object:
     """
-    Reverse geocodes latitude/longitude into India location metadata.
-
-    Uses the library's internal singleton geocoder, so you can call this directly
-    without creating any class instance.
+    Internal hook that imports a public name the first time it's accessed.
 
-    Args:
-        lat: Latitude in decimal degrees.
-        lon: Longitude in decimal degrees.
-        options: Lookup options such as fallback and debug logging.
-
-    Returns:
-        Matched location details, or None when input is invalid / no match exists.
-
-    Example:
-        >>> from lakhua import geocode
-        >>> result = geocode(28.6139, 77.2090)
-        >>> print(result.city, result.state)
+    The value is then stored on the package, so later accesses are plain
+    attribute reads with no extra cost.
     """
-    return default_geocoder.geocode(lat, lon, options)
-
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
 
-def geocode_h3(
-    h3_index: str,
-    options: Optional[GeocodeOptions] = None,
-) -> Optional[GeocodeResult]:
-    """
-    Reverse geocodes an H3 cell index directly.
-
-    Uses the library's internal singleton geocoder. When fallback is enabled
-    (default), parent resolutions are checked until the minimum supported resolution.
-
-    Args:
-        h3_index: H3 cell index string.
-        options: Lookup options such as fallback and debug logging.
-
-    Returns:
-        Matched location details, or None when input is invalid / no match exists.
-
-    Example:
-        >>> from lakhua import geocode_h3
-        >>> result = geocode_h3("8560145bfffffff")
-        >>> print(result.city if result else "No match")
-    """
-    return default_geocoder.geocode_h3(h3_index, options)
 
+def __dir__() -> "list[str]":
+    """List the package's attributes, including names not imported yet."""
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
@@ -0,0 +1,8 @@
+"""Entry point for ``python -m lakhua``."""
+
+import sys
+
+from lakhua.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
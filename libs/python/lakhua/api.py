@@ -0,0 +1,283 @@
+"""
+Top-level lookup functions for lakhua.
+
+These are the functions exported as lakhua.geocode(), lakhua.geocode_many(), and
+so on. They live here rather than in the package __init__ so that import lakhua
+stays cheap: this module (and with it h3 and the data loader) is only imported
+the first time one of them is used.
+"""
+
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Literal, Optional, Tuple, Union, overload
+
+from lakhua.core.constants import SUPPORTED_RESOLUTIONS
+from lakhua.core.data_loader import default_data_loader
+from lakhua.core.geocoder import default_geocoder
+from lakhua.types import BatchGeocodeResult, GeocodeOptions, GeocodeResult
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+__all__ = [
+    "geocode",
+    "geocode_h3",
+    "geocode_many",
+    "geocode_iter",
+    "geocode_async",
+    "geocode_many_async",
+    "warmup",
+    "is_ready",
+]
+
+
+def geocode(
+    lat: float,
+    lon: float,
+    options: Optional[GeocodeOptions] = None,
+) -> Optional[GeocodeResult]:
+    """
+    Reverse geocodes latitude/longitude into India location metadata.
+
+    Uses the library's internal singleton geocoder, so you can call this directly
+    without creating any class instance.
+
+    Args:
+        lat: Latitude in decimal degrees.
+        lon: Longitude in decimal degrees.
+        options: Lookup options such as fallback and debug logging.
+
+    Returns:
+        Matched location details, or None when input is invalid / no match exists.
+
+    Example:
+        >>> from lakhua import geocode
+        >>> result = geocode(28.6139, 77.2090)
+        >>> print(result.city, result.state)
+    """
+    return default_geocoder.geocode(lat, lon, options)
+
+
+def geocode_h3(
+    h3_index: str,
+    options: Optional[GeocodeOptions] = None,
+) -> Optional[GeocodeResult]:
+    """
+    Reverse geocodes an H3 cell index directly.
+
+    Uses the library's internal singleton geocoder. When fallback is enabled
+    (default), parent resolutions are checked until the minimum supported resolution.
+
+    Args:
+        h3_index: H3 cell index string.
+        options: Lookup options such as fallback and debug logging.
+
+    Returns:
+        Matched location details, or None when input is invalid / no match exists.
+
+    Example:
+        >>> from lakhua import geocode_h3
+        >>> result = geocode_h3("8560145bfffffff")
+        >>> print(result.city if result else "No match")
+    """
+    return default_geocoder.geocode_h3(h3_index, options)
+
+
+def geocode_many(
+    lats: Iterable[float],
+    lons: Iterable[float],
+    options: Optional[GeocodeOptions] = None,
+) -> BatchGeocodeResult:
+    """
+    Reverse geocodes many latitude/longitude pairs in one call.
+
+    Uses the library's internal singleton geocoder. Much faster than calling
+    geocode() in a loop: each distinct H3 cell is looked up once and fallback
+    only runs for cells that missed.
+
+    Args:
+        lats: Latitudes in decimal degrees (list, tuple, or NumPy array).
+        lons: Longitudes in decimal degrees, same length as lats.
+        options: Lookup options such as resolution, fallback, and debug logging.
+
+    Returns:
+        Columnar results aligned with the input order; unmatched rows hold None.
+
+    Example:
+        >>> from lakhua import geocode_many
+        >>> batch = geocode_many([28.6139, 12.9716], [77.2090, 77.5946])
+        >>> print(batch.city, batch.state)
+    """
+    return default_geocoder.geocode_many(lats, lons, options)
+
+
+@overload
+def geocode_iter(
+    points: Iterable[Any],
+    options: Optional[GeocodeOptions] = None,
+    *,
+    chunk_size: int = ...,
+    lat_key: str = ...,
+    lon_key: str = ...,
+    with_points: Literal[False] = ...,
+) -> Iterator[Optional[GeocodeResult]]: ...
+
+
+@overload
+def geocode_iter(
+    points: Iterable[Any],
+    options: Optional[GeocodeOptions] = None,
+    *,
+    chunk_size: int = ...,
+    lat_key: str = ...,
+    lon_key: str = ...,
+    with_points: Literal[True],
+) -> Iterator[Tuple[Any, Optional[GeocodeResult]]]: ...
+
+
+def geocode_iter(
+    points: Iterable[Any],
+    options: Optional[GeocodeOptions] = None,
+    *,
+    chunk_size: int = 1024,
+    lat_key: str = "lat",
+    lon_key: str = "lon",
+    with_points: bool = False,
+) -> Union[Iterator[Optional[GeocodeResult]], Iterator[Tuple[Any, Optional[GeocodeResult]]]]:
+    """
+    Reverse geocodes a stream of points lazily, in fixed-size chunks.
+
+    Uses the library's internal singleton geocoder. Points are pulled from the
+    iterable chunk_size at a time and each chunk is looked up in bulk, so memory
+    stays flat on unbounded streams while avoiding per-call overhead.
+
+    Args:
+        points: (lat, lon) tuples, dicts with "lat"/"lon" keys, or objects with
+            lat/lon attributes.
+        options: Lookup options such as resolution, fallback, and debug logging.
+        chunk_size: Number of points looked up together.
+        lat_key: Key or attribute name holding the latitude.
+        lon_key: Key or attribute name holding the longitude.
+        with_points: When True, yield (point, result) pairs instead of results.
+
+    Returns:
+        Iterator over results in input order; invalid or unmatched points yield None.
+
+    Example:
+        >>> from lakhua import geocode_iter
+        >>> for result in geocode_iter([(28.6139, 77.2090), (12.9716, 77.5946)]):
+        ...     print(result.city if result else None)
+    """
+    if with_points:
+        return default_geocoder.geocode_iter(
+            points,
+            options,
+            chunk_size=chunk_size,
+            lat_key=lat_key,
+            lon_key=lon_key,
+            with_points=True,
+        )
+    return default_geocoder.geocode_iter(
+        points, options, chunk_size=chunk_size, lat_key=lat_key, lon_key=lon_key
+    )
+
+
+async def geocode_async(
+    lat: float,
+    lon: float,
+    options: Optional[GeocodeOptions] = None,
+) -> Optional[GeocodeResult]:
+    """
+    Reverse geocodes latitude/longitude without blocking the asyncio event loop.
+
+    Uses the library's internal async geocoder. The first lookup (which loads data
+    from disk) runs on an executor; warm lookups are answered on the event loop.
+
+    Args:
+        lat: Latitude in decimal degrees.
+        lon: Longitude in decimal degrees.
+        options: Lookup options such as fallback and debug logging.
+
+    Returns:
+        Matched location details, or None when input is invalid / no match exists.
+
+    Example:
+        >>> from lakhua import geocode_async
+        >>> result = await geocode_async(28.6139, 77.2090)
+        >>> print(result.city, result.state)
+    """
+    from lakhua.core.async_geocoder import default_async_geocoder  # keeps asyncio lazy
+
+    return await default_async_geocoder.geocode(lat, lon, options)
+
+
+async def geocode_many_async(
+    lats: Iterable[float],
+    lons: Iterable[float],
+    options: Optional[GeocodeOptions] = None,
+) -> BatchGeocodeResult:
+    """
+    Reverse geocodes many latitude/longitude pairs without blocking the event loop.
+
+    Uses the library's internal async geocoder. Cold loads and large batches run
+    on an executor; small warm batches run directly on the loop.
+
+    Args:
+        lats: Latitudes in decimal degrees (list, tuple, or NumPy array).
+        lons: Longitudes in decimal degrees, same length as lats.
+        options: Lookup options such as resolution, fallback, and debug logging.
+
+    Returns:
+        Columnar results aligned with the input order; unmatched rows hold None.
+
+    Example:
+        >>> from lakhua import geocode_many_async
+        >>> batch = await geocode_many_async([28.6139, 12.9716], [77.2090, 77.5946])
+        >>> print(batch.city)
+    """
+    from lakhua.core.async_geocoder import default_async_geocoder
+
+    return await default_async_geocoder.geocode_many(lats, lons, options)
+
+
+def warmup(
+    resolutions: Iterable[int] = SUPPORTED_RESOLUTIONS,
+    background: bool = True,
+    *,
+    nearest: bool = False,
+) -> "Future[None]":
+    """
+    Loads the data ahead of the first request, on a background thread by default.
+
+    Uses the library's internal data loader. Loads the given resolutions and the
+    fallback index lookups use, so the first geocode() call is as fast as the rest.
+
+    Args:
+        resolutions: H3 resolutions to load. Defaults to all supported resolutions.
+        background: When True, return at once and load on a daemon thread.
+        nearest: Also build the indexes used by GeocodeOptions(nearest_distance=...).
+
+    Returns:
+        Future that completes when the data is in memory (or holds the load error).
+
+    Example:
+        >>> import lakhua
+        >>> lakhua.warmup()  # at startup; lookups meanwhile wait for the load
+        >>> lakhua.is_ready()  # in the readiness probe
+    """
+    return default_data_loader.warmup(resolutions, background, nearest=nearest)
+
+
+def is_ready(resolutions: Iterable[int] = SUPPORTED_RESOLUTIONS) -> bool:
+    """
+    Reports whether lookups are served from memory, for health and readiness probes.
+
+    Args:
+        resolutions: H3 resolutions lookups will use. Defaults to all supported resolutions.
+
+    Returns:
+        True once warmup() with the same resolutions has finished.
+
+    Example:
+        >>> from lakhua import is_ready
+        >>> status = 200 if is_ready() else 503
+    """
+    return default_data_loader.is_ready(resolutions)
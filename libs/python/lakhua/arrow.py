@@ -0,0 +1,144 @@
+"""
+Apache Arrow integration for lakhua.
+
+geocode_table() looks up the coordinate columns of a pyarrow Table in one bulk
+call and appends the location fields as dictionary-encoded columns, built from
+the dictionary codes of the lookup with Arrow compute kernels instead of one
+Python object per row. This module needs pyarrow (pip install pyarrow) and is
+only imported when you import it; the core package doesn't depend on pyarrow.
+
+Example:
+    >>> from lakhua.arrow import geocode_table
+    >>> enriched = geocode_table(table, lat_col="lat", lon_col="lon")
+"""
+
+from typing import Any, Optional, Sequence
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError as error:  # pragma: no cover - exercised only without pyarrow
+    raise ImportError("lakhua.arrow requires pyarrow: pip install 'lakhua[arrow]'") from error
+
+from lakhua.core import default_geocoder
+from lakhua.core.h3_bits import RESOLUTION_SHIFT
+from lakhua.core.store import ATTRIBUTE_FIELDS, field_categories
+from lakhua.types import MATCH_KINDS, BatchGeocodeResult, GeocodeOptions
+
+TABLE_FIELDS = (*ATTRIBUTE_FIELDS, "matched_h3", "matched_resolution", "match_kind")
+"""Columns geocode_table() can add; the first four are added by default."""
+
+_NUMBER_PATTERN = r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$"
+
+
+def _coordinates(table: Any, column: str) -> Any:
+    """
+    Internal utility to read a coordinate column as a float64 NumPy array.
+
+    Nulls and strings that aren't decimal numbers become NaN, which geocode_many()
+    treats as invalid coordinates, so those rows hold nulls instead of raising.
+    """
+    values = table.column(column)
+    if pa.types.is_dictionary(values.type):
+        values = pc.cast(values, values.type.value_type)
+    if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+        values = pc.utf8_trim_whitespace(values)
+        numbers = pc.match_substring_regex(values, _NUMBER_PATTERN)
+        values = pc.if_else(numbers, values, pa.scalar(None, values.type))
+    if values.type != pa.float64():
+        values = pc.cast(values, pa.float64(), safe=False)
+    return values.combine_chunks().to_numpy(zero_copy_only=False)
+
+
+def _integer_array(values: Any, arrow_type: Any) -> Any:
+    """Internal utility to wrap an array.array column as an Arrow array without copying."""
+    return pa.Array.from_buffers(arrow_type, len(values), [None, pa.py_buffer(values)])
+
+
+def _dictionary_column(codes: Any, lookup: Sequence[int], categories: Sequence[str]) -> Any:
+    """
+    Internal utility to build a dictionary-encoded column from row codes.
+
+    Args:
+        codes: Integer Arrow array of per-row codes into lookup, -1 for missing rows.
+        lookup: Dictionary index per code, -1 for a missing value.
+        categories: Dictionary values.
+    """
+    lookup_array = pa.array([*lookup, -1], type=pa.int32())
+    # Code -1 (no match) selects the trailing -1 (missing) slot.
+    positions = pc.if_else(pc.less(codes, 0), len(lookup), codes)
+    indices = pc.take(lookup_array, positions)
+    indices = pc.if_else(pc.less(indices, 0), pa.scalar(None, pa.int32()), indices)
+    return pa.DictionaryArray.from_arrays(indices, pa.array(categories, type=pa.string()))
+
+
+def _field_column(batch: BatchGeocodeResult, codes: Any, cells: Any, field: str) -> Any:
+    """
+    Internal utility to build one output column from a batch result.
+
+    Dictionaries hold every value in the loaded dataset, so tables enriched
+    separately share dictionaries and concatenate without re-encoding. Every
+    column is computed from the batch's integer arrays; only matched_h3 formats
+    strings, once per distinct cell.
+    """
+    if field in ATTRIBUTE_FIELDS:
+        categories, lookup = field_categories(batch.attributes, field)
+        return _dictionary_column(codes, lookup, categories)
+    unmatched = pc.equal(cells, 0)
+    if field == "matched_resolution":
+        resolutions = pc.bit_wise_and(pc.shift_right(cells, RESOLUTION_SHIFT), 0xF)
+        resolutions = pc.cast(resolutions, pa.int8())
+        return pc.if_else(unmatched, pa.scalar(None, pa.int8()), resolutions)
+    if field == "match_kind":
+        kind_codes = _integer_array(batch.kind_codes, pa.int8())
+        return _dictionary_column(kind_codes, range(len(MATCH_KINDS)), MATCH_KINDS)
+    encoded = pc.dictionary_encode(cells)
+    names = [format(cell, "x") if cell else None for cell in encoded.dictionary.to_pylist()]
+    return pc.take(pa.array(names, type=pa.string()), encoded.indices)
+
+
+def geocode_table(
+    table: Any,
+    lat_col: str = "lat",
+    lon_col: str = "lon",
+    options: Optional[GeocodeOptions] = None,
+    *,
+    fields: Sequence[str] = ATTRIBUTE_FIELDS,
+    prefix: str = "",
+) -> Any:
+    """
+    Reverse geocode the coordinate columns of a pyarrow Table.
+
+    Returns a new table with one column appended per requested field. city,
+    state, district, and pincode are dictionary-encoded strings; rows with null,
+    unparseable, or out-of-range coordinates or no match hold nulls. Numeric
+    string columns are parsed.
+
+    Args:
+        table: pyarrow Table holding the coordinates.
+        lat_col: Name of the latitude column.
+        lon_col: Name of the longitude column.
+        options: Optional settings to control resolution and fallback behavior.
+        fields: Columns to add, any of TABLE_FIELDS. matched_resolution is int8,
+            match_kind dictionary-encoded, and matched_h3 a string column.
+        prefix: Prepended to every added column name, e.g. "geo_".
+
+    Returns:
+        New table with the added columns, in the input's row order.
+
+    Raises:
+        KeyError: If a coordinate column is missing.
+        ValueError: If fields holds an unknown column name.
+    """
+    unknown = [field for field in fields if field not in TABLE_FIELDS]
+    if unknown:
+        raise ValueError(f"unknown fields {unknown}; expected any of {TABLE_FIELDS}")
+
+    batch = default_geocoder.geocode_many(
+        _coordinates(table, lat_col), _coordinates(table, lon_col), options
+    )
+    codes = _integer_array(batch.codes, pa.int32())
+    cells = _integer_array(batch.cells, pa.uint64())
+    for field in fields:
+        table = table.append_column(prefix + field, _field_column(batch, codes, cells, field))
+    return table
@@ -0,0 +1,328 @@
+"""
+Build the runtime data files from a table of H3 cells and locations.
+
+build_dataset() turns records (an H3 cell plus city, state, and optional district
+and pincode) into the files a DataLoader reads: minified reverse_geo_5.json and
+reverse_geo_4.json, and the reverse_geo.bin binary store compiled from them. Along
+the way it:
+
+- deduplicates location tuples into one attribute table and drops repeated
+  (cell, location) records; a cell given two different locations is an error;
+- expands cells coarser than resolution 5 (e.g. the output of h3.compact_cells)
+  to their resolution-5 children;
+- derives the resolution-4 store from the resolution-5 one: every parent of a
+  covered cell gets the location most of its covered children have, so the two
+  stores always agree;
+- optionally compacts the resolution-5 store: a complete set of children sharing
+  one location is left to its parent, which fallback lookups return for them.
+
+Records are sorted in chunks that are spilled to temporary files and merged, so
+memory holds one chunk plus the output arrays (12 bytes per cell), however many
+records the input has.
+
+Example:
+    >>> from lakhua.build import build_dataset
+    >>> stats = build_dataset(records, "build/")  # then DataLoader.from_directory("build/")
+"""
+
+import heapq
+import itertools
+import json
+import os
+import struct
+import tempfile
+import time
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Mapping, Tuple, Union
+
+import h3
+import h3.api.basic_int as h3_int
+
+from lakhua.core.binary_store import write_binary_store
+from lakhua.core.constants import (
+    BINARY_FILE_NAME,
+    DATA_FILE_PREFIX,
+    MAX_RESOLUTION,
+    MIN_RESOLUTION,
+)
+from lakhua.core.h3_bits import cell_resolution, cell_to_parent
+from lakhua.core.store import AttributeTable, CompactStore
+from lakhua.types import BuildStats, LocationRow
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+LOCATION_FIELDS: Tuple[str, ...] = ("city", "state", "district", "pincode")
+"""Location columns read from every record; city and state are required."""
+
+_RUN_RECORD = struct.Struct("<QI")
+_RUN_BLOCK = 8192  # records read or written per I/O call on a spilled run
+_CODE_BITS = 32
+
+
+def _location_row(record: Mapping[str, Any], number: int) -> LocationRow:
+    """
+    Internal utility to read the location of one record.
+
+    Raises:
+        ValueError: If city or state is missing or blank.
+    """
+    city, state, district, pincode = (
+        "" if record.get(name) is None else str(record[name]).strip() for name in LOCATION_FIELDS
+    )
+    if not city or not state:
+        raise ValueError(f"record {number}: city and state are required")
+    return (city, state, district or None, pincode or None)
+
+
+def _record_cells(value: Any, number: int) -> List[int]:
+    """
+    Internal utility to read the cell of one record as resolution-5 integer cell IDs.
+
+    Raises:
+        ValueError: If the value isn't an H3 cell, or is finer than resolution 5.
+    """
+    if isinstance(value, int) and h3_int.is_valid_cell(value):
+        cell = value
+    else:
+        text = "" if value is None else str(value).strip()
+        if not h3.is_valid_cell(text):
+            raise ValueError(f"record {number}: {value!r} isn't a valid H3 cell")
+        cell = h3.str_to_int(text)
+    resolution = cell_resolution(cell)
+    if resolution > MAX_RESOLUTION:
+        raise ValueError(
+            f"record {number}: cell {cell:x} is finer than resolution {MAX_RESOLUTION}"
+        )
+    if resolution == MAX_RESOLUTION:
+        return [cell]
+    return sorted(h3_int.cell_to_children(cell, MAX_RESOLUTION))
+
+
+class _SortedRuns:
+    """
+    Internal external sort of (cell << 32 | code) keys.
+
+    Keys are collected in chunks; each full chunk is sorted and spilled to an
+    anonymous temporary file, and merged() streams every run back in order.
+    """
+
+    def __init__(self, chunk_size: int) -> None:
+        self._chunk_size = chunk_size
+        self._chunk: List[int] = []
+        self._runs: List[IO[bytes]] = []
+
+    def add(self, key: int) -> None:
+        self._chunk.append(key)
+        if len(self._chunk) >= self._chunk_size:
+            self._spill()
+
+    def _spill(self) -> None:
+        self._chunk.sort()
+        # Runs stay open until close(), which the build calls from a finally block.
+        run = tempfile.TemporaryFile(prefix="lakhua-build-")  # noqa: SIM115
+        pack, mask = _RUN_RECORD.pack, (1 << _CODE_BITS) - 1
+        for start in range(0, len(self._chunk), _RUN_BLOCK):
+            block = self._chunk[start : start + _RUN_BLOCK]
+            run.write(b"".join(pack(key >> _CODE_BITS, key & mask) for key in block))
+        run.seek(0)
+        self._runs.append(run)
+        self._chunk = []
+
+    @staticmethod
+    def _read_run(run: IO[bytes]) -> Iterator[int]:
+        while True:
+            block = run.read(_RUN_RECORD.size * _RUN_BLOCK)
+            if not block:
+                return
+            for cell, code in _RUN_RECORD.iter_unpack(block):
+                yield (cell << _CODE_BITS) | code
+
+    def merged(self) -> Iterator[int]:
+        """Stream every key added so far in ascending order (duplicates included)."""
+        self._chunk.sort()
+        return heapq.merge(*(self._read_run(run) for run in self._runs), self._chunk)
+
+    def close(self) -> None:
+        for run in self._runs:
+            run.close()
+        self._runs = []
+        self._chunk = []
+
+
+def _unique_cells(
+    keys: Iterator[int], attributes: AttributeTable, counters: "Counter[str]"
+) -> Iterator[Tuple[int, int]]:
+    """
+    Internal utility that turns sorted keys into unique (cell, code) pairs.
+
+    Raises:
+        ValueError: If a cell appears with two different locations.
+    """
+    previous_cell, previous_code = -1, -1
+    for key in keys:
+        cell, code = key >> _CODE_BITS, key & ((1 << _CODE_BITS) - 1)
+        if cell == previous_cell:
+            if code == previous_code:
+                counters["duplicates"] += 1
+                continue
+            raise ValueError(
+                f"cell {cell:x} has conflicting locations: "
+                f"{attributes[previous_code]} and {attributes[code]}"
+            )
+        previous_cell, previous_code = cell, code
+        yield cell, code
+
+
+def _derive_stores(
+    cells: Iterator[Tuple[int, int]], compact: bool, counters: "Counter[str]"
+) -> Dict[int, Tuple["array[int]", "array[int]"]]:
+    """
+    Internal utility that builds both resolutions' (cells, codes) arrays in one pass.
+
+    Sorted resolution-5 cells with the same resolution-4 parent are adjacent, so
+    each parent is settled from one small group of children.
+    """
+    fine_cells, fine_codes = array("Q"), array("I")
+    coarse_cells, coarse_codes = array("Q"), array("I")
+    groups = itertools.groupby(cells, key=lambda pair: cell_to_parent(pair[0], MIN_RESOLUTION))
+    for parent, group in groups:
+        children = list(group)
+        counts = Counter(code for _, code in children)
+        # most_common() keeps first-seen order on ties: the smallest child cell wins.
+        parent_code = counts.most_common(1)[0][0]
+        coarse_cells.append(parent)
+        coarse_codes.append(parent_code)
+        if (
+            compact
+            and len(counts) == 1
+            and len(children) == h3_int.cell_to_children_size(parent, MAX_RESOLUTION)
+        ):
+            counters["compacted"] += len(children)
+            continue
+        for cell, code in children:
+            fine_cells.append(cell)
+            fine_codes.append(code)
+    return {
+        MAX_RESOLUTION: (fine_cells, fine_codes),
+        MIN_RESOLUTION: (coarse_cells, coarse_codes),
+    }
+
+
+def _row_json(row: LocationRow) -> str:
+    """Internal utility encoding one location as the data files' minified JSON object."""
+    value = {name: field for name, field in zip(LOCATION_FIELDS, row) if field is not None}
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def write_store_json(path: PathLike, store: CompactStore) -> None:
+    """
+    Write one resolution as a minified data file, replacing it atomically.
+
+    Cells are written in ascending order and each distinct location is encoded
+    once, so output is deterministic and the write streams from the store's arrays.
+
+    Args:
+        path: JSON file to write.
+        store: Store to write.
+    """
+    target = Path(path)
+    temp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    attributes = store.attributes
+    encoded: Dict[int, str] = {}
+    try:
+        with open(temp_path, "w", encoding="utf-8") as out:
+            out.write("{")
+            for position, (cell, code) in enumerate(zip(store.cells, store.codes)):
+                value = encoded.get(code)
+                if value is None:
+                    value = encoded[code] = _row_json(attributes[code])
+                out.write(f'{"," if position else ""}"{cell:x}":{value}')
+            out.write("}")
+        os.replace(temp_path, target)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def build_dataset(
+    records: Iterable[Mapping[str, Any]],
+    output_dir: PathLike,
+    *,
+    cell_column: str = "h3",
+    compact: bool = False,
+    binary: bool = True,
+    chunk_size: int = 500_000,
+) -> BuildStats:
+    """
+    Build the data files from records of H3 cells and locations.
+
+    Writes reverse_geo_5.json, reverse_geo_4.json and (unless binary is False)
+    reverse_geo.bin into output_dir, ready for DataLoader.from_directory() or for
+    copying over the bundled data. Nothing is written if the input is invalid.
+
+    Args:
+        records: Mappings holding a cell (H3 string or integer, resolution 5 or
+            coarser) under cell_column and the LOCATION_FIELDS. Consumed once,
+            lazily, so it can stream from a large file.
+        output_dir: Directory to write to, created if needed.
+        cell_column: Key holding each record's H3 cell.
+        compact: When True, leave out resolution-5 cells whose complete sibling
+            set shares one location; their parent holds it. Lookups with fallback
+            (the default) still find them, as a "parent" match; lookups with
+            fallback disabled no longer do.
+        binary: When False, write only the JSON files.
+        chunk_size: Cells sorted in memory at once before spilling to disk.
+
+    Returns:
+        Record, duplicate, row, and cell counts of the build.
+
+    Raises:
+        ValueError: If a record has no valid cell, lacks city or state, or gives a
+            cell a different location than an earlier record, or the input is empty.
+        OSError: If a file can't be written.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    start_time = time.perf_counter()
+    attributes = AttributeTable()
+    counters: Counter[str] = Counter()
+    runs = _SortedRuns(chunk_size)
+    try:
+        for number, record in enumerate(records, start=1):
+            counters["records"] += 1
+            code = attributes.intern(_location_row(record, number))
+            for cell in _record_cells(record.get(cell_column), number):
+                runs.add((cell << _CODE_BITS) | code)
+        arrays = _derive_stores(
+            _unique_cells(runs.merged(), attributes, counters), compact, counters
+        )
+    finally:
+        runs.close()
+    if not counters["records"]:
+        raise ValueError("no records to build from")
+    attributes.seal()
+
+    target = Path(output_dir)
+    target.mkdir(parents=True, exist_ok=True)
+    stores = {
+        resolution: CompactStore(cells, codes, attributes)
+        for resolution, (cells, codes) in arrays.items()
+    }
+    json_paths = {
+        resolution: target / f"{DATA_FILE_PREFIX}{resolution}.json" for resolution in stores
+    }
+    for resolution, store in stores.items():
+        write_store_json(json_paths[resolution], store)
+    if binary:
+        # Compiled after the JSON files, so it records their digests and counts as current.
+        write_binary_store(target / BINARY_FILE_NAME, stores, json_paths)
+    return BuildStats(
+        records=counters["records"],
+        duplicates=counters["duplicates"],
+        rows=len(attributes),
+        cells={resolution: len(store) for resolution, store in stores.items()},
+        compacted=counters["compacted"],
+        seconds=time.perf_counter() - start_time,
+    )
@@ -0,0 +1,406 @@
+"""
+Bulk enrichment of large CSV/TSV and Parquet files.
+
+geocode_file() splits the input into chunks of rows, geocodes the chunks on a
+pool of worker processes, and writes the enriched rows in input order. Workers
+parse and format their own chunks, so the parent process only moves bytes and
+throughput grows with the number of cores. The parent loads the stores and
+builds their lookup indexes before starting the pool, so forked workers inherit
+them instead of each building its own, and every worker attaches to the same
+memory-mapped binary store (data/reverse_geo.bin, or its compiled copy in the
+cache directory), whose pages are shared through the OS page cache.
+
+Parquet support needs pyarrow (pip install pyarrow), imported only when a
+Parquet file is processed.
+"""
+
+import csv
+import io
+import itertools
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Deque,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from lakhua.core import default_data_loader, default_geocoder
+from lakhua.types import BatchGeocodeResult, BulkStats, GeocodeOptions
+
+OUTPUT_FIELDS: Tuple[str, ...] = (
+    "city",
+    "state",
+    "district",
+    "pincode",
+    "matched_h3",
+    "matched_resolution",
+    "match_kind",
+)
+"""Columns appended to every input row, in order."""
+
+FILE_FORMATS: Tuple[str, ...] = ("csv", "tsv", "parquet")
+"""Supported values for the file_format argument of geocode_file()."""
+
+_PARQUET_SUFFIXES = (".parquet", ".pq")
+_TSV_SUFFIXES = (".tsv", ".tab")
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+def _detect_format(path: Path, file_format: Optional[str]) -> str:
+    """
+    Internal utility to pick the file format from an explicit value or the file suffix.
+
+    Args:
+        path: Input file path.
+        file_format: Explicit format, or None to infer from the suffix.
+
+    Returns:
+        One of FILE_FORMATS.
+
+    Raises:
+        ValueError: If file_format isn't a supported format.
+    """
+    if file_format is not None:
+        if file_format not in FILE_FORMATS:
+            raise ValueError(f"unknown file format {file_format!r}; expected one of {FILE_FORMATS}")
+        return file_format
+    suffix = path.suffix.lower()
+    if suffix in _PARQUET_SUFFIXES:
+        return "parquet"
+    if suffix in _TSV_SUFFIXES:
+        return "tsv"
+    return "csv"
+
+
+def _parse_coordinate(row: Sequence[str], index: int) -> float:
+    """Read one coordinate cell; blanks and non-numbers become NaN, which never match."""
+    try:
+        return float(row[index])
+    except (IndexError, ValueError):
+        return float("nan")
+
+
+def _output_columns(batch: BatchGeocodeResult) -> List[List[Any]]:
+    """Internal utility to build the OUTPUT_FIELDS columns of a batch result."""
+    return [
+        batch.city,
+        batch.state,
+        batch.district,
+        batch.pincode,
+        batch.matched_h3,
+        batch.matched_resolution,
+        list(batch.match_kind),
+    ]
+
+
+def _warmup(nearest: bool) -> None:
+    """Internal utility to load the stores and build every index a bulk lookup uses."""
+    default_data_loader.warmup(background=False, nearest=nearest).result()
+
+
+def _init_worker(nearest: bool) -> None:
+    """
+    Worker process initializer: have the lookup data ready before the first chunk.
+
+    Forked workers inherit what the parent warmed up, so this finds it all
+    ready; workers started with spawn or forkserver build their own copy here.
+    """
+    _warmup(nearest)
+
+
+def _enrich_text_chunk(
+    chunk: bytes,
+    lat_index: int,
+    lon_index: int,
+    delimiter: str,
+    options: GeocodeOptions,
+) -> Tuple[bytes, int, int]:
+    """
+    Geocode one chunk of delimited text lines (runs in a worker process).
+
+    Args:
+        chunk: UTF-8 bytes of complete input lines.
+        lat_index: Column position of the latitude.
+        lon_index: Column position of the longitude.
+        delimiter: Field delimiter.
+        options: Lookup options.
+
+    Returns:
+        Tuple of (enriched lines as UTF-8 bytes, row count, matched row count).
+    """
+    reader = csv.reader(io.StringIO(chunk.decode("utf-8")), delimiter=delimiter)
+    rows = [row for row in reader if row]
+    batch = default_geocoder.geocode_many(
+        [_parse_coordinate(row, lat_index) for row in rows],
+        [_parse_coordinate(row, lon_index) for row in rows],
+        options,
+    )
+    output = io.StringIO()
+    writer = csv.writer(output, delimiter=delimiter, lineterminator="\n")
+    for row, extra in zip(rows, zip(*_output_columns(batch))):
+        writer.writerow(row + ["" if value is None else value for value in extra])
+    matched = sum(1 for code in batch.codes if code >= 0)
+    return output.getvalue().encode("utf-8"), len(rows), matched
+
+
+def _enrich_arrays(
+    lats: Sequence[float],
+    lons: Sequence[float],
+    options: GeocodeOptions,
+) -> Tuple[List[List[Any]], int]:
+    """
+    Geocode one chunk of coordinate arrays (runs in a worker process).
+
+    Args:
+        lats: Latitudes (list or NumPy array).
+        lons: Longitudes, same length as lats.
+        options: Lookup options.
+
+    Returns:
+        Tuple of (OUTPUT_FIELDS columns, matched row count).
+    """
+    batch = default_geocoder.geocode_many(lats, lons, options)
+    return _output_columns(batch), sum(1 for code in batch.codes if code >= 0)
+
+
+def _line_chunks(stream: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """Internal utility to read complete lines from a binary stream, chunk_size at a time."""
+    while True:
+        lines = list(itertools.islice(stream, chunk_size))
+        if not lines:
+            return
+        if not lines[-1].endswith(b"\n"):
+            lines[-1] += b"\n"
+        yield b"".join(lines)
+
+
+_Task = Tuple[Callable[..., Any], Tuple[Any, ...]]
+
+
+def _run_ordered(
+    tasks: Iterator[_Task],
+    workers: int,
+    sink: Callable[[Any], None],
+    nearest: bool = False,
+) -> None:
+    """
+    Internal utility to run chunk tasks on a process pool and consume results in order.
+
+    At most two tasks per worker are in flight, so memory stays bounded no matter
+    how large the input is. With one worker, tasks run in the calling process.
+
+    Args:
+        tasks: (function, arguments) pairs, one per chunk.
+        workers: Number of worker processes.
+        sink: Called with each task's result, in task order.
+        nearest: Also build the nearest-covered-cell indexes before starting.
+    """
+    if workers <= 1:
+        for function, arguments in tasks:
+            sink(function(*arguments))
+        return
+
+    # Warm up in the parent first: forked workers inherit the mapped stores, the
+    # fallback index and the coverage filters, and a missing binary store gets
+    # compiled once here instead of per worker.
+    _warmup(nearest)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(nearest,)
+    ) as pool:
+        pending: Deque[Future[Any]] = deque()
+        for function, arguments in tasks:
+            pending.append(pool.submit(function, *arguments))
+            if len(pending) >= 2 * workers:
+                sink(pending.popleft().result())
+        while pending:
+            sink(pending.popleft().result())
+
+
+def _column_index(header: Sequence[str], name: str) -> int:
+    try:
+        return list(header).index(name)
+    except ValueError:
+        raise ValueError(f"column {name!r} not found in input header {list(header)}") from None
+
+
+def _geocode_text_file(
+    input_path: Path,
+    output_path: Path,
+    delimiter: str,
+    lat_column: str,
+    lon_column: str,
+    options: GeocodeOptions,
+    workers: int,
+    chunk_size: int,
+) -> Tuple[int, int]:
+    rows = matched = 0
+
+    def write(result: Tuple[bytes, int, int]) -> None:
+        nonlocal rows, matched
+        data, chunk_rows, chunk_matched = result
+        target.write(data)
+        rows += chunk_rows
+        matched += chunk_matched
+
+    with open(input_path, "rb") as source:
+        header_line = source.readline().decode("utf-8-sig")
+        header = next(csv.reader([header_line], delimiter=delimiter), [])
+        lat_index = _column_index(header, lat_column)
+        lon_index = _column_index(header, lon_column)
+
+        header_out = io.StringIO()
+        csv.writer(header_out, delimiter=delimiter, lineterminator="\n").writerow(
+            [*header, *OUTPUT_FIELDS]
+        )
+        tasks = (
+            (_enrich_text_chunk, (chunk, lat_index, lon_index, delimiter, options))
+            for chunk in _line_chunks(source, chunk_size)
+        )
+        with open(output_path, "wb") as target:
+            target.write(header_out.getvalue().encode("utf-8"))
+            _run_ordered(tasks, workers, write, bool(options.nearest_distance))
+    return rows, matched
+
+
+def _import_pyarrow() -> Tuple[Any, Any]:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError(
+            "Parquet support requires pyarrow: pip install 'lakhua[parquet]'"
+        ) from error
+    return pa, pq
+
+
+def _geocode_parquet_file(
+    input_path: Path,
+    output_path: Path,
+    lat_column: str,
+    lon_column: str,
+    options: GeocodeOptions,
+    workers: int,
+    chunk_size: int,
+) -> Tuple[int, int]:
+    pa, pq = _import_pyarrow()
+    source = pq.ParquetFile(input_path)
+    schema = source.schema_arrow
+    _column_index(schema.names, lat_column)
+    _column_index(schema.names, lon_column)
+    output_schema = schema
+    for name, field_type in zip(OUTPUT_FIELDS, (pa.string(),) * 5 + (pa.int8(), pa.string())):
+        output_schema = output_schema.append(pa.field(name, field_type))
+
+    rows = matched = 0
+    batches: Deque[Any] = deque()
+    with pq.ParquetWriter(output_path, output_schema) as writer:
+
+        def write(result: Tuple[List[List[Any]], int]) -> None:
+            nonlocal rows, matched
+            columns, chunk_matched = result
+            batch = batches.popleft()
+            arrays = [
+                *batch.columns,
+                *(
+                    pa.array(column, type=output_schema.field(name).type)
+                    for column, name in zip(columns, OUTPUT_FIELDS)
+                ),
+            ]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=output_schema))
+            rows += batch.num_rows
+            matched += chunk_matched
+
+        def tasks() -> Iterator[_Task]:
+            for batch in source.iter_batches(batch_size=chunk_size):
+                batches.append(batch)
+                lats = batch.column(lat_column).to_numpy(zero_copy_only=False)
+                lons = batch.column(lon_column).to_numpy(zero_copy_only=False)
+                yield _enrich_arrays, (lats, lons, options)
+
+        _run_ordered(tasks(), workers, write, bool(options.nearest_distance))
+    return rows, matched
+
+
+def geocode_file(
+    input_path: PathLike,
+    output_path: PathLike,
+    *,
+    lat_column: str = "lat",
+    lon_column: str = "lon",
+    options: Optional[GeocodeOptions] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 50_000,
+    file_format: Optional[str] = None,
+) -> BulkStats:
+    """
+    Enrich every row of a large CSV/TSV or Parquet file with location columns.
+
+    The output has the input's columns followed by OUTPUT_FIELDS (city, state,
+    district, pincode, matched_h3, matched_resolution, match_kind), in the same
+    row order and the same format as the input. Rows with invalid or unmatched
+    coordinates get empty values. Text inputs must be UTF-8 with a header row and
+    no line breaks inside quoted fields, since chunks are split on lines.
+
+    Args:
+        input_path: File to read. The format is inferred from the suffix
+            (.parquet/.pq, .tsv/.tab, anything else is CSV) unless file_format is set.
+        output_path: File to write (overwritten).
+        lat_column: Name of the latitude column.
+        lon_column: Name of the longitude column.
+        options: Lookup options applied to every row.
+        workers: Worker processes to use. Defaults to the number of CPUs; 1 runs
+            everything in the calling process.
+        chunk_size: Rows per chunk handed to a worker.
+        file_format: Force "csv", "tsv", or "parquet".
+
+    Returns:
+        Row counts, elapsed time, and throughput of the run.
+
+    Raises:
+        ValueError: If a coordinate column is missing, or a setting is invalid.
+        ImportError: If the input is Parquet and pyarrow isn't installed.
+        OSError: If a file can't be read or written.
+
+    Example:
+        >>> from lakhua.bulk import geocode_file
+        >>> stats = geocode_file("pings.csv", "pings_enriched.csv", workers=8)
+        >>> print(f"{stats.rows_per_second:,.0f} rows/sec")
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    worker_count = workers if workers is not None else (os.cpu_count() or 1)
+    if worker_count < 1:
+        raise ValueError(f"workers must be at least 1, got {worker_count}")
+    opts = options or GeocodeOptions()
+    source = Path(input_path)
+    target = Path(output_path)
+    detected = _detect_format(source, file_format)
+
+    start_time = time.perf_counter()
+    if detected == "parquet":
+        rows, matched = _geocode_parquet_file(
+            source, target, lat_column, lon_column, opts, worker_count, chunk_size
+        )
+    else:
+        delimiter = "\t" if detected == "tsv" else ","
+        rows, matched = _geocode_text_file(
+            source, target, delimiter, lat_column, lon_column, opts, worker_count, chunk_size
+        )
+    return BulkStats(
+        rows=rows,
+        matched=matched,
+        seconds=time.perf_counter() - start_time,
+        workers=worker_count,
+    )
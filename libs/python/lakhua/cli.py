@@ -0,0 +1,473 @@
+"""
+Command-line interface for lakhua.
+
+Usage:
+    lakhua enrich [INPUT ...] [-o OUTPUT] [--output-format jsonl|csv] [--stats]
+    lakhua bulk INPUT OUTPUT [--lat-column lat] [--lon-column lon] [--workers N]
+    lakhua build [INPUT ...] -o OUTPUT_DIR [--cell-column h3] [--compact]
+
+enrich streams CSV/TSV/JSONL records from files or stdin (the default, or "-")
+to JSONL or CSV, looking them up chunk by chunk so memory stays bounded. bulk
+processes one large file on all CPU cores. build compiles a table of H3 cells
+and locations into the data files the library loads.
+
+Run ``lakhua --help`` or ``python -m lakhua --help`` for all options.
+"""
+
+import argparse
+import csv
+import io
+import itertools
+import json
+import os
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Sequence, Set, TextIO
+
+from lakhua.bulk import OUTPUT_FIELDS, _output_columns
+from lakhua.core import default_geocoder
+from lakhua.core.constants import DEFAULT_RESOLUTION, MAX_NEAREST_DISTANCE, SUPPORTED_RESOLUTIONS
+from lakhua.types import GeocodeOptions
+
+Record = Dict[str, Any]
+
+_JSONL_SUFFIXES = (".jsonl", ".ndjson")
+_TSV_SUFFIXES = (".tsv", ".tab")
+_PARQUET_SUFFIXES = (".parquet", ".pq")
+
+_WARMUP_LATS = (28.6139, 0.0)
+_WARMUP_LONS = (77.2090, 0.0)
+"""Probe points (one covered, one far outside India) that load everything a lookup may need."""
+
+
+def _add_lookup_arguments(parser: argparse.ArgumentParser) -> None:
+    """Internal utility to add the options shared by every lookup command."""
+    parser.add_argument("--lat-column", default="lat", help="latitude column (default: lat)")
+    parser.add_argument("--lon-column", default="lon", help="longitude column (default: lon)")
+    parser.add_argument(
+        "--resolution",
+        type=int,
+        choices=sorted(SUPPORTED_RESOLUTIONS),
+        default=DEFAULT_RESOLUTION,
+        help=f"H3 resolution to look up (default: {DEFAULT_RESOLUTION})",
+    )
+    parser.add_argument(
+        "--no-fallback",
+        action="store_true",
+        help="don't fall back to coarser resolutions on a miss",
+    )
+    parser.add_argument(
+        "--nearest-distance",
+        type=int,
+        default=0,
+        metavar="K",
+        help=f"match the nearest covered cell up to K rings away (0-{MAX_NEAREST_DISTANCE})",
+    )
+
+
+def _lookup_options(args: argparse.Namespace) -> GeocodeOptions:
+    return GeocodeOptions(
+        resolution=args.resolution,
+        fallback=not args.no_fallback,
+        nearest_distance=args.nearest_distance,
+    )
+
+
+def _input_format(path: str, explicit: Optional[str]) -> str:
+    if explicit is not None:
+        return explicit
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix in _JSONL_SUFFIXES:
+        return "jsonl"
+    if suffix in _TSV_SUFFIXES:
+        return "tsv"
+    if suffix in _PARQUET_SUFFIXES:
+        return "parquet"
+    return "csv"
+
+
+@contextmanager
+def _open_text(path: str) -> Iterator[TextIO]:
+    """Internal utility to open a UTF-8 input file, with "-" meaning stdin."""
+    if path != "-":
+        with open(path, encoding="utf-8-sig", newline="") as handle:
+            yield handle
+        return
+    buffer = getattr(sys.stdin, "buffer", None)
+    if buffer is None:  # stdin replaced by a text stream, e.g. in tests
+        yield sys.stdin
+        return
+    wrapper = io.TextIOWrapper(buffer, encoding="utf-8-sig", newline="")
+    try:
+        yield wrapper
+    finally:
+        wrapper.detach()
+
+
+def _read_records(paths: Sequence[str], explicit_format: Optional[str]) -> Iterator[Record]:
+    """
+    Internal utility to stream records from CSV/TSV/JSONL/Parquet inputs, one file after another.
+
+    Raises:
+        ValueError: If a JSONL line isn't a JSON object, or Parquet is read from stdin.
+        ImportError: If an input is Parquet and pyarrow isn't installed.
+    """
+    for path in paths:
+        file_format = _input_format(path, explicit_format)
+        if file_format == "parquet":
+            if path == "-":
+                raise ValueError("Parquet input must be a file, not stdin")
+            from lakhua.bulk import _import_pyarrow
+
+            _, pq = _import_pyarrow()
+            for batch in pq.ParquetFile(path).iter_batches():
+                yield from batch.to_pylist()
+            continue
+        with _open_text(path) as handle:
+            if file_format == "jsonl":
+                for line_number, line in enumerate(handle, start=1):
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    if not isinstance(record, dict):
+                        raise ValueError(f"{path}:{line_number}: expected a JSON object")
+                    yield record
+            else:
+                delimiter = "\t" if file_format == "tsv" else ","
+                yield from csv.DictReader(handle, delimiter=delimiter)
+
+
+def _coordinate(record: Record, column: str) -> float:
+    """Read one coordinate; missing, blank, and non-numeric values become NaN, which never match."""
+    try:
+        return float(record[column])
+    except (KeyError, TypeError, ValueError):
+        return float("nan")
+
+
+class _RecordWriter:
+    """
+    Writes enriched records as JSONL or CSV, one chunk at a time.
+
+    The CSV header is the input columns seen in the first chunk followed by
+    OUTPUT_FIELDS, so the lakhua columns are always there. A CSV header can't
+    grow once written, so a later record with an input column the header lacks
+    is an error instead of being dropped; JSONL output keeps every record's own
+    fields.
+    """
+
+    def __init__(self, stream: TextIO, output_format: str) -> None:
+        self._stream = stream
+        self._output_format = output_format
+        self._csv: Optional[csv.DictWriter[str]] = None
+        self._fields: Set[Optional[str]] = set()
+
+    def write(self, records: Sequence[Record]) -> None:
+        if self._output_format == "jsonl":
+            for record in records:
+                self._stream.write(json.dumps(record, ensure_ascii=False))
+                self._stream.write("\n")
+            return
+        if self._csv is None:
+            # None holds the values of CSV rows longer than their header; they have no column.
+            input_fields = {
+                field: None
+                for record in records
+                for field in record
+                if field is not None and field not in OUTPUT_FIELDS
+            }
+            fieldnames = [*input_fields, *OUTPUT_FIELDS]
+            self._fields = {None, *fieldnames}
+            self._csv = csv.DictWriter(
+                self._stream,
+                fieldnames=fieldnames,
+                restval="",
+                extrasaction="ignore",
+                lineterminator="\n",
+            )
+            self._csv.writeheader()
+        for record in records:
+            unknown = record.keys() - self._fields
+            if unknown:
+                raise ValueError(
+                    f"column(s) {', '.join(sorted(map(str, unknown)))} first appear after the "
+                    "CSV header was written; raise --chunk-size or write JSONL"
+                )
+            self._csv.writerow(record)
+
+
+class _EnrichStats:
+    """Counters behind the --stats report."""
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.load_seconds = 0.0
+        self.seconds = 0.0  # reading, lookups, and writing; excludes the load
+        self.resolutions: Counter[Optional[int]] = Counter()
+
+    def report(self) -> str:
+        lines = [
+            f"rows: {self.rows:,}",
+            f"load time: {self.load_seconds * 1000:.1f}ms",
+            f"throughput: {self.rows / self.seconds if self.seconds > 0 else 0.0:,.0f} rows/sec "
+            f"({self.seconds:.3f}s excluding load)",
+        ]
+        for resolution in sorted((r for r in self.resolutions if r is not None), reverse=True):
+            lines.append(f"matched at resolution {resolution}: {self._share(resolution)}")
+        lines.append(f"unmatched: {self._share(None)}")
+        return "\n".join(lines)
+
+    def _share(self, resolution: Optional[int]) -> str:
+        count = self.resolutions[resolution]
+        return f"{count:,} ({count / self.rows if self.rows else 0.0:.1%})"
+
+
+def _run_enrich(args: argparse.Namespace) -> int:
+    if args.chunk_size < 1:
+        raise ValueError(f"--chunk-size must be at least 1, got {args.chunk_size}")
+    options = _lookup_options(args)
+    output_format = args.output_format
+    if output_format is None:
+        output_format = "csv" if args.output and args.output.lower().endswith(".csv") else "jsonl"
+    stats = _EnrichStats()
+
+    start_time = time.perf_counter()
+    # Load the data up front so the report can separate load time from lookups.
+    default_geocoder.geocode_many(_WARMUP_LATS, _WARMUP_LONS, options)
+    stats.load_seconds = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    records = _read_records(args.inputs or ["-"], args.input_format)
+    with _open_output(args.output) as stream:
+        writer = _RecordWriter(stream, output_format)
+        while True:
+            chunk = list(itertools.islice(records, args.chunk_size))
+            if not chunk:
+                break
+            batch = default_geocoder.geocode_many(
+                [_coordinate(record, args.lat_column) for record in chunk],
+                [_coordinate(record, args.lon_column) for record in chunk],
+                options,
+            )
+            for record, values in zip(chunk, zip(*_output_columns(batch))):
+                record.update(zip(OUTPUT_FIELDS, values))
+            writer.write(chunk)
+            stream.flush()
+            stats.rows += len(chunk)
+            stats.resolutions.update(batch.matched_resolution)
+
+    stats.seconds = time.perf_counter() - start_time
+    if args.stats:
+        print(stats.report(), file=sys.stderr)
+    return 0
+
+
+@contextmanager
+def _open_output(path: Optional[str]) -> Iterator[TextIO]:
+    """Internal utility to open the output file, or stdout when no path (or "-") is given."""
+    if path is None or path == "-":
+        yield sys.stdout
+        return
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        yield handle
+
+
+def _run_bulk(args: argparse.Namespace) -> int:
+    from lakhua.bulk import geocode_file
+
+    stats = geocode_file(
+        args.input,
+        args.output,
+        lat_column=args.lat_column,
+        lon_column=args.lon_column,
+        options=_lookup_options(args),
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        file_format=args.file_format,
+    )
+    print(
+        f"{stats.rows:,} rows, {stats.matched:,} matched ({stats.match_rate:.1%}) "
+        f"in {stats.seconds:.2f}s with {stats.workers} worker(s): "
+        f"{stats.rows_per_second:,.0f} rows/sec",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def _run_build(args: argparse.Namespace) -> int:
+    from lakhua.build import build_dataset
+
+    stats = build_dataset(
+        _read_records(args.inputs or ["-"], args.input_format),
+        args.output_dir,
+        cell_column=args.cell_column,
+        compact=args.compact,
+        binary=not args.no_binary,
+        chunk_size=args.chunk_size,
+    )
+    cells = ", ".join(
+        f"r{resolution}: {count:,} cells" for resolution, count in sorted(stats.cells.items())
+    )
+    print(
+        f"{stats.records:,} records ({stats.duplicates:,} duplicates), "
+        f"{stats.rows:,} distinct locations -> {cells} "
+        f"({stats.compacted:,} compacted) in {stats.seconds:.2f}s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="lakhua",
+        description="Fast, offline reverse geocoding for India.",
+    )
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    commands.required = True
+
+    enrich = commands.add_parser(
+        "enrich",
+        help="stream CSV/TSV/JSONL records from files or stdin to enriched JSONL/CSV",
+        description=(
+            "Read records from INPUT files (or stdin) and write each one with city, state, "
+            "district, pincode, matched_h3, matched_resolution, and match_kind added. "
+            "Records are looked up in chunks, so memory use doesn't grow with the input."
+        ),
+    )
+    enrich.add_argument(
+        "inputs",
+        nargs="*",
+        metavar="INPUT",
+        help='input files; "-" or none reads stdin',
+    )
+    enrich.add_argument("-o", "--output", help="output file (default: stdout)")
+    _add_lookup_arguments(enrich)
+    enrich.add_argument(
+        "--input-format",
+        choices=["csv", "tsv", "jsonl"],
+        default=None,
+        help="input format (default: from the file suffix; csv for stdin)",
+    )
+    enrich.add_argument(
+        "--output-format",
+        choices=["jsonl", "csv"],
+        default=None,
+        help="output format (default: csv for a .csv output file, otherwise jsonl)",
+    )
+    enrich.add_argument(
+        "--chunk-size",
+        type=int,
+        default=10_000,
+        help="records looked up together (default: 10000)",
+    )
+    enrich.add_argument(
+        "--stats",
+        action="store_true",
+        help="print throughput, hit rate per resolution, and load time to stderr",
+    )
+    enrich.set_defaults(handler=_run_enrich)
+
+    bulk = commands.add_parser(
+        "bulk",
+        help="enrich a large CSV/TSV or Parquet file using all CPU cores",
+        description=(
+            "Append city, state, district, pincode, matched_h3, matched_resolution, "
+            "and match_kind columns to every row of INPUT and write the result to OUTPUT "
+            "in the same order and format."
+        ),
+    )
+    bulk.add_argument("input", help="input file (.csv, .tsv, or .parquet)")
+    bulk.add_argument("output", help="output file (overwritten)")
+    _add_lookup_arguments(bulk)
+    bulk.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="worker processes (default: number of CPUs; 1 runs in-process)",
+    )
+    bulk.add_argument(
+        "--chunk-size",
+        type=int,
+        default=50_000,
+        help="rows per chunk handed to a worker (default: 50000)",
+    )
+    bulk.add_argument(
+        "--format",
+        dest="file_format",
+        choices=["csv", "tsv", "parquet"],
+        default=None,
+        help="input format (default: inferred from the file suffix)",
+    )
+    bulk.set_defaults(handler=_run_bulk)
+
+    build = commands.add_parser(
+        "build",
+        help="build the data files from a table of H3 cells and locations",
+        description=(
+            "Read records with an H3 cell (resolution 5 or coarser) and city, state, and "
+            "optional district and pincode columns, and write minified reverse_geo_5.json "
+            "and reverse_geo_4.json (derived from resolution 5) plus reverse_geo.bin to "
+            "OUTPUT_DIR. Input is sorted in chunks on disk, so memory doesn't grow with it."
+        ),
+    )
+    build.add_argument(
+        "inputs",
+        nargs="*",
+        metavar="INPUT",
+        help='input files (.csv, .tsv, .jsonl, or .parquet); "-" or none reads stdin',
+    )
+    build.add_argument("-o", "--output-dir", required=True, help="directory to write to")
+    build.add_argument("--cell-column", default="h3", help="H3 cell column (default: h3)")
+    build.add_argument(
+        "--input-format",
+        choices=["csv", "tsv", "jsonl", "parquet"],
+        default=None,
+        help="input format (default: from the file suffix; csv for stdin)",
+    )
+    build.add_argument(
+        "--compact",
+        action="store_true",
+        help=(
+            "leave resolution-5 cells whose siblings all share one location to their "
+            "parent (fallback lookups still find them)"
+        ),
+    )
+    build.add_argument(
+        "--no-binary", action="store_true", help="write only the JSON files, not reverse_geo.bin"
+    )
+    build.add_argument(
+        "--chunk-size",
+        type=int,
+        default=500_000,
+        help="cells sorted in memory before spilling to disk (default: 500000)",
+    )
+    build.set_defaults(handler=_run_build)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the lakhua command line.
+
+    Args:
+        argv: Arguments without the program name. Defaults to sys.argv[1:].
+
+    Returns:
+        Process exit code: 0 on success, 1 when the input can't be processed.
+    """
+    parser = _build_parser()
+    args = parser.parse_args(None if argv is None else list(argv))
+    try:
+        exit_code: int = args.handler(args)
+        return exit_code
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head). Point stdout at devnull so
+        # the interpreter's final flush doesn't fail as well, and stop quietly.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(0)
+    except (OSError, ValueError, ImportError) as error:
+        print(f"lakhua {args.command}: error: {error}", file=sys.stderr)
+        return 1
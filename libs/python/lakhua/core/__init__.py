@@ -3,30 +3,86 @@ Internal core modules for lakhua reverse geocoding.
 
 This package contains the implementation details of the geocoding engine.
 Most users should import from the top-level lakhua package instead of
-accessing these modules directly.
+accessing these modules directly. Like the top-level package, the names below
+are imported on first access.
 """
 
-from lakhua.core.constants import (
-    DATA_DIR_NAME,
-    DATA_FILE_PREFIX,
-    DEFAULT_RESOLUTION,
-    MAX_RESOLUTION,
-    MIN_RESOLUTION,
-    SUPPORTED_RESOLUTIONS,
-)
-from lakhua.core.data_loader import DataLoader, default_data_loader
-from lakhua.core.geocoder import ReverseGeocoder, default_geocoder
+import importlib
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from lakhua.core.async_geocoder import AsyncGeocoder, default_async_geocoder
+    from lakhua.core.constants import (
+        DATA_DIR_NAME,
+        DATA_FILE_PREFIX,
+        DEFAULT_RESOLUTION,
+        MAX_NEAREST_DISTANCE,
+        MAX_RESOLUTION,
+        MIN_RESOLUTION,
+        SUPPORTED_RESOLUTIONS,
+    )
+    from lakhua.core.data_loader import DataLoader, DataWatcher, default_data_loader
+    from lakhua.core.geocoder import ReverseGeocoder, default_geocoder
+    from lakhua.core.observer import GeocodeObserver, StatsCollector
+    from lakhua.core.raster import RasterIndex, raster_report
+    from lakhua.core.sources import DataSource
+
+_LAZY_ATTRIBUTES = {
+    "DATA_DIR_NAME": "lakhua.core.constants",
+    "DATA_FILE_PREFIX": "lakhua.core.constants",
+    "DEFAULT_RESOLUTION": "lakhua.core.constants",
+    "MAX_NEAREST_DISTANCE": "lakhua.core.constants",
+    "MAX_RESOLUTION": "lakhua.core.constants",
+    "MIN_RESOLUTION": "lakhua.core.constants",
+    "SUPPORTED_RESOLUTIONS": "lakhua.core.constants",
+    "DataLoader": "lakhua.core.data_loader",
+    "DataWatcher": "lakhua.core.data_loader",
+    "default_data_loader": "lakhua.core.data_loader",
+    "ReverseGeocoder": "lakhua.core.geocoder",
+    "default_geocoder": "lakhua.core.geocoder",
+    "AsyncGeocoder": "lakhua.core.async_geocoder",
+    "default_async_geocoder": "lakhua.core.async_geocoder",
+    "GeocodeObserver": "lakhua.core.observer",
+    "StatsCollector": "lakhua.core.observer",
+    "DataSource": "lakhua.core.sources",
+    "RasterIndex": "lakhua.core.raster",
+    "raster_report": "lakhua.core.raster",
+}
+"""Public name -> module defining it, imported on first access."""
 
 __all__ = [
     "DATA_DIR_NAME",
     "DATA_FILE_PREFIX",
     "DEFAULT_RESOLUTION",
+    "MAX_NEAREST_DISTANCE",
     "MAX_RESOLUTION",
     "MIN_RESOLUTION",
     "SUPPORTED_RESOLUTIONS",
     "DataLoader",
+    "DataWatcher",
     "default_data_loader",
     "ReverseGeocoder",
     "default_geocoder",
+    "AsyncGeocoder",
+    "default_async_geocoder",
+    "GeocodeObserver",
+    "StatsCollector",
+    "DataSource",
+    "RasterIndex",
+    "raster_report",
 ]
 
+
+def __getattr__(name: str) -> object:
+    """Internal hook that imports a public name the first time it's accessed."""
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> "list[str]":
+    """List the package's attributes, including names not imported yet."""
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
@@ -0,0 +1,422 @@
+"""
+Precompiled binary data format for fast, zero-copy store loading.
+
+Parsing the JSON data files dominates cold start. This module writes the same
+data as a single binary file with fixed-width cell keys, attribute codes, a row
+table, and a string pool, and reads it back through mmap: cell and code arrays
+are used in place as memoryviews, and attribute strings are decoded lazily the
+first time a row is returned. Mapped pages are shared across processes by the
+OS page cache.
+
+Layout (little-endian):
+
+    header      magic, format version, counts, offsets of the tables below
+    sections    per resolution: resolution, cell count, cell/code offsets, and
+                size, mtime, and digest of the JSON file it was compiled from
+    strings     (n_strings + 1) uint32 offsets into the string pool
+    rows        n_rows x 4 uint32 string IDs (city, state, district, pincode)
+    cells       per section, sorted uint64 H3 cell IDs (8-byte aligned)
+    codes       per section, uint32 attribute code per cell
+    pool        UTF-8 bytes of every distinct string
+
+You typically don't need to use this module directly; the DataLoader picks the
+binary file up automatically and falls back to JSON when it's missing or stale.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union, cast, overload
+
+from lakhua.core.store import AttributeTable, CompactStore
+from lakhua.types import LocationRow
+
+BINARY_MAGIC: bytes = b"LKHUABIN"
+"""Magic bytes identifying a lakhua binary store file."""
+
+BINARY_FORMAT_VERSION: int = 1
+"""Version of the binary layout. Files with another version are treated as stale."""
+
+_HEADER = struct.Struct("<8sIIIIQQQ")
+_SECTION = struct.Struct("<IIQQQQ16s")
+_NO_STRING = 0xFFFFFFFF
+_DIGEST_SIZE = 16
+
+
+def source_digest(path: Path) -> bytes:
+    """
+    Compute the digest recorded for a JSON source file.
+
+    The binary file stores this digest per resolution, so a changed JSON file is
+    detected even when its size and timestamps look unchanged.
+
+    Args:
+        path: Path to the JSON data file.
+
+    Returns:
+        First 16 bytes of the SHA-256 digest of the file contents.
+    """
+    with open(path, "rb") as f:
+        return bytes_digest(f.read())
+
+
+def bytes_digest(data: bytes) -> bytes:
+    """
+    Compute the digest source_digest() records, for data already in memory.
+
+    Args:
+        data: Raw source bytes, exactly as stored (compressed or not).
+
+    Returns:
+        First 16 bytes of the SHA-256 digest of data.
+    """
+    return hashlib.sha256(data).digest()[:_DIGEST_SIZE]
+
+
+def _align(offset: int, alignment: int = 8) -> int:
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def write_binary_store(
+    path: Path,
+    stores: Mapping[int, CompactStore],
+    sources: Mapping[int, Union[Path, bytes]],
+) -> None:
+    """
+    Write loaded stores to a binary store file.
+
+    All stores must share one AttributeTable. The file is written to a temporary
+    path first and moved into place, so concurrent readers never see a partial file.
+
+    Args:
+        path: Destination file path.
+        stores: Compact store per resolution.
+        sources: JSON file each store was loaded from, recorded for staleness checks,
+            or the source_digest() of data that didn't come from a file (its
+            size and modification time are then recorded as zero).
+
+    Raises:
+        ValueError: If the stores don't share a single attribute table.
+        OSError: If the file can't be written.
+    """
+    tables = {id(store.attributes): store.attributes for store in stores.values()}
+    if len(tables) > 1:
+        raise ValueError("stores must share one attribute table to be compiled together")
+    table: Sequence[LocationRow] = next(iter(tables.values())) if tables else AttributeTable()
+
+    strings: List[bytes] = []
+    string_ids: Dict[str, int] = {}
+    row_ids: List[int] = []
+    for row in table:
+        for value in row:
+            if value is None:
+                row_ids.append(_NO_STRING)
+                continue
+            string_id = string_ids.get(value)
+            if string_id is None:
+                string_id = string_ids[value] = len(strings)
+                strings.append(value.encode("utf-8"))
+            row_ids.append(string_id)
+
+    string_offsets = [0]
+    for encoded in strings:
+        string_offsets.append(string_offsets[-1] + len(encoded))
+
+    resolutions = sorted(stores)
+    strings_offset = _align(_HEADER.size + _SECTION.size * len(resolutions))
+    rows_offset = strings_offset + 4 * len(string_offsets)
+    offset = _align(rows_offset + 4 * len(row_ids))
+    layout: List[Tuple[int, int, int]] = []
+    for resolution in resolutions:
+        count = len(stores[resolution])
+        cells_offset = offset
+        codes_offset = cells_offset + 8 * count
+        offset = _align(codes_offset + 4 * count)
+        layout.append((resolution, cells_offset, codes_offset))
+    pool_offset = offset
+
+    buffer = bytearray(pool_offset + string_offsets[-1])
+    _HEADER.pack_into(
+        buffer,
+        0,
+        BINARY_MAGIC,
+        BINARY_FORMAT_VERSION,
+        len(resolutions),
+        len(table),
+        len(strings),
+        strings_offset,
+        rows_offset,
+        pool_offset,
+    )
+    for index, (resolution, cells_offset, codes_offset) in enumerate(layout):
+        store = stores[resolution]
+        source = sources[resolution]
+        if isinstance(source, bytes):
+            size, mtime_ns, digest = 0, 0, source
+        else:
+            source_stat = source.stat()
+            size, mtime_ns = source_stat.st_size, source_stat.st_mtime_ns
+            digest = source_digest(source)
+        _SECTION.pack_into(
+            buffer,
+            _HEADER.size + index * _SECTION.size,
+            resolution,
+            len(store),
+            cells_offset,
+            codes_offset,
+            size,
+            mtime_ns,
+            digest,
+        )
+        struct.pack_into(f"<{len(store)}Q", buffer, cells_offset, *store.cells)
+        struct.pack_into(f"<{len(store)}I", buffer, codes_offset, *store.codes)
+    struct.pack_into(f"<{len(string_offsets)}I", buffer, strings_offset, *string_offsets)
+    struct.pack_into(f"<{len(row_ids)}I", buffer, rows_offset, *row_ids)
+    buffer[pool_offset:] = b"".join(strings)
+
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(buffer)
+        os.replace(temp_path, path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+class MappedAttributeTable(AttributeTable):
+    """
+    Attribute table backed by the row table and string pool of a mapped file.
+
+    Rows are decoded on first access and cached, and each distinct string is
+    decoded only once, so a process only pays for the locations it returns.
+    """
+
+    __slots__ = ("_row_ids", "_string_offsets", "_pool", "_decoded_strings", "_count")
+
+    def __init__(
+        self,
+        row_ids: memoryview,
+        string_offsets: memoryview,
+        pool: memoryview,
+    ) -> None:
+        super().__init__()
+        self._row_ids = row_ids
+        self._string_offsets = string_offsets
+        self._pool = pool
+        self._count = len(row_ids) // 4
+        self._decoded_strings: List[Optional[str]] = [None] * (len(string_offsets) - 1)
+        self._rows = cast(List[LocationRow], [None] * self._count)
+        self._codes = None
+        self._strings = None
+
+    def _string(self, string_id: int) -> Optional[str]:
+        if string_id == _NO_STRING:
+            return None
+        value = self._decoded_strings[string_id]
+        if value is None:
+            start = self._string_offsets[string_id]
+            end = self._string_offsets[string_id + 1]
+            value = self._decoded_strings[string_id] = str(self._pool[start:end], "utf-8")
+        return value
+
+    def _row(self, code: int) -> LocationRow:
+        row = self._rows[code]
+        if row is None:
+            base = code * 4
+            ids = self._row_ids
+            row = self._rows[code] = (
+                self._string(ids[base]) or "",
+                self._string(ids[base + 1]) or "",
+                self._string(ids[base + 2]),
+                self._string(ids[base + 3]),
+            )
+        return row
+
+    def materialize(self) -> None:
+        for code in range(self._count):
+            self._row(code)
+
+    def intern(self, row: LocationRow) -> int:
+        self.materialize()
+        code = super().intern(row)
+        # New rows live only in memory, past the mapped ones.
+        self._count = len(self._rows)
+        return code
+
+    def column(self, field: str) -> Tuple[List[Optional[str]], "array[int]"]:
+        self.materialize()
+        return super().column(field)
+
+    def _rebuild_indexes(self) -> None:
+        self.materialize()
+        super()._rebuild_indexes()
+
+    @overload
+    def __getitem__(self, code: int) -> LocationRow: ...
+
+    @overload
+    def __getitem__(self, code: slice) -> Sequence[LocationRow]: ...
+
+    def __getitem__(self, code: "int | slice") -> "LocationRow | Sequence[LocationRow]":
+        if isinstance(code, slice):
+            return [self._row(index) for index in range(*code.indices(self._count))]
+        if code < 0:
+            code += self._count
+        return self._row(code)
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class BinaryStoreFile:
+    """
+    A memory-mapped binary store file.
+
+    Opening the file only validates the header; resolution stores are views into
+    the mapping and are created on demand by store().
+    """
+
+    __slots__ = ("_mapping", "_view", "_sections", "_attributes")
+
+    def __init__(self, mapping: Union[mmap.mmap, bytes]) -> None:
+        """
+        Validate and wrap a mapped binary store file.
+
+        Args:
+            mapping: mmap (or bytes) holding the whole file.
+
+        Raises:
+            ValueError: If the data isn't a valid binary store of this format version.
+        """
+        view = memoryview(mapping)
+        if len(view) < _HEADER.size:
+            raise ValueError("binary store is truncated")
+        (
+            magic,
+            version,
+            section_count,
+            row_count,
+            string_count,
+            strings_offset,
+            rows_offset,
+            pool_offset,
+        ) = _HEADER.unpack_from(view, 0)
+        if magic != BINARY_MAGIC:
+            raise ValueError("not a lakhua binary store")
+        if version != BINARY_FORMAT_VERSION:
+            raise ValueError(f"unsupported binary store version {version}")
+
+        sections: Dict[int, Tuple[int, int, int, int, int, bytes]] = {}
+        for index in range(section_count):
+            resolution, count, cells_offset, codes_offset, *source = _SECTION.unpack_from(
+                view, _HEADER.size + index * _SECTION.size
+            )
+            if codes_offset + 4 * count > len(view):
+                raise ValueError(f"binary store section r{resolution} is truncated")
+            sections[resolution] = (count, cells_offset, codes_offset, *source)
+
+        string_offsets = view[strings_offset : strings_offset + 4 * (string_count + 1)].cast("I")
+        row_ids = view[rows_offset : rows_offset + 16 * row_count].cast("I")
+        if len(row_ids) != 4 * row_count or pool_offset + string_offsets[-1] > len(view):
+            raise ValueError("binary store attribute tables are truncated")
+
+        self._mapping = mapping
+        self._view = view
+        self._sections = sections
+        self._attributes = MappedAttributeTable(row_ids, string_offsets, view[pool_offset:])
+
+    @classmethod
+    def open(cls, path: Path) -> "BinaryStoreFile":
+        """
+        Memory-map a binary store file read-only.
+
+        Args:
+            path: Path to the binary store file.
+
+        Returns:
+            The opened file.
+
+        Raises:
+            OSError: If the file can't be opened or mapped.
+            ValueError: If the file isn't a valid binary store, or this platform
+                isn't little-endian.
+        """
+        if sys.byteorder != "little":
+            raise ValueError("binary stores are only read in place on little-endian platforms")
+        with open(path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapping)
+
+    @property
+    def attributes(self) -> AttributeTable:
+        """Attribute table shared by every resolution in the file."""
+        return self._attributes
+
+    @property
+    def resolutions(self) -> Tuple[int, ...]:
+        """Resolutions present in the file."""
+        return tuple(sorted(self._sections))
+
+    def is_current(self, resolution: int, source: Path) -> bool:
+        """
+        Check that a resolution was compiled from the given JSON file as it is now.
+
+        The file's size and content digest are compared. Timestamps aren't: they
+        change when files are copied (e.g. on installation) and can stay the
+        same when contents change.
+
+        Args:
+            resolution: H3 resolution to check.
+            source: JSON file the resolution should have been compiled from.
+
+        Returns:
+            True when the section exists and matches the source file.
+
+        Raises:
+            OSError: If the source file can't be read.
+        """
+        section = self._sections.get(resolution)
+        if section is None:
+            return False
+        _, _, _, size, _, digest = section
+        if size and source.stat().st_size != size:
+            return False
+        return source_digest(source) == digest
+
+    def source_digest(self, resolution: int) -> bytes:
+        """
+        Return the digest of the JSON file a resolution was compiled from.
+
+        Args:
+            resolution: H3 resolution present in the file.
+
+        Returns:
+            The digest source_digest() computed for that JSON file at compile time.
+
+        Raises:
+            KeyError: If the resolution isn't in the file.
+        """
+        return self._sections[resolution][5]
+
+    def store(self, resolution: int) -> CompactStore:
+        """
+        Return the store for a resolution as zero-copy views into the mapping.
+
+        Args:
+            resolution: H3 resolution present in the file.
+
+        Returns:
+            CompactStore whose cell and code arrays point into the mapped file.
+
+        Raises:
+            KeyError: If the resolution isn't in the file.
+        """
+        count, cells_offset, codes_offset, *_ = self._sections[resolution]
+        cells = self._view[cells_offset : cells_offset + 8 * count].cast("Q")
+        codes = self._view[codes_offset : codes_offset + 4 * count].cast("I")
+        return CompactStore(cells, codes, self._attributes)
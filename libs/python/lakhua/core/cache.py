@@ -0,0 +1,170 @@
+"""
+Coordinate-keyed cache for lakhua reverse geocoding.
+
+Real traffic is usually skewed: a few thousand hot locations make up most calls.
+This module caches geocode() results keyed on latitude/longitude quantized to a
+configurable number of decimal places, so repeated lookups skip the H3
+conversion and store search entirely. It's opt-in via
+ReverseGeocoder.enable_coordinate_cache(); you typically don't use it directly.
+"""
+
+import threading
+from collections import OrderedDict
+from math import floor
+from typing import Optional, Set, Tuple
+
+from lakhua.types import CacheStats, GeocodeResult
+
+CacheKey = Tuple[int, int, int, bool, int]
+"""Cache key: (quantized lat, quantized lon, resolution, fallback, nearest distance)."""
+
+
+class CoordinateCache:
+    """
+    Bounded, thread-safe cache of geocode() results keyed on quantized coordinates.
+
+    Points that quantize to the same key share one cached result, so the precision
+    sets the trade-off between hit rate and exactness: 5 decimal places is about
+    1.1 m, 4 is about 11 m. A point within that distance of a cell boundary may get
+    the neighbouring cell's result. Misses (None results) are cached too.
+
+    Hits take no lock and only flag the entry as used; when the cache is full,
+    inserting evicts the oldest entry not used since it was last considered
+    (second-chance LRU). Under concurrent use the hit and miss counters are
+    approximate.
+
+    The owning geocoder registers invalidate() with the DataLoader, which calls
+    it when the data changes (e.g. after clear_store_cache()), so lookups never
+    compare data generations.
+    """
+
+    __slots__ = (
+        "_entries",
+        "_used",
+        "_lock",
+        "_generation",
+        "_scale",
+        "max_size",
+        "precision",
+        "hits",
+        "misses",
+        "evictions",
+        "__weakref__",
+    )
+
+    def __init__(self, max_size: int = 10_000, precision: int = 5) -> None:
+        """
+        Create an empty cache.
+
+        Args:
+            max_size: Maximum number of cached coordinates before evicting one
+                that wasn't used recently.
+            precision: Decimal places latitude/longitude are quantized to for keys.
+
+        Raises:
+            ValueError: If max_size is less than 1 or precision is negative.
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        if precision < 0:
+            raise ValueError(f"precision must be non-negative, got {precision}")
+        self._entries: OrderedDict[CacheKey, Optional[GeocodeResult]] = OrderedDict()
+        self._used: Set[CacheKey] = set()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._scale = 10.0**precision
+        self.max_size = max_size
+        self.precision = precision
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(
+        self,
+        lat: float,
+        lon: float,
+        resolution: int,
+        fallback: bool,
+        nearest_distance: int = 0,
+    ) -> CacheKey:
+        """Build the cache key for a lookup (coordinates floored to precision places)."""
+        # floor, not int(): truncating toward zero would make the bucket around 0 twice as wide.
+        scale = self._scale
+        return (floor(lat * scale), floor(lon * scale), resolution, fallback, nearest_distance)
+
+    def get(self, key: CacheKey) -> Tuple[bool, Optional[GeocodeResult]]:
+        """
+        Look up a key and flag it as recently used.
+
+        Args:
+            key: Key from key().
+
+        Returns:
+            Tuple of (found, result). result may be None for a cached miss.
+        """
+        try:
+            result = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        self._used.add(key)
+        return True, result
+
+    def put(self, key: CacheKey, result: Optional[GeocodeResult], generation: int) -> None:
+        """
+        Store a result, evicting an entry that wasn't used recently when full.
+
+        Args:
+            key: Key from key().
+            result: Lookup result to cache (None for no match).
+            generation: Data generation the result was computed against; results
+                from before the last invalidate() are dropped.
+        """
+        with self._lock:
+            if generation != self._generation:
+                return
+            entries = self._entries
+            used = self._used
+            if key not in entries:
+                while len(entries) >= self.max_size:
+                    oldest, oldest_result = entries.popitem(last=False)
+                    if oldest in used:
+                        # Used since it was last considered: give it a second chance.
+                        used.discard(oldest)
+                        entries[oldest] = oldest_result
+                    else:
+                        self.evictions += 1
+            entries[key] = result
+
+    def invalidate(self, generation: int) -> None:
+        """
+        Drop every entry because the data changed to a newer generation.
+
+        Older generations than the one already seen are ignored.
+
+        Args:
+            generation: New data generation of the DataLoader.
+        """
+        with self._lock:
+            if generation > self._generation:
+                self._generation = generation
+                self._entries.clear()
+                self._used.clear()
+
+    def clear(self) -> None:
+        """Drop every cached entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._used.clear()
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                size=len(self._entries),
+                max_size=self.max_size,
+            )
@@ -6,9 +6,8 @@ You typically don't need to import these directly unless you're building custom
 geocoding logic or need to understand the library's resolution constraints.
 """
 
-import json
 from pathlib import Path
-from typing import Dict, cast
+from typing import Dict
 
 # Resolution configuration
 MIN_RESOLUTION: int = 4
@@ -35,6 +34,14 @@ Set to resolution 5 for city-level accuracy by default. You can override this by
 passing GeocodeOptions(resolution=4) to geocode().
 """
 
+MAX_NEAREST_DISTANCE: int = 10
+"""
+Largest H3 grid distance searched by the nearest-covered-cell fallback.
+
+GeocodeOptions.nearest_distance is capped at this value. At resolution 5, ten
+rings reach roughly 80-90 km from the input cell.
+"""
+
 SUPPORTED_RESOLUTIONS: tuple[int, ...] = (4, 5)
 """
 H3 resolutions preloaded into memory when the library initializes.
@@ -50,6 +57,14 @@ DATA_DIR_NAME: str = "data"
 DATA_FILE_PREFIX: str = "reverse_geo_"
 """Filename prefix for data files. Full names follow the pattern: reverse_geo_{resolution}.json"""
 
+BINARY_FILE_NAME: str = "reverse_geo.bin"
+"""
+Filename of the precompiled binary store that sits next to the JSON data files.
+
+It holds every supported resolution and is memory-mapped instead of parsed. When
+it's missing or out of date with the JSON files, the library falls back to JSON.
+"""
+
 
 def get_data_file_path(resolution: int) -> Path:
     """
@@ -68,24 +83,45 @@ def get_data_file_path(resolution: int) -> Path:
     return current_dir.parent / DATA_DIR_NAME / f"{DATA_FILE_PREFIX}{resolution}.json"
 
 
+def get_binary_file_path() -> Path:
+    """
+    Internal utility to locate the precompiled binary store file.
+
+    You don't need to call this directly. The DataLoader checks this file first
+    and only parses the JSON data files when it's missing or stale.
+
+    Returns:
+        Path to the binary store file in the package data directory.
+    """
+    return Path(__file__).parent.parent / DATA_DIR_NAME / BINARY_FILE_NAME
+
+
 def read_reverse_geo_store(resolution: int) -> Dict[str, Dict[str, str]]:
     """
-    Internal utility to load and parse geographic data for a resolution.
+    Internal utility to load, parse, and validate geographic data for a resolution.
 
     You don't need to call this directly. The DataLoader uses it automatically
-    when loading data into memory. Returns an empty dictionary if the data file
-    doesn't exist, allowing the library to gracefully handle missing data.
+    when loading data into memory and the binary store can't be used. A missing
+    or corrupt data file raises instead of loading as empty data, which would
+    make every lookup miss.
 
     Args:
         resolution: H3 resolution level (4 or 5).
 
     Returns:
         Dictionary mapping H3 cell IDs to location metadata (city, state, etc.).
+
+    Raises:
+        FileNotFoundError: If the data file doesn't exist.
+        ValueError: If the data file is corrupt or isn't valid data for the resolution.
     """
     file_path = get_data_file_path(resolution)
     if not file_path.exists():
-        return {}
+        raise FileNotFoundError(
+            f"lakhua data file for resolution {resolution} not found: {file_path}"
+        )
 
-    with open(file_path, encoding="utf-8") as f:
-        return cast(Dict[str, Dict[str, str]], json.load(f))
+    # Only needed without the binary store, so kept off the import path.
+    from lakhua.core.sources import parse_store
 
+    return parse_store(file_path.read_bytes(), resolution, str(file_path))
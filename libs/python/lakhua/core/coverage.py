@@ -0,0 +1,214 @@
+"""
+Coarse coverage bitmap for rejecting out-of-coverage coordinates early.
+
+Much real traffic can't match at all: (0, 0) from devices without a fix, roaming
+devices abroad, points at sea. This module marks, on a coarse latitude/longitude
+grid, every box that any covered cell reaches into. A point in an unmarked box
+(or outside the bounding box of the marked ones) can't match, so geocode() and
+the batch lookups answer it without converting it to H3. The filter is
+conservative: a marked box may still miss, but an unmarked one never matches.
+The DataLoader builds it along with the data; you typically don't use it directly.
+"""
+
+import math
+from typing import Iterable, List, Set, Tuple
+
+import h3.api.basic_int as h3_int
+
+from lakhua.core.h3_bits import cell_resolution, cell_to_parent
+
+COVERAGE_STEP = 0.25
+"""Grid step of the coverage bitmap in degrees (about 28 km of latitude)."""
+
+# Cell edges bow slightly away from the straight line between their vertices;
+# at resolutions 4 and 5 by well under this margin (about 1 km).
+_MARGIN_DEGREES = 0.01
+
+# Cells with a vertex this close to a pole may contain it.
+_POLAR_LATITUDE = 85.0
+
+# Cells are boxed through their parent at this resolution (themselves, at this
+# resolution), which takes one boundary per parent instead of one per cell.
+_PARENT_RESOLUTION = 4
+
+# Resolution-5 cells reach at most 0.032 degrees of latitude (and as many degrees
+# of longitude at the equator) past their resolution-4 parent's bounding box,
+# measured over every parent below 80 degrees of latitude.
+_CHILD_OVERHANG_DEGREES = 0.04
+
+_Box = Tuple[float, float, float, float]
+
+
+def _cell_box(cell: int, overhang: float = 0.0) -> _Box:
+    """
+    Internal utility returning a cell's padded (min lat, max lat, min lon, max lon).
+
+    overhang widens the box by that many degrees of latitude, and by the same
+    distance in longitude, to take in the cell's children.
+    """
+    lats, lons = zip(*h3_int.cell_to_boundary(cell))
+    lat_pad = _MARGIN_DEGREES + overhang
+    min_lat, max_lat = min(lats) - lat_pad, max(lats) + lat_pad
+    # Degrees of longitude shrink away from the equator, so the same distance takes more.
+    widest = min(max(abs(min_lat), abs(max_lat)), _POLAR_LATITUDE)
+    lon_pad = _MARGIN_DEGREES + overhang / math.cos(math.radians(widest))
+    min_lon, max_lon = min(lons) - lon_pad, max(lons) + lon_pad
+    if max_lat > _POLAR_LATITUDE or min_lat < -_POLAR_LATITUDE or max_lon - min_lon > 180:
+        # May contain a pole or cross the antimeridian: take every longitude.
+        min_lon, max_lon = -180.0, 180.0
+        if max_lat > _POLAR_LATITUDE:
+            max_lat = 90.0
+        if min_lat < -_POLAR_LATITUDE:
+            min_lat = -90.0
+    return max(min_lat, -90.0), min(max_lat, 90.0), max(min_lon, -180.0), min(max_lon, 180.0)
+
+
+class CoverageFilter:
+    """
+    Bounding box plus coarse bitmap of where a set of cells can match.
+
+    Built from the cells a lookup can match (e.g. the fallback index's cells at
+    resolution 5, or one store's cells). The grid is aligned to (-90, -180) and
+    takes one byte per box within the bounding box: about 14 KB for data
+    covering India.
+    """
+
+    __slots__ = (
+        "min_lat",
+        "max_lat",
+        "min_lon",
+        "max_lon",
+        "_first_row",
+        "_first_col",
+        "_cols",
+        "_bitmap",
+        "_inverse_step",
+    )
+
+    def __init__(self, cells: Iterable[int], step: float = COVERAGE_STEP) -> None:
+        """
+        Mark the grid boxes a set of cells reaches into.
+
+        Cells at resolutions 4 and 5 are marked through their resolution-4
+        parents, widened to take in those parents' resolution-5 children, so
+        building takes one cell boundary per parent. The filter of a
+        resolution-4 store therefore also covers the children a fallback lookup
+        resolves through it.
+
+        Args:
+            cells: Integer H3 cell IDs lookups can match.
+            step: Grid step in degrees.
+        """
+        inverse_step = 1.0 / step
+        boxes: List[_Box] = []
+        parents: Set[int] = set()
+        add_parent = parents.add
+        for cell in cells:
+            if cell_resolution(cell) >= _PARENT_RESOLUTION:
+                add_parent(cell_to_parent(cell, _PARENT_RESOLUTION))
+            else:
+                boxes.append(_cell_box(cell))
+        boxes.extend(_cell_box(parent, _CHILD_OVERHANG_DEGREES) for parent in parents)
+        # Cells sharing grid boxes are common, so each distinct span is marked once.
+        spans = {
+            (
+                math.floor((min_lat + 90.0) * inverse_step),
+                math.floor((max_lat + 90.0) * inverse_step),
+                math.floor((min_lon + 180.0) * inverse_step),
+                math.floor((max_lon + 180.0) * inverse_step),
+            )
+            for min_lat, max_lat, min_lon, max_lon in boxes
+        }
+        self._inverse_step = inverse_step
+        if not boxes:
+            # An inverted box: nothing is inside.
+            self.min_lat = self.min_lon = 0.0
+            self.max_lat = self.max_lon = -1.0
+            self._first_row = self._first_col = self._cols = 0
+            self._bitmap = bytearray()
+            return
+        self.min_lat = min(box[0] for box in boxes)
+        self.max_lat = max(box[1] for box in boxes)
+        self.min_lon = min(box[2] for box in boxes)
+        self.max_lon = max(box[3] for box in boxes)
+        self._first_row = min(span[0] for span in spans)
+        self._first_col = min(span[2] for span in spans)
+        rows = max(span[1] for span in spans) - self._first_row + 1
+        self._cols = max(span[3] for span in spans) - self._first_col + 1
+        self._bitmap = bytearray(rows * self._cols)
+        for first_row, last_row, first_col, last_col in spans:
+            width = last_col - first_col + 1
+            for row in range(first_row - self._first_row, last_row - self._first_row + 1):
+                start = row * self._cols + first_col - self._first_col
+                self._bitmap[start : start + width] = b"\x01" * width
+
+    @classmethod
+    def union(cls, filters: Iterable["CoverageFilter"]) -> "CoverageFilter":
+        """
+        Combine filters into one that covers whatever any of them covers.
+
+        Takes a few bitwise ORs per grid row instead of any cell boundaries, e.g.
+        to cover the fallback index's cells from the filters of its two stores.
+
+        Args:
+            filters: Filters built with the same step.
+
+        Returns:
+            Filter over the same grid, empty when no filter covers anything.
+
+        Raises:
+            ValueError: If the filters use different steps.
+        """
+        filters = list(filters)
+        steps = {coverage._inverse_step for coverage in filters}
+        if len(steps) > 1:
+            raise ValueError("filters with different steps can't be combined")
+        combined = cls((), 1.0 / steps.pop() if steps else COVERAGE_STEP)
+        filters = [coverage for coverage in filters if coverage._bitmap]
+        if not filters:
+            return combined
+        combined.min_lat = min(coverage.min_lat for coverage in filters)
+        combined.max_lat = max(coverage.max_lat for coverage in filters)
+        combined.min_lon = min(coverage.min_lon for coverage in filters)
+        combined.max_lon = max(coverage.max_lon for coverage in filters)
+        first_row = combined._first_row = min(coverage._first_row for coverage in filters)
+        first_col = combined._first_col = min(coverage._first_col for coverage in filters)
+        last_row = max(
+            coverage._first_row + len(coverage._bitmap) // coverage._cols for coverage in filters
+        )
+        cols = combined._cols = (
+            max(coverage._first_col + coverage._cols for coverage in filters) - first_col
+        )
+        bitmap = combined._bitmap = bytearray((last_row - first_row) * cols)
+        for coverage in filters:
+            width = coverage._cols
+            offset = (coverage._first_row - first_row) * cols + coverage._first_col - first_col
+            for start in range(0, len(coverage._bitmap), width):
+                target = offset + start // width * cols
+                row = int.from_bytes(coverage._bitmap[start : start + width], "big")
+                row |= int.from_bytes(bitmap[target : target + width], "big")
+                bitmap[target : target + width] = row.to_bytes(width, "big")
+        return combined
+
+    def covers(self, lat: float, lon: float) -> bool:
+        """
+        Check whether valid coordinates could match any of the cells.
+
+        Args:
+            lat: Latitude in decimal degrees.
+            lon: Longitude in decimal degrees.
+
+        Returns:
+            False when the point certainly matches nothing; True when it may match.
+        """
+        if self.min_lat <= lat <= self.max_lat and self.min_lon <= lon <= self.max_lon:
+            # The same arithmetic as marking, so points in the bounding box stay on the grid.
+            row = int((lat + 90.0) * self._inverse_step) - self._first_row
+            col = int((lon + 180.0) * self._inverse_step) - self._first_col
+            return self._bitmap[row * self._cols + col] != 0
+        return False
+
+    @property
+    def covered_share(self) -> float:
+        """Fraction of the grid boxes within the bounding box that are marked (0.0 when empty)."""
+        return self._bitmap.count(1) / len(self._bitmap) if self._bitmap else 0.0
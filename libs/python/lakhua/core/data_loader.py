@@ -2,15 +2,199 @@
 Data loading infrastructure for lakhua reverse geocoding.
 
 This module handles loading geographic data from disk into memory. The library
-automatically loads data once when you first call geocode() or geocode_h3(),
-so you typically don't need to interact with this module directly.
+automatically loads each resolution once, the first time a lookup needs it, so
+you typically don't need to interact with this module directly. To serve other
+data than the bundled files, create a loader with DataLoader.from_directory()
+or DataLoader.from_source().
 """
 
+import gc
+import hashlib
+import os
+import threading
 import time
-from typing import Dict, Optional
+import weakref
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from lakhua.core.constants import SUPPORTED_RESOLUTIONS, read_reverse_geo_store
-from lakhua.types import ReverseGeoStore
+from lakhua.core.binary_store import (
+    BinaryStoreFile,
+    bytes_digest,
+    source_digest,
+    write_binary_store,
+)
+from lakhua.core.constants import (
+    MAX_NEAREST_DISTANCE,
+    MAX_RESOLUTION,
+    MIN_RESOLUTION,
+    SUPPORTED_RESOLUTIONS,
+    get_binary_file_path,
+    get_data_file_path,
+    read_reverse_geo_store,
+)
+from lakhua.core.coverage import CoverageFilter
+from lakhua.core.fallback_index import FallbackIndex
+from lakhua.core.gap_index import GapFillIndex
+from lakhua.core.sources import DataSource, default_cache_dir, parse_store
+from lakhua.core.store import AttributeTable, CompactStore
+from lakhua.types import LoadEvent, LoadKind, MatchKind, ReverseGeoStore
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from lakhua.core.observer import GeocodeObserver
+
+_EMPTY_STORE = CompactStore.from_mapping({})
+
+
+def _dataset_version(digests: Mapping[int, bytes]) -> str:
+    """
+    Internal utility to derive a dataset version from per-resolution source digests.
+
+    Args:
+        digests: Digest of each resolution's JSON source file.
+
+    Returns:
+        16 hex characters identifying the data; equal data gives an equal version.
+    """
+    hasher = hashlib.sha256()
+    for resolution in sorted(digests):
+        hasher.update(resolution.to_bytes(1, "little") + digests[resolution])
+    return hasher.hexdigest()[:16]
+
+
+def _source_version(binary: Optional[BinaryStoreFile]) -> str:
+    """
+    Internal utility returning the dataset version of the data being loaded.
+
+    Args:
+        binary: The binary store in use, whose sections record their source
+            digests, or None to hash the JSON files on disk.
+    """
+    digests: Dict[int, bytes] = {}
+    for resolution in SUPPORTED_RESOLUTIONS:
+        if binary is not None:
+            digests[resolution] = binary.source_digest(resolution)
+        else:
+            path = get_data_file_path(resolution)
+            digests[resolution] = source_digest(path) if path.exists() else b""
+    return _dataset_version(digests)
+
+
+def _json_digests() -> Dict[int, bytes]:
+    """Internal utility returning the digest of every bundled JSON data file that exists."""
+    digests: Dict[int, bytes] = {}
+    for resolution in SUPPORTED_RESOLUTIONS:
+        path = get_data_file_path(resolution)
+        if path.exists():
+            digests[resolution] = source_digest(path)
+    return digests
+
+
+def _compiled_cache_path(digests: Mapping[int, bytes]) -> Path:
+    """Internal utility returning where the compiled copy of the bundled JSON files is cached."""
+    return default_cache_dir() / f"reverse_geo-{_dataset_version(digests)}.bin"
+
+
+def _data_files_signature(paths: Iterable[Path]) -> Tuple[Optional[Tuple[int, int]], ...]:
+    """Internal utility returning (size, mtime) of every data file, None where missing."""
+    signature: List[Optional[Tuple[int, int]]] = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            signature.append(None)
+        else:
+            signature.append((stat.st_size, stat.st_mtime_ns))
+    return tuple(signature)
+
+
+class _LoadedData(NamedTuple):
+    """Internal bundle of the stores read for every resolution, before any index is built."""
+
+    stores: Dict[int, CompactStore]
+    attributes: AttributeTable
+    binary: Optional[BinaryStoreFile]
+    version: str
+
+
+class _Dataset(NamedTuple):
+    """Internal bundle of everything reload() builds before swapping it in."""
+
+    stores: Dict[int, CompactStore]
+    attributes: AttributeTable
+    binary: Optional[BinaryStoreFile]
+    version: str
+    fallback_index: FallbackIndex
+    gap_indexes: Dict[int, GapFillIndex]
+
+
+class DataWatcher:
+    """
+    Background thread that reloads the data when the data files change.
+
+    Returned by DataLoader.watch(). The files are polled (size and modification
+    time), so it works on any filesystem, including mounted config volumes.
+    """
+
+    def __init__(
+        self,
+        loader: "DataLoader",
+        interval: float,
+        on_reload: Optional[Callable[[str], None]],
+    ) -> None:
+        self._loader = loader
+        self._interval = interval
+        self._on_reload = on_reload
+        self._stop = threading.Event()
+        self.last_error: Optional[BaseException] = None
+        """The error from the most recent failed reload, cleared by the next success."""
+        self._paths = loader._watched_paths()
+        self._signature = _data_files_signature(self._paths)
+        self._thread = threading.Thread(target=self._run, name="lakhua-watch", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Internal polling loop."""
+        while not self._stop.wait(self._interval):
+            if _data_files_signature(self._paths) == self._signature:
+                continue
+            try:
+                version = self._loader.reload(background=False).result()
+                if self._on_reload is not None:
+                    self._on_reload(version)
+            except Exception as error:  # keep serving the old data and keep watching
+                self.last_error = error
+            else:
+                self.last_error = None
+            # Re-read after the reload, which may have recompiled the binary store.
+            self._signature = _data_files_signature(self._paths)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop watching; a reload already in progress still completes.
+
+        Args:
+            timeout: Seconds to wait for the thread to exit, or None to wait until it does.
+        """
+        self._stop.set()
+        self._thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        """True until stop() is called."""
+        return not self._stop.is_set()
 
 
 class DataLoader:
@@ -22,13 +206,26 @@ class DataLoader:
     class yourself — the library provides a default instance that's used automatically.
 
     For most use cases, simply call geocode() or geocode_h3() and the data loading
-    happens transparently in the background.
+    happens transparently in the background. To serve your own data files, build a
+    separate loader with from_directory() or from_source() and pass it to
+    ReverseGeocoder.from_loader().
     """
 
     _instance: Optional["DataLoader"] = None
-    _stores: Dict[int, ReverseGeoStore]
-    _is_loaded: bool
-    _test_override: Optional[Dict[int, ReverseGeoStore]]
+    _stores: Dict[int, CompactStore]
+    _attributes: AttributeTable
+    _binary: Optional[BinaryStoreFile]
+    _binary_checked: bool
+    _fallback_index: Optional[FallbackIndex]
+    _gap_indexes: Dict[int, GapFillIndex]
+    _lock: threading.Lock
+    _generation: int
+    _generation_callbacks: List["weakref.WeakMethod[Callable[[int], None]]"]
+    _test_override: Optional[Dict[int, CompactStore]]
+    _observer: Optional["GeocodeObserver"]
+    _version: Optional[str]
+    _reload_lock: threading.Lock
+    _source: Optional[DataSource]
 
     def __new__(cls) -> "DataLoader":
         """
@@ -39,11 +236,87 @@ class DataLoader:
         """
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._stores = {}
-            cls._instance._is_loaded = False
-            cls._instance._test_override = None
+            cls._instance._initialize(None)
         return cls._instance
 
+    def _initialize(self, source: Optional[DataSource]) -> None:
+        """Internal method that sets up an empty loader reading source (None: bundled data)."""
+        self._stores = {}
+        self._attributes = AttributeTable()
+        self._binary = None
+        self._binary_checked = False
+        self._fallback_index = None
+        self._gap_indexes = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._generation_callbacks = []
+        self._test_override = None
+        self._observer = None
+        self._version = None
+        self._reload_lock = threading.Lock()
+        self._source = source
+
+    @classmethod
+    def from_source(cls, source: DataSource) -> "DataLoader":
+        """
+        Create a loader serving data from a DataSource instead of the bundled files.
+
+        The loader is independent of the shared one: it has its own stores,
+        indexes, and observer, and the top-level functions keep using the bundled
+        data. Nothing is read until the first lookup (or preload()); then every
+        resolution is loaded at once. The data is validated as it's parsed, and a
+        compiled copy is written to the source's cache directory under a name
+        derived from the file digests, so the next process loading the same
+        files memory-maps it instead of parsing JSON.
+
+        Args:
+            source: Data files to serve.
+
+        Returns:
+            A new loader; wrap it with ReverseGeocoder.from_loader() to look up against it.
+        """
+        loader = super().__new__(cls)
+        loader._initialize(source)
+        return loader
+
+    @classmethod
+    def from_directory(
+        cls,
+        directory: Union[str, "os.PathLike[str]"],
+        *,
+        cache_dir: Optional[Union[str, "os.PathLike[str]"]] = None,
+        cache: bool = True,
+    ) -> "DataLoader":
+        """
+        Create a loader serving the data files in a directory.
+
+        Shorthand for from_source(DataSource.from_directory(...)). The directory
+        holds reverse_geo_4 and reverse_geo_5 files, each .json, .json.gz, or .json.zst.
+
+        Args:
+            directory: Directory holding the data files.
+            cache_dir: Directory for compiled copies of the data; defaults to
+                $LAKHUA_CACHE_DIR, else lakhua under $XDG_CACHE_HOME or ~/.cache.
+            cache: When False, always parse the files and never write a cache.
+
+        Returns:
+            A new, independent loader.
+
+        Raises:
+            FileNotFoundError: If a resolution has no data file in directory.
+
+        Example:
+            >>> loader = DataLoader.from_directory("/srv/geo")
+            >>> geocoder = ReverseGeocoder.from_loader(loader)
+        """
+        source = DataSource.from_directory(directory, cache_dir=cache_dir, cache=cache)
+        return cls.from_source(source)
+
+    @property
+    def source(self) -> Optional[DataSource]:
+        """The DataSource this loader reads, or None for the bundled data files."""
+        return self._source
+
     @classmethod
     def get_instance(cls) -> "DataLoader":
         """
@@ -57,57 +330,553 @@ class DataLoader:
         """
         return cls()
 
-    def _load_all_stores_once(self, debug: bool = False) -> None:
+    def _load_store_once(self, resolution: int, debug: bool = False) -> None:
         """
-        Internal method that loads geographic data into memory on first use.
+        Internal method that loads one resolution into memory on first use.
+
+        Each resolution is loaded independently the first time a lookup needs it,
+        so a process that only ever queries resolution 4 never reads the
+        resolution-5 data. Subsequent calls reuse the in-memory store.
+
+        Loading is single-flight: when several threads need the same resolution at
+        once, one of them loads it while the others wait and then reuse the result.
+        The loaded store is published by swapping in a new stores dictionary, so
+        readers never observe a partially updated one.
+
+        Args:
+            resolution: H3 resolution level to load.
+            debug: When True, prints timing information showing how long data loading took.
+        """
+        if resolution in self._stores or resolution not in SUPPORTED_RESOLUTIONS:
+            return
+
+        with self._lock:
+            if resolution in self._stores:
+                return
+            self._load_store_locked(resolution, debug)
 
-        This happens automatically the first time you call geocode() or geocode_h3().
-        Subsequent calls reuse the in-memory data for fast lookups.
+    def _load_store_locked(self, resolution: int, debug: bool) -> None:
+        """
+        Internal method that loads one resolution while holding the loader lock.
 
         Args:
+            resolution: H3 resolution level to load.
             debug: When True, prints timing information showing how long data loading took.
         """
-        if self._is_loaded:
+        if self._source is not None:
+            # A source is compiled or cached as a whole, so load every resolution now.
+            data = self._read_dataset(debug)
+            for store in data.stores.values():
+                _ = store.coverage  # built before publishing, so lookups never build it
+            self._attributes = data.attributes
+            self._binary = data.binary
+            self._binary_checked = True
+            self._version = data.version
+            self._stores = data.stores
             return
 
         start_time = time.perf_counter()
-        for resolution in SUPPORTED_RESOLUTIONS:
-            self._stores[resolution] = read_reverse_geo_store(resolution)
-        self._is_loaded = True
+        binary = self._open_binary_once(debug)
+        if binary is not None:
+            store = binary.store(resolution)
+            source = "binary"
+        else:
+            store = CompactStore.from_mapping(read_reverse_geo_store(resolution), self._attributes)
+            self._attributes.seal()
+            source = "json"
+        _ = store.coverage  # built before publishing, so lookups never build it
+        if self._version is None:
+            self._version = _source_version(binary)
+        self._stores = {**self._stores, resolution: store}
+        elapsed = time.perf_counter() - start_time
 
         if debug:
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            print(f"[lakhua][debug] loaded all stores into memory in {elapsed_ms:.3f}ms")
+            label = "binary store" if binary is not None else "JSON"
+            print(
+                f"[lakhua][debug] loaded store r{resolution} into memory from {label} "
+                f"in {elapsed * 1000:.3f}ms"
+            )
+        self._notify_load("store", resolution, source, elapsed, len(store))
+
+        if binary is None and all(loaded in self._stores for loaded in SUPPORTED_RESOLUTIONS):
+            self._compile_binary_stores(self._stores, debug)
+
+    def _notify_load(
+        self, kind: LoadKind, resolution: int, source: str, seconds: float, cells: int
+    ) -> None:
+        """Internal helper that reports a load to the installed observer, if any."""
+        observer = self._observer
+        if observer is not None:
+            observer.on_load(LoadEvent(kind, resolution, source, seconds, cells))
+
+    def set_observer(self, observer: Optional["GeocodeObserver"]) -> None:
+        """
+        Report store loads and index builds to an observer.
+
+        ReverseGeocoder.set_observer() calls this for you; call it directly only
+        to watch a loader that isn't behind the default geocoder.
+
+        Args:
+            observer: Receives a LoadEvent after each load, or None to stop reporting.
+        """
+        self._observer = observer
+
+    def _open_binary_once(self, debug: bool = False) -> Optional[BinaryStoreFile]:
+        """
+        Internal method that memory-maps the precompiled binary store, if usable.
+
+        The file is checked once per cache lifetime. It's used only when it contains
+        every supported resolution and each section was compiled from the JSON file
+        currently on disk; otherwise all resolutions are parsed from JSON, so every
+        store shares one attribute table either way.
+
+        Args:
+            debug: When True, prints why the binary store was skipped.
+
+        Returns:
+            The mapped binary store, or None to fall back to JSON.
+        """
+        if self._binary_checked:
+            return self._binary
+        self._binary_checked = True
+
+        binary = self._open_binary(debug)
+        if binary is not None:
+            self._binary = binary
+            self._attributes = binary.attributes
+        return binary
+
+    def _open_binary(self, debug: bool = False) -> Optional[BinaryStoreFile]:
+        """
+        Internal method that maps a binary store if it's complete and current.
+
+        Tries the binary store shipped with the package, then the copy
+        _compile_binary_stores() left in the cache directory. Either must have
+        been compiled from JSON files with the same content digests as those on
+        disk; timestamps aren't trusted.
+
+        Args:
+            debug: When True, prints why a binary store was skipped.
+
+        Returns:
+            The mapped binary store, or None to fall back to JSON.
+        """
+        digests = _json_digests()
+        binary = self._open_bundled(digests, debug)
+        if binary is None and len(digests) == len(SUPPORTED_RESOLUTIONS):
+            binary = self._open_cache(_compiled_cache_path(digests), digests, debug)
+        return binary
+
+    @staticmethod
+    def _open_bundled(digests: Mapping[int, bytes], debug: bool) -> Optional[BinaryStoreFile]:
+        """
+        Internal method that maps the binary store shipped with the package, if current.
+
+        Args:
+            digests: Digest of each bundled JSON file that exists; resolutions
+                without one are trusted to the binary store alone.
+            debug: When True, prints why the binary store was skipped.
+
+        Returns:
+            The mapped binary store, or None when it's missing, incomplete or stale.
+        """
+        binary_path = get_binary_file_path()
+        if not binary_path.exists():
+            return None
+        try:
+            binary = BinaryStoreFile.open(binary_path)
+            for resolution in SUPPORTED_RESOLUTIONS:
+                if resolution not in binary.resolutions or (
+                    resolution in digests
+                    and binary.source_digest(resolution) != digests[resolution]
+                ):
+                    if debug:
+                        print(f"[lakhua][debug] binary store is stale for r{resolution}")
+                    return None
+        except (OSError, ValueError) as error:
+            if debug:
+                print(f"[lakhua][debug] binary store unusable: {error}")
+            return None
+        return binary
 
-    def load_resolution_store(self, resolution: int, debug: bool = False) -> ReverseGeoStore:
+    def _compile_binary_stores(
+        self, stores: Mapping[int, CompactStore], debug: bool = False
+    ) -> None:
+        """
+        Internal method that writes the loaded stores as a binary store file.
+
+        Runs after a JSON load so later processes can memory-map the data instead
+        of parsing it. The file goes to the per-user cache directory (see
+        default_cache_dir()), named after the JSON files' digests, never into
+        the installed package. Failures (e.g. an unwritable cache) are ignored.
+
+        Args:
+            stores: Store per resolution, all sharing one attribute table.
+            debug: When True, prints whether the binary store was written.
+        """
+        json_paths = {resolution: get_data_file_path(resolution) for resolution in stores}
+        if not all(path.exists() for path in json_paths.values()):
+            return
+        digests = {resolution: source_digest(path) for resolution, path in json_paths.items()}
+        cache_path = _compiled_cache_path(digests)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_binary_store(cache_path, stores, digests)
+        except OSError as error:
+            if debug:
+                print(f"[lakhua][debug] could not write binary store: {error}")
+            return
+        if debug:
+            print(f"[lakhua][debug] wrote binary store {cache_path}")
+
+    def load_resolution_store(self, resolution: int, debug: bool = False) -> CompactStore:
         """
         Get geographic data for a specific H3 resolution.
 
-        This method loads data from disk into memory on first call, then returns
-        cached data on subsequent calls. You typically don't call this directly —
-        the ReverseGeocoder uses it internally during lookups.
+        This method loads that resolution from disk into memory on first call, then
+        returns cached data on subsequent calls; other resolutions aren't loaded.
+        You typically don't call this directly — the ReverseGeocoder uses it
+        internally during lookups.
 
         Args:
             resolution: H3 resolution level (4 or 5).
             debug: When True, prints timing information for data access.
 
         Returns:
-            Dictionary mapping H3 cell IDs to location information (city, state, etc.).
+            Compact store of H3 cells and location information (city, state, etc.).
+            It still supports dict-style reads such as store.get(h3_index).
         """
         if self._test_override and resolution in self._test_override:
             if debug:
                 print(f"[lakhua][debug] using test override store for r{resolution}")
             return self._test_override[resolution]
 
-        self._load_all_stores_once(debug)
+        self._load_store_once(resolution, debug)
 
+        if not debug:
+            return self._stores.get(resolution, _EMPTY_STORE)
         start_time = time.perf_counter()
-        store = self._stores.get(resolution, {})
-        if debug:
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            print(f"[lakhua][debug] fetched in-memory store r{resolution} in {elapsed_ms:.3f}ms")
+        store = self._stores.get(resolution, _EMPTY_STORE)
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        print(f"[lakhua][debug] fetched in-memory store r{resolution} in {elapsed_ms:.3f}ms")
         return store
 
+    def load_fallback_index(self, debug: bool = False) -> FallbackIndex:
+        """
+        Get the table that resolves resolution-5 cells straight to their final match.
+
+        The index folds the resolution-4 parent into every resolution-5 cell it
+        covers, so a lookup with fallback enabled needs a single search instead of
+        one per resolution. It's built from the loaded stores on first call (a few
+        milliseconds) and rebuilt after the data changes.
+
+        Args:
+            debug: When True, prints timing information for loading and building.
+
+        Returns:
+            Fallback index over the current stores.
+        """
+        index = self._fallback_index
+        if index is not None:
+            return index
+
+        generation = self._generation
+        fine = self.load_resolution_store(MAX_RESOLUTION, debug)
+        coarse = self.load_resolution_store(MIN_RESOLUTION, debug)
+        start_time = time.perf_counter()
+        index = FallbackIndex(fine, MAX_RESOLUTION, coarse, MIN_RESOLUTION)
+        if not self._test_override:
+            # Built before publishing, so lookups never build it. Test stores may
+            # hold made-up cells that have no boundary, so theirs is built on use.
+            _ = index.coverage
+        elapsed = time.perf_counter() - start_time
+        if debug:
+            print(
+                f"[lakhua][debug] built fallback index of {len(index)} cells "
+                f"in {elapsed * 1000:.3f}ms"
+            )
+        self._notify_load("fallback_index", MAX_RESOLUTION, "built", elapsed, len(index))
+
+        # Publish only if the data didn't change while building, so a concurrent
+        # clear_store_cache() never has a stale index cached over the new data.
+        with self._lock:
+            if self._generation == generation:
+                self._fallback_index = index
+        return index
+
+    def load_coverage_filter(
+        self, resolution: int, fallback: bool = True, debug: bool = False
+    ) -> CoverageFilter:
+        """
+        Get the coarse bitmap of where coordinate lookups can match.
+
+        Points the filter doesn't cover match nothing at this resolution, so
+        lookups answer them without an H3 conversion. With fallback at
+        resolution 5 it covers every cell the fallback index resolves; otherwise
+        the cells of that resolution's store. Built along with that store or
+        index (a few milliseconds), so lookups never build it, and rebuilt with
+        them after the data changes.
+
+        Args:
+            resolution: Supported H3 resolution of the lookups.
+            fallback: Whether the lookups fall back to parent cells.
+            debug: When True, prints timing information for loading.
+
+        Returns:
+            Coverage filter for lookups at this resolution.
+        """
+        if fallback and resolution == MAX_RESOLUTION:
+            return self.load_fallback_index(debug).coverage
+        return self.load_resolution_store(resolution, debug).coverage
+
+    def load_gap_index(self, resolution: int, debug: bool = False) -> GapFillIndex:
+        """
+        Get the nearest-covered-cell index for a resolution.
+
+        Maps every uncovered cell within MAX_NEAREST_DISTANCE rings of the data to
+        its nearest covered cell. At resolution 5, covered means resolvable with
+        parent fallback. Built on first call (well under a second) and rebuilt
+        after the data changes; only lookups with nearest_distance > 0 need it.
+
+        Args:
+            resolution: H3 resolution (4 or 5).
+            debug: When True, prints timing information for loading and building.
+
+        Returns:
+            Gap-fill index over the current data at that resolution.
+        """
+        index = self._gap_indexes.get(resolution)
+        if index is not None:
+            return index
+
+        generation = self._generation
+        if resolution == MAX_RESOLUTION:
+            covered = self.load_fallback_index(debug).cells
+        else:
+            covered = self.load_resolution_store(resolution, debug).cells
+        start_time = time.perf_counter()
+        index = GapFillIndex(covered, MAX_NEAREST_DISTANCE)
+        elapsed = time.perf_counter() - start_time
+        if debug:
+            print(
+                f"[lakhua][debug] built gap-fill index r{resolution} of {len(index)} cells "
+                f"in {elapsed * 1000:.3f}ms"
+            )
+        self._notify_load("gap_index", resolution, "built", elapsed, len(index))
+
+        with self._lock:
+            if self._generation == generation:
+                self._gap_indexes = {**self._gap_indexes, resolution: index}
+        return index
+
+    def preload(
+        self,
+        resolutions: Iterable[int] = SUPPORTED_RESOLUTIONS,
+        debug: bool = False,
+    ) -> None:
+        """
+        Load the given resolutions now instead of on the first lookup.
+
+        Use this at startup to declare which resolutions your process needs, e.g.
+        preload((4,)) for a service that only does coarse lookups. Resolutions not
+        listed are still loaded lazily if a lookup ever needs them.
+
+        Args:
+            resolutions: H3 resolutions to load. Defaults to all supported resolutions.
+            debug: When True, prints timing information for data loading.
+        """
+        for resolution in resolutions:
+            self._load_store_once(resolution, debug)
+
+    def warmup(
+        self,
+        resolutions: Iterable[int] = SUPPORTED_RESOLUTIONS,
+        background: bool = True,
+        *,
+        nearest: bool = False,
+        debug: bool = False,
+    ) -> "Future[None]":
+        """
+        Load stores and their lookup indexes ahead of the first request.
+
+        Unlike preload(), this also builds the fallback index that resolution-5
+        lookups with fallback use (when both resolutions are requested), and by
+        default runs on a background daemon thread so startup isn't blocked.
+        Lookups made meanwhile are correct; they simply wait for, or share, the
+        load in progress. Pair it with is_ready() in a readiness probe.
+
+        Args:
+            resolutions: H3 resolutions to load. Defaults to all supported resolutions.
+            background: When True, load on a background thread and return at once;
+                when False, load before returning.
+            nearest: Also build the nearest-covered-cell indexes, for services
+                that set GeocodeOptions.nearest_distance.
+            debug: When True, prints timing information for loading and building.
+
+        Returns:
+            Future that completes when loading is done, or holds the exception
+            that stopped it. In asyncio code, await asyncio.wrap_future(future).
+        """
+        from concurrent.futures import Future
+
+        requested = tuple(resolutions)
+        future: Future[None] = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                self.preload(requested, debug)
+                for resolution in requested:
+                    self.load_coverage_filter(resolution, fallback=False, debug=debug)
+                if MAX_RESOLUTION in requested and MIN_RESOLUTION in requested:
+                    self.load_coverage_filter(MAX_RESOLUTION, debug=debug)
+                if nearest:
+                    for resolution in requested:
+                        self.load_gap_index(resolution, debug)
+            except BaseException as error:
+                future.set_exception(error)
+            else:
+                future.set_result(None)
+
+        if background:
+            threading.Thread(target=run, name="lakhua-warmup", daemon=True).start()
+        else:
+            run()
+        return future
+
+    def freeze(self, *, nearest: bool = False, debug: bool = False) -> None:
+        """
+        Prepare this process's data to be shared with forked worker processes.
+
+        For pre-fork servers (e.g. gunicorn with preload_app, or a
+        multiprocessing pool using fork): call it in the parent right before
+        forking. It loads every resolution and the fallback index, decodes all
+        attribute rows, and prebuilds every cell's shared result, so workers
+        use the parent's objects instead of each building their own copy. It
+        then runs a full collection and moves every tracked object into the
+        garbage collector's permanent generation (gc.freeze()), so collections
+        in the workers don't write to the pages holding the parent's objects.
+
+        This reduces copy-on-write, it doesn't prevent it: every lookup that
+        returns a shared GeocodeResult (or one of its strings) still updates
+        that object's reference count, which copies its page into the worker.
+        What stays shared is everything lookups don't hand out, such as the
+        flat store arrays (or the read-only memory mapping) they search, and
+        objects never returned. tests/test_freeze.py measures the difference
+        as less private memory (USS) per worker, not none.
+
+        Calling it again is harmless. Memory allocated after freezing is
+        collected normally; gc.unfreeze() undoes the last step.
+
+        Args:
+            nearest: Also build the nearest-covered-cell indexes and results,
+                for workers that set GeocodeOptions.nearest_distance.
+            debug: When True, prints timing information for loading and building.
+        """
+        self.warmup(SUPPORTED_RESOLUTIONS, background=False, nearest=nearest, debug=debug).result()
+        self._attributes.materialize()
+        for resolution, store in self._stores.items():
+            # The finest store is never reached through a parent.
+            kinds: List[MatchKind] = (
+                ["exact"] if resolution == MAX_RESOLUTION else ["exact", "parent"]
+            )
+            store.prebuild_results(resolution, [*kinds, "nearest"] if nearest else kinds)
+
+        gc.collect()
+        gc.freeze()
+
+    def is_ready(self, resolutions: Iterable[int] = SUPPORTED_RESOLUTIONS) -> bool:
+        """
+        Check whether lookups at the given resolutions are served from memory.
+
+        True once each resolution is loaded and, when both resolutions are
+        requested, the fallback index is built; i.e. once warmup() with the
+        same resolutions has finished. Cheap enough for a health endpoint. It
+        turns False again after clear_store_cache().
+
+        Args:
+            resolutions: H3 resolutions lookups will use. Defaults to all supported resolutions.
+
+        Returns:
+            True when no lookup at these resolutions will touch the disk or build an index.
+        """
+        requested = tuple(resolutions)
+        if not all(self.is_loaded(resolution) for resolution in requested):
+            return False
+        if MAX_RESOLUTION in requested and MIN_RESOLUTION in requested:
+            return self._fallback_index is not None
+        return True
+
+    def is_loaded(self, resolution: int) -> bool:
+        """
+        Check whether a resolution is already loaded into memory.
+
+        Args:
+            resolution: H3 resolution level.
+
+        Returns:
+            True when lookups at this resolution won't touch the disk.
+        """
+        return resolution in self._stores
+
+    @property
+    def generation(self) -> int:
+        """
+        Counter that changes whenever the data served by this loader may change.
+
+        It's bumped by clear_store_cache(), set_stores_for_testing() and reload().
+        Caches built on top of lookups (like the coordinate cache and lookup
+        indexes) compare it to know when their entries are out of date.
+        """
+        return self._generation
+
+    def _watch_generation(self, callback: Callable[[int], None]) -> None:
+        """
+        Internal method that calls a bound method with every new generation.
+
+        The callback is called once right away with the current generation, then
+        after every change, so hot paths built on the data (the coordinate cache)
+        don't need to compare generations on every lookup. It's held weakly, so
+        watching doesn't keep its object alive.
+
+        Args:
+            callback: Bound method taking the new generation; it may be called
+                with an older generation than it already saw, and should ignore it.
+        """
+        with self._lock:
+            self._generation_callbacks = [
+                ref for ref in self._generation_callbacks if ref() is not None
+            ]
+            self._generation_callbacks.append(weakref.WeakMethod(callback))
+        callback(self._generation)
+
+    def _advance_generation(self) -> None:
+        """Internal method that bumps the generation and tells the watching callbacks."""
+        self._generation += 1
+        generation = self._generation
+        for ref in list(self._generation_callbacks):
+            callback = ref()
+            if callback is not None:
+                callback(generation)
+
+    def load_attribute_table(self, debug: bool = False) -> AttributeTable:
+        """
+        Get the shared table of distinct (city, state, district, pincode) rows.
+
+        Every loaded resolution stores its cells as integer codes into this one
+        table, and geocode_many() returns the same codes. Use it to work with
+        category codes instead of strings, e.g. to group results by location.
+
+        Args:
+            debug: When True, prints timing information for data loading.
+
+        Returns:
+            Attribute table shared by all resolution stores.
+        """
+        self.preload(SUPPORTED_RESOLUTIONS, debug)
+        return self._attributes
+
     def set_stores_for_testing(self, stores: Optional[Dict[int, ReverseGeoStore]]) -> None:
         """
         Override data with custom test data (for testing purposes only).
@@ -118,7 +887,18 @@ class DataLoader:
         Args:
             stores: Dictionary mapping resolution numbers to test data, or None to clear overrides.
         """
-        self._test_override = stores
+        self._advance_generation()
+        self._fallback_index = None
+        self._gap_indexes = {}
+        if stores is None:
+            self._test_override = None
+            return
+        attributes = AttributeTable()
+        self._test_override = {
+            resolution: CompactStore.from_mapping(store, attributes)
+            for resolution, store in stores.items()
+        }
+        attributes.seal()
 
     def clear_store_cache(self) -> None:
         """
@@ -127,9 +907,310 @@ class DataLoader:
         Clears the in-memory cache, causing the next geocode() call to reload
         data from disk. Useful if you've updated data files and want to pick up
         changes without restarting your application.
+
+        Safe to call while other threads are geocoding: it waits for any load in
+        progress, and lookups already holding a store finish against it. The next
+        lookups pay for loading the data again, though; use reload() to swap in
+        new data without that stall.
+        """
+        with self._lock:
+            self._advance_generation()
+            self._stores = {}
+            self._attributes = AttributeTable()
+            self._binary = None
+            self._binary_checked = False
+            self._fallback_index = None
+            self._gap_indexes = {}
+            self._version = None
+
+    @property
+    def dataset_version(self) -> Optional[str]:
+        """
+        Checksum identifying the data currently served, or None before the first load.
+
+        Derived from the contents of the data files the data was built from
+        (recorded in the binary store when it's used), so every process serving
+        the same data reports the same value. Test overrides aren't reflected.
+        """
+        return self._version
+
+    def _read_dataset(self, debug: bool) -> _LoadedData:
+        """
+        Internal method that reads every resolution without publishing anything.
+
+        Bundled data comes from the binary store when it's current, else from
+        JSON (compiling the binary store afterwards). A DataSource is read from
+        its cache when a compiled copy of the same file contents exists, else
+        parsed, validated, and cached.
+
+        Args:
+            debug: When True, prints where the data came from.
+
+        Returns:
+            Stores sharing one sealed attribute table, the binary store they map
+            (if any), and the dataset version.
+
+        Raises:
+            FileNotFoundError: If a data file is missing.
+            ValueError: If a data file is corrupt or fails validation.
+        """
+        if self._source is not None:
+            return self._read_source(self._source, debug)
+
+        binary = self._open_binary(debug)
+        attributes = binary.attributes if binary is not None else AttributeTable()
+        version = _source_version(binary)
+        stores: Dict[int, CompactStore] = {}
+        for resolution in SUPPORTED_RESOLUTIONS:
+            start_time = time.perf_counter()
+            if binary is not None:
+                stores[resolution] = binary.store(resolution)
+            else:
+                stores[resolution] = CompactStore.from_mapping(
+                    read_reverse_geo_store(resolution), attributes
+                )
+            self._notify_load(
+                "store",
+                resolution,
+                "binary" if binary is not None else "json",
+                time.perf_counter() - start_time,
+                len(stores[resolution]),
+            )
+        attributes.seal()
+        if binary is None:
+            self._compile_binary_stores(stores, debug)
+        return _LoadedData(stores, attributes, binary, version)
+
+    def _read_source(self, source: DataSource, debug: bool) -> _LoadedData:
+        """
+        Internal method that reads a DataSource through its compiled cache.
+
+        Args:
+            source: Data files to read.
+            debug: When True, prints whether the cache was used or written.
+
+        Returns:
+            Every resolution's store and the dataset version.
+        """
+        start_time = time.perf_counter()
+        raw = {resolution: source.read(resolution) for resolution in SUPPORTED_RESOLUTIONS}
+        digests = {resolution: bytes_digest(contents) for resolution, contents in raw.items()}
+        version = _dataset_version(digests)
+        cache_dir = source.cache_dir
+        cache_path = cache_dir / f"reverse_geo-{version}.bin" if cache_dir is not None else None
+
+        binary = self._open_cache(cache_path, digests, debug) if cache_path is not None else None
+        if binary is not None:
+            attributes = binary.attributes
+            stores = {resolution: binary.store(resolution) for resolution in SUPPORTED_RESOLUTIONS}
+        else:
+            attributes = AttributeTable()
+            stores = {
+                resolution: CompactStore.from_mapping(
+                    parse_store(raw[resolution], resolution, source.name(resolution)), attributes
+                )
+                for resolution in SUPPORTED_RESOLUTIONS
+            }
+            attributes.seal()
+        elapsed = time.perf_counter() - start_time
+        if debug:
+            label = f"cache {cache_path}" if binary is not None else "parsed source files"
+            print(
+                f"[lakhua][debug] loaded dataset {version} from {label} in {elapsed * 1000:.3f}ms"
+            )
+        for resolution, store in stores.items():
+            # One read covers every resolution; each event reports the whole load time.
+            self._notify_load(
+                "store", resolution, "binary" if binary is not None else "json", elapsed, len(store)
+            )
+
+        if binary is None and cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                write_binary_store(cache_path, stores, digests)
+            except OSError as error:
+                if debug:
+                    print(f"[lakhua][debug] could not write data cache: {error}")
+            else:
+                if debug:
+                    print(f"[lakhua][debug] wrote data cache {cache_path}")
+        return _LoadedData(stores, attributes, binary, version)
+
+    @staticmethod
+    def _open_cache(
+        path: Path, digests: Mapping[int, bytes], debug: bool
+    ) -> Optional[BinaryStoreFile]:
+        """
+        Internal method that maps a cached compiled copy if it matches the source digests.
+
+        Args:
+            path: Cache file for this dataset version.
+            digests: Digest of each resolution's source file.
+            debug: When True, prints why a cache file was rejected.
+
+        Returns:
+            The mapped cache, or None to parse the source instead.
+        """
+        if not path.exists():
+            return None
+        try:
+            binary = BinaryStoreFile.open(path)
+            if binary.resolutions != tuple(sorted(digests)) or any(
+                binary.source_digest(resolution) != digest for resolution, digest in digests.items()
+            ):
+                raise ValueError("compiled from other source files")
+        except (OSError, ValueError) as error:
+            if debug:
+                print(f"[lakhua][debug] data cache {path} unusable: {error}")
+            return None
+        return binary
+
+    def _watched_paths(self) -> List[Path]:
+        """Internal method listing the files whose changes call for a reload."""
+        if self._source is not None:
+            return self._source.paths
+        return [
+            *(get_data_file_path(resolution) for resolution in SUPPORTED_RESOLUTIONS),
+            get_binary_file_path(),
+        ]
+
+    def _build_dataset(self, debug: bool) -> _Dataset:
+        """
+        Internal method that loads and checks a complete dataset without publishing it.
+
+        Args:
+            debug: When True, prints timing information for loading and building.
+
+        Returns:
+            Every store and index reload() swaps in.
+
+        Raises:
+            FileNotFoundError: If a data file is missing.
+            ValueError: If the data is corrupt, empty, or inconsistent.
+        """
+        stores, attributes, binary, version = self._read_dataset(debug)
+
+        for resolution, store in stores.items():
+            cells, codes = store.cells, store.codes
+            if not len(cells):
+                raise ValueError(f"dataset has no cells at resolution {resolution}")
+            if any(cells[position] >= cells[position + 1] for position in range(len(cells) - 1)):
+                raise ValueError(f"dataset cells at resolution {resolution} aren't sorted")
+            if max(codes) >= len(attributes):
+                raise ValueError(f"dataset rows at resolution {resolution} are out of range")
+
+        start_time = time.perf_counter()
+        fine, coarse = stores[MAX_RESOLUTION], stores[MIN_RESOLUTION]
+        fallback_index = FallbackIndex(fine, MAX_RESOLUTION, coarse, MIN_RESOLUTION)
+        self._notify_load(
+            "fallback_index",
+            MAX_RESOLUTION,
+            "built",
+            time.perf_counter() - start_time,
+            len(fallback_index),
+        )
+        # Build the coverage filters and the nearest-cell indexes in use, so those
+        # lookups don't stall either.
+        coverage_filters = [fallback_index.coverage]  # built on first access
+        coverage_filters.extend(store.coverage for store in stores.values())
+
+        gap_indexes: Dict[int, GapFillIndex] = {}
+        for resolution in self._gap_indexes:
+            start_time = time.perf_counter()
+            covered = (
+                fallback_index.cells if resolution == MAX_RESOLUTION else stores[resolution].cells
+            )
+            gap_indexes[resolution] = GapFillIndex(covered, MAX_NEAREST_DISTANCE)
+            self._notify_load(
+                "gap_index",
+                resolution,
+                "built",
+                time.perf_counter() - start_time,
+                len(gap_indexes[resolution]),
+            )
+        return _Dataset(stores, attributes, binary, version, fallback_index, gap_indexes)
+
+    def reload(self, background: bool = True, *, debug: bool = False) -> "Future[str]":
+        """
+        Load the data files again and swap the new data in atomically.
+
+        Every store and index is built and checked off to the side while lookups
+        keep being served from the current data at full speed, then everything is
+        published at once. Lookups already running finish against the data they
+        started with. If loading or checking fails, the current data stays in
+        place and the future holds the error. Concurrent reloads run one at a time.
+
+        Args:
+            background: When True, build on a background daemon thread and return
+                at once; when False, build before returning.
+            debug: When True, prints timing information for loading and building.
+
+        Returns:
+            Future resolving to the new dataset_version.
+        """
+        from concurrent.futures import Future
+
+        future: Future[str] = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                with self._reload_lock:
+                    dataset = self._build_dataset(debug)
+                    with self._lock:
+                        self._stores = dataset.stores
+                        self._attributes = dataset.attributes
+                        self._binary = dataset.binary
+                        self._binary_checked = True
+                        self._fallback_index = dataset.fallback_index
+                        self._gap_indexes = dataset.gap_indexes
+                        self._version = dataset.version
+                        self._advance_generation()
+            except BaseException as error:
+                future.set_exception(error)
+            else:
+                if debug:
+                    print(f"[lakhua][debug] reloaded dataset version {dataset.version}")
+                future.set_result(dataset.version)
+
+        if background:
+            threading.Thread(target=run, name="lakhua-reload", daemon=True).start()
+        else:
+            run()
+        return future
+
+    def watch(
+        self,
+        interval: float = 30.0,
+        on_reload: Optional[Callable[[str], None]] = None,
+    ) -> DataWatcher:
+        """
+        Reload automatically whenever the data files change on disk.
+
+        A daemon thread checks the size and modification time of the data files
+        (the bundled JSON and binary files, or the DataSource's files) every
+        interval seconds and calls reload() when they change. Replace files
+        atomically (write elsewhere, then rename) so a half-written file is never
+        read; a reload that fails keeps the current data and is retried on the
+        next change.
+
+        Args:
+            interval: Seconds between checks.
+            on_reload: Called with the new dataset_version after each successful reload.
+
+        Returns:
+            Watcher handle; call its stop() method to stop watching.
+
+        Raises:
+            ValueError: If interval isn't positive, or the loader's DataSource
+                was made from file objects only, so there are no files to watch.
         """
-        self._stores.clear()
-        self._is_loaded = False
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+        if not self._watched_paths():
+            raise ValueError("this loader's data source has no files on disk to watch")
+        return DataWatcher(self, interval, on_reload)
 
 
 # Default data loader instance used by geocode() and geocode_h3()
@@ -0,0 +1,164 @@
+"""
+Flattened multi-resolution lookup table for single-probe fallback.
+
+With fallback enabled, a resolution-5 miss used to mean computing the parent
+cell and searching the resolution-4 store as well. This module precomputes, for
+every resolution-5 cell that can match anything, where its final answer lives:
+its own entry in the resolution-5 store, or the entry of its resolution-4 parent.
+A fallback lookup then becomes one binary search. You typically don't need to use
+this module directly; the DataLoader builds the index on first use.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple
+
+from lakhua.core.h3_bits import cell_to_children
+from lakhua.core.store import AttributeTable, CompactStore
+from lakhua.types import GeocodeResult, MatchKind
+
+if TYPE_CHECKING:
+    from lakhua.core.coverage import CoverageFilter
+
+
+class FallbackIndex:
+    """
+    Sorted table resolving fine cells to their final match across two resolutions.
+
+    Each entry maps a cell at the fine resolution to a target: a non-negative
+    target is a position in the fine store, and a negative target t is position
+    ~t in the coarse (parent) store. Fine-store entries take priority over the
+    inherited parent entry, matching the resolution-by-resolution fallback walk.
+    """
+
+    __slots__ = (
+        "_cells",
+        "_targets",
+        "_fine",
+        "_coarse",
+        "_coverage",
+        "fine_resolution",
+        "coarse_resolution",
+    )
+
+    def __init__(
+        self,
+        fine: CompactStore,
+        fine_resolution: int,
+        coarse: CompactStore,
+        coarse_resolution: int,
+    ) -> None:
+        """
+        Build the index from a fine store and its parent-resolution store.
+
+        Args:
+            fine: Store at the finer resolution (e.g. resolution 5).
+            fine_resolution: Resolution of the fine store's cells.
+            coarse: Store at the coarser resolution (e.g. resolution 4).
+            coarse_resolution: Resolution of the coarse store's cells.
+        """
+        # Children of the sorted coarse cells come out sorted too, so one merge
+        # with the sorted fine cells yields the table; fine entries win ties.
+        fine_cells = list(fine.cells)
+        cells = array("Q")
+        targets = array("i")
+        next_fine = 0
+        for coarse_position, coarse_cell in enumerate(coarse.cells):
+            for child in cell_to_children(coarse_cell, fine_resolution):
+                while next_fine < len(fine_cells) and fine_cells[next_fine] < child:
+                    cells.append(fine_cells[next_fine])
+                    targets.append(next_fine)
+                    next_fine += 1
+                cells.append(child)
+                if next_fine < len(fine_cells) and fine_cells[next_fine] == child:
+                    targets.append(next_fine)
+                    next_fine += 1
+                else:
+                    targets.append(~coarse_position)
+        for position in range(next_fine, len(fine_cells)):
+            cells.append(fine_cells[position])
+            targets.append(position)
+
+        self._cells = cells
+        self._targets = targets
+        self._fine = fine
+        self._coarse = coarse
+        self._coverage: Optional[CoverageFilter] = None
+        self.fine_resolution = fine_resolution
+        self.coarse_resolution = coarse_resolution
+
+    def find(self, cell: int) -> Tuple[CompactStore, int, int, MatchKind]:
+        """
+        Resolve a fine-resolution cell to the store entry that answers it.
+
+        Args:
+            cell: Integer H3 cell ID at the fine resolution.
+
+        Returns:
+            Tuple of (store, position, resolution, match kind) for the match, or
+            (fine store, -1, fine resolution, "exact") when nothing matches.
+        """
+        cells = self._cells
+        index = bisect_left(cells, cell)
+        if index < len(cells) and cells[index] == cell:
+            target = self._targets[index]
+            if target >= 0:
+                return self._fine, target, self.fine_resolution, "exact"
+            return self._coarse, ~target, self.coarse_resolution, "parent"
+        return self._fine, -1, self.fine_resolution, "exact"
+
+    def lookup(self, cell: int, nearest: bool = False) -> "GeocodeResult | None":
+        """
+        Resolve a fine-resolution cell straight to its shared GeocodeResult.
+
+        Args:
+            cell: Integer H3 cell ID at the fine resolution.
+            nearest: Mark the result as a nearest-cell match, for cells found
+                through the gap-fill index.
+
+        Returns:
+            The match from the fine cell or its inherited parent, or None.
+        """
+        cells = self._cells
+        index = bisect_left(cells, cell)
+        if index < len(cells) and cells[index] == cell:
+            target = self._targets[index]
+            if target >= 0:
+                return self._fine.result_at(
+                    target, self.fine_resolution, "nearest" if nearest else "exact"
+                )
+            return self._coarse.result_at(
+                ~target, self.coarse_resolution, "nearest" if nearest else "parent"
+            )
+        return None
+
+    @property
+    def cells(self) -> Sequence[int]:
+        """Sorted fine-resolution cells that resolve to a match."""
+        return self._cells
+
+    @property
+    def coverage(self) -> "CoverageFilter":
+        """
+        Coverage bitmap of the cells that resolve to a match, built on first access.
+
+        Every such cell is in the fine store or a child of a coarse store cell,
+        and store filters take in their cells' children, so this combines the
+        stores' filters instead of boxing every cell again.
+        """
+        coverage = self._coverage
+        if coverage is None:
+            from lakhua.core.coverage import CoverageFilter
+
+            coverage = self._coverage = CoverageFilter.union(
+                (self._fine.coverage, self._coarse.coverage)
+            )
+        return coverage
+
+    @property
+    def attributes(self) -> AttributeTable:
+        """Attribute table of the fine store."""
+        return self._fine.attributes
+
+    def __len__(self) -> int:
+        return len(self._cells)
@@ -0,0 +1,99 @@
+"""
+Precomputed gap-fill index for nearest-covered-cell fallback.
+
+The datasets don't cover every cell: highways, coastlines, and sparse rural areas
+can fall between covered cells. This module computes, once per resolution, the
+nearest covered cell for every uncovered cell within a bounded grid distance, so
+a lookup that misses can be answered with one more binary search instead of a
+grid_disk() search on every miss. You typically don't need to use this module
+directly; the DataLoader builds the index the first time a lookup asks for it.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, Optional, Sequence
+
+import h3.api.basic_int as h3_int
+
+
+class GapFillIndex:
+    """
+    Sorted table of uncovered cells, each with its nearest covered cell.
+
+    The index is built with a breadth-first search outwards from every covered
+    cell, one grid ring at a time, so each gap cell records a covered cell at the
+    smallest grid distance. Ties are broken deterministically, in favour of the
+    covered cell with the lower position in the sorted coverage.
+    """
+
+    __slots__ = ("_cells", "_nearest", "_distances", "max_distance")
+
+    def __init__(self, covered: Sequence[int], max_distance: int) -> None:
+        """
+        Build the index around a set of covered cells.
+
+        Args:
+            covered: Sorted integer H3 cell IDs that have data, all at one resolution.
+            max_distance: Largest grid distance (k-ring) to fill gaps for.
+        """
+        owners: Dict[int, int] = {cell: position for position, cell in enumerate(covered)}
+        frontier: Sequence[int] = covered
+        distances: Dict[int, int] = {}
+        for distance in range(1, max_distance + 1):
+            ring: Dict[int, int] = {}
+            for cell in frontier:
+                owner = owners[cell]
+                for neighbour in h3_int.grid_ring(cell, 1):
+                    if neighbour in owners:
+                        continue
+                    current = ring.get(neighbour)
+                    if current is None or owner < current:
+                        ring[neighbour] = owner
+            if not ring:
+                break
+            owners.update(ring)
+            distances.update(dict.fromkeys(ring, distance))
+            frontier = sorted(ring)
+
+        gaps = sorted(distances)
+        self._cells = array("Q", gaps)
+        self._nearest = array("Q", [covered[owners[cell]] for cell in gaps])
+        self._distances = array("B", [distances[cell] for cell in gaps])
+        self.max_distance = max_distance
+
+    def nearest(self, cell: int, max_distance: int) -> Optional[int]:
+        """
+        Find the nearest covered cell for an uncovered cell.
+
+        Args:
+            cell: Integer H3 cell ID at the index's resolution.
+            max_distance: Largest grid distance the caller accepts.
+
+        Returns:
+            Integer ID of the nearest covered cell, or None when there is none
+            within max_distance (or the cell isn't a known gap).
+        """
+        cells = self._cells
+        index = bisect_left(cells, cell)
+        if index < len(cells) and cells[index] == cell and self._distances[index] <= max_distance:
+            return self._nearest[index]
+        return None
+
+    def distance(self, cell: int) -> Optional[int]:
+        """
+        Return the grid distance from a gap cell to its nearest covered cell.
+
+        Args:
+            cell: Integer H3 cell ID at the index's resolution.
+
+        Returns:
+            Grid distance, or None when the cell isn't a gap within max_distance.
+        """
+        cells = self._cells
+        index = bisect_left(cells, cell)
+        if index < len(cells) and cells[index] == cell:
+            return self._distances[index]
+        return None
+
+    def __len__(self) -> int:
+        return len(self._cells)
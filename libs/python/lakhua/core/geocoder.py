@@ -6,14 +6,54 @@ into location information. Most users should use the top-level geocode() and
 geocode_h3() functions rather than interacting with this module directly.
 """
 
+import itertools
+import threading
 import time
-from typing import Optional
+from array import array
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
 
 import h3
+import h3.api.basic_int as h3_int
 
-from lakhua.core.constants import DEFAULT_RESOLUTION, MAX_RESOLUTION, MIN_RESOLUTION
+from lakhua.core.cache import CoordinateCache
+from lakhua.core.constants import (
+    DEFAULT_RESOLUTION,
+    MAX_NEAREST_DISTANCE,
+    MAX_RESOLUTION,
+    MIN_RESOLUTION,
+)
+from lakhua.core.coverage import CoverageFilter
 from lakhua.core.data_loader import DataLoader, default_data_loader
-from lakhua.types import GeocodeOptions, GeocodeResult
+from lakhua.core.h3_bits import cell_resolution, cell_to_parent
+from lakhua.core.observer import GeocodeObserver
+from lakhua.core.raster import DEFAULT_RASTER_STEP, RasterIndex
+from lakhua.core.store import AttributeTable, CompactStore
+from lakhua.types import (
+    MATCH_KINDS,
+    BatchGeocodeResult,
+    CacheStats,
+    GeocodeOptions,
+    GeocodeResult,
+    LocationRow,
+)
+
+_CellMatch = Tuple[int, AttributeTable, int, int]
+"""Batch match for one cell: (matched cell, table, code, match kind code)."""
+
+_KIND_CODES = {kind: code for code, kind in enumerate(MATCH_KINDS)}
 
 
 def _clamp_resolution(resolution: int) -> int:
@@ -38,6 +78,102 @@ def _clamp_resolution(resolution: int) -> int:
     return resolution
 
 
+def _clamp_nearest_distance(distance: int) -> int:
+    """
+    Internal utility to keep nearest-cell search distances within the indexed range.
+
+    Args:
+        distance: Requested maximum grid distance.
+
+    Returns:
+        Distance between 0 (disabled) and MAX_NEAREST_DISTANCE.
+    """
+    if not isinstance(distance, int) or distance < 0:
+        return 0
+    return min(distance, MAX_NEAREST_DISTANCE)
+
+
+def _is_valid_coordinate(lat: Any, lon: Any) -> bool:
+    """
+    Internal utility to check that a latitude/longitude pair can be converted to H3.
+
+    Args:
+        lat: Latitude candidate.
+        lon: Longitude candidate.
+
+    Returns:
+        True when both values are numbers within the valid degree ranges.
+    """
+    if not (isinstance(lat, (int, float)) and isinstance(lon, (int, float))):
+        return False
+    return -90 <= lat <= 90 and -180 <= lon <= 180
+
+
+def _raster_applies(
+    raster: RasterIndex, resolution: int, opts: GeocodeOptions, data_loader: DataLoader
+) -> bool:
+    """
+    Internal utility to check whether a raster can answer a geocode() lookup.
+
+    The raster holds default-option results (fallback at the finest resolution,
+    no nearest search) for the data it was built from, and debug lookups print
+    every step, so anything else takes the H3 path.
+    """
+    return (
+        resolution == MAX_RESOLUTION
+        and opts.fallback
+        and not opts.nearest_distance
+        and not opts.debug
+        and raster.generation == data_loader.generation
+    )
+
+
+def _point_coordinates(point: Any, lat_key: str, lon_key: str) -> Tuple[Any, Any]:
+    """
+    Internal utility to read latitude and longitude from one streamed point.
+
+    Args:
+        point: (lat, lon) tuple or list, mapping with lat_key/lon_key entries, object
+            with lat_key/lon_key attributes, or any other indexable (lat, lon) pair.
+        lat_key: Key or attribute name holding the latitude.
+        lon_key: Key or attribute name holding the longitude.
+
+    Returns:
+        (lat, lon), with None for values the point doesn't carry.
+    """
+    if type(point) is tuple and len(point) == 2:  # exact type: named tuples go by name
+        return point
+    if isinstance(point, Mapping):
+        return point.get(lat_key), point.get(lon_key)
+    if hasattr(point, lat_key):
+        return getattr(point, lat_key), getattr(point, lon_key, None)
+    try:
+        return point[0], point[1]
+    except (TypeError, IndexError, KeyError):
+        return None, None
+
+
+def _as_value_list(values: Iterable[Any]) -> List[Any]:
+    """
+    Internal utility to turn a coordinate sequence or NumPy array into a plain list.
+
+    NumPy arrays (and anything else exposing tolist()) are converted in one call,
+    which yields native Python floats instead of per-element NumPy scalars.
+
+    Args:
+        values: Sequence, iterable, or array of coordinate values.
+
+    Returns:
+        List of coordinate values in input order.
+    """
+    tolist = getattr(values, "tolist", None)
+    if callable(tolist):
+        converted = tolist()
+        if isinstance(converted, list):
+            return converted
+    return list(values)
+
+
 class ReverseGeocoder:
     """
     Converts coordinates and H3 cells into location information for India.
@@ -58,6 +194,12 @@ class ReverseGeocoder:
 
     _instance: Optional["ReverseGeocoder"] = None
     _data_loader: DataLoader
+    _coordinate_cache: Optional[CoordinateCache]
+    _raster: Optional[RasterIndex]
+    _observer: Optional[GeocodeObserver]
+    _coverage_filters: Dict[Tuple[int, bool], CoverageFilter]
+    _coverage_generation: int
+    _coverage_lock: threading.Lock
 
     def __new__(cls, data_loader: Optional[DataLoader] = None) -> "ReverseGeocoder":
         """
@@ -68,9 +210,51 @@ class ReverseGeocoder:
         """
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._data_loader = data_loader or default_data_loader
+            cls._instance._initialize(data_loader or default_data_loader)
         return cls._instance
 
+    def _initialize(self, data_loader: DataLoader) -> None:
+        """Internal method that sets up a geocoder reading data from data_loader."""
+        self._data_loader = data_loader
+        self._coordinate_cache = None
+        self._raster = None
+        self._observer = None
+        self._coverage_filters = {}
+        self._coverage_generation = -1
+        self._coverage_lock = threading.Lock()
+        data_loader._watch_generation(self._data_changed)
+
+    def _data_changed(self, generation: int) -> None:
+        """Internal callback from the data loader that drops filters built from older data."""
+        with self._coverage_lock:
+            if generation > self._coverage_generation:
+                self._coverage_generation = generation
+                self._coverage_filters = {}
+
+    @classmethod
+    def from_loader(cls, data_loader: DataLoader) -> "ReverseGeocoder":
+        """
+        Create a geocoder that looks up against a specific data loader.
+
+        Use it with DataLoader.from_directory() or DataLoader.from_source() to
+        serve your own data. The geocoder is independent of the shared one: it
+        has its own coordinate cache and observer, and the top-level functions
+        keep using the bundled data.
+
+        Args:
+            data_loader: Loader holding the data to look up against.
+
+        Returns:
+            A new geocoder.
+
+        Example:
+            >>> geocoder = ReverseGeocoder.from_loader(DataLoader.from_directory("/srv/geo"))
+            >>> result = geocoder.geocode(28.6139, 77.2090)
+        """
+        geocoder = super().__new__(cls)
+        geocoder._initialize(data_loader)
+        return geocoder
+
     @classmethod
     def get_instance(cls) -> "ReverseGeocoder":
         """
@@ -84,6 +268,108 @@ class ReverseGeocoder:
         """
         return cls()
 
+    def enable_coordinate_cache(self, max_size: int = 10_000, precision: int = 5) -> None:
+        """
+        Cache geocode() results for recently seen coordinates (second-chance LRU).
+
+        Worth enabling when traffic repeats the same locations (pickup points,
+        stores, depots): hits skip H3 conversion and the store search. Keys are
+        latitude/longitude floored to precision decimal places plus the
+        resolution and fallback options, so points closer together than that
+        step can share a result. The cache empties itself when the data
+        loader's data changes, e.g. after clear_store_cache(). Calling this again
+        replaces the cache (and resets its counters).
+
+        Args:
+            max_size: Maximum cached coordinates before evicting one not used recently.
+            precision: Decimal places keys keep (5 ≈ 1.1 m, 4 ≈ 11 m).
+
+        Raises:
+            ValueError: If max_size is less than 1 or precision is negative.
+        """
+        cache = CoordinateCache(max_size=max_size, precision=precision)
+        self._coordinate_cache = cache
+        self._data_loader._watch_generation(cache.invalidate)
+
+    def disable_coordinate_cache(self) -> None:
+        """Turn the coordinate cache off and drop its entries."""
+        self._coordinate_cache = None
+
+    def coordinate_cache_stats(self) -> Optional[CacheStats]:
+        """
+        Get hit/miss/eviction counters for the coordinate cache.
+
+        Returns:
+            Counter snapshot, or None when the coordinate cache is disabled.
+        """
+        cache = self._coordinate_cache
+        return cache.stats() if cache is not None else None
+
+    def enable_raster(self, step: float = DEFAULT_RASTER_STEP) -> RasterIndex:
+        """
+        Answer geocode() and geocode_many() from a precomputed latitude/longitude raster.
+
+        Builds a grid over the data's coverage (a few seconds at the default step)
+        that maps most points straight to their match without computing an H3
+        cell. Points in pixels that straddle a cell boundary still go through H3,
+        so results are the same as without the raster. Only lookups with the
+        default options (resolution 5, fallback on, no nearest search, no debug)
+        use it. After the data changes, e.g. after reload(), the raster is
+        skipped until you call this again. Use RasterIndex.report() or
+        lakhua.core.raster.raster_report() to weigh memory against the share of
+        points answered from the raster.
+
+        Args:
+            step: Grid step in degrees; memory and build time grow with the
+                inverse square (0.02 ≈ 2.2 km).
+
+        Returns:
+            The raster now in use.
+
+        Raises:
+            ValueError: If step is smaller than MIN_RASTER_STEP.
+        """
+        raster = RasterIndex.from_loader(self._data_loader, step)
+        self._raster = raster
+        return raster
+
+    def disable_raster(self) -> None:
+        """Stop using the raster and free it."""
+        self._raster = None
+
+    @property
+    def raster(self) -> Optional[RasterIndex]:
+        """The raster in use, or None."""
+        return self._raster
+
+    def set_observer(self, observer: Optional[GeocodeObserver]) -> None:
+        """
+        Report lookups, rejected inputs, and data loads to an observer.
+
+        Use StatsCollector for built-in counters and latency histograms, or
+        subclass GeocodeObserver to forward events elsewhere. Unlike
+        GeocodeOptions.debug, observers print nothing and cover every lookup,
+        so they suit production monitoring. With no observer (the default),
+        lookups skip all timing and bookkeeping.
+
+        Args:
+            observer: Observer to install (it's also installed on the data
+                loader), or None to remove the current one.
+
+        Example:
+            >>> stats = StatsCollector()
+            >>> geocoder.set_observer(stats)
+            >>> geocoder.geocode(28.6139, 77.2090)
+            >>> stats.snapshot().latency_quantile(0.99)
+        """
+        self._observer = observer
+        self._data_loader.set_observer(observer)
+
+    @property
+    def observer(self) -> Optional[GeocodeObserver]:
+        """The installed observer, or None."""
+        return self._observer
+
     def geocode_h3(
         self,
         h3_index: str,
@@ -111,51 +397,219 @@ class ReverseGeocoder:
             ...     print(f"{result.city}, {result.state}")
         """
         opts = options or GeocodeOptions()
+        observer = self._observer
 
         if not h3.is_valid_cell(h3_index):
             if opts.debug:
                 print("[lakhua][debug] invalid h3 index provided")
+            if observer is not None:
+                observer.on_invalid("h3_index")
             return None
 
+        cell = h3.str_to_int(h3_index)
+        input_resolution = cell_resolution(cell)
+        if input_resolution < MIN_RESOLUTION:
+            if opts.debug:
+                print(f"[lakhua][debug] h3 index resolution {input_resolution} is too coarse")
+            if observer is not None:
+                observer.on_invalid("resolution")
+            return None
+        resolution = min(input_resolution, MAX_RESOLUTION)
+        if resolution != input_resolution:
+            cell = cell_to_parent(cell, resolution)
+        if observer is None:
+            return self._lookup_cell(cell, resolution, opts)
         start_time = time.perf_counter()
-        input_resolution = h3.get_resolution(h3_index)
-        start_resolution = _clamp_resolution(input_resolution)
-        end_resolution = MIN_RESOLUTION if opts.fallback else start_resolution
+        result = self._lookup_cell(cell, resolution, opts)
+        observer.on_lookup(result, time.perf_counter() - start_time)
+        return result
+
+    def _coverage_for(self, resolution: int, opts: GeocodeOptions) -> Optional[CoverageFilter]:
+        """
+        Internal helper returning the coverage filter for coordinate lookups, if one applies.
+
+        A point outside the returned filter can't match with these options. Lookups
+        with nearest_distance set can match beyond the covered cells, and debug
+        lookups print every step, so they get None and take the full path.
+        """
+        if opts.nearest_distance or opts.debug:
+            return None
+        key = (resolution, opts.fallback)
+        coverage = self._coverage_filters.get(key)
+        if coverage is None:
+            # Held per data generation, so lookups skip the loader's checks and locks.
+            generation = self._data_loader.generation
+            coverage = self._data_loader.load_coverage_filter(resolution, opts.fallback)
+            with self._coverage_lock:
+                if generation == self._coverage_generation:
+                    self._coverage_filters = {**self._coverage_filters, key: coverage}
+        return coverage
+
+    def _lookup_cell(
+        self,
+        cell: int,
+        resolution: int,
+        opts: GeocodeOptions,
+    ) -> Optional[GeocodeResult]:
+        """
+        Internal lookup of a known-valid integer H3 cell at a supported resolution.
+
+        geocode() calls this directly with the cell it just computed, skipping the
+        string conversion and validation geocode_h3() needs for caller input. With
+        fallback enabled at the finest resolution, the fallback index answers in a
+        single search; otherwise each resolution is probed in turn, deriving
+        parent cells with bit arithmetic. Cells that still miss go to the
+        nearest-covered-cell fallback when nearest_distance is set.
+
+        Args:
+            cell: Integer H3 cell ID at the given resolution.
+            resolution: Resolution of cell, between MIN_RESOLUTION and MAX_RESOLUTION.
+            opts: Lookup options (fallback, nearest_distance, and debug are honored).
+
+        Returns:
+            Shared result for the matched cell, or None when nothing matches.
+        """
+        if opts.debug:
+            return self._lookup_cell_debug(cell, resolution, opts)
+        if opts.fallback and resolution == MAX_RESOLUTION:
+            result = self._data_loader.load_fallback_index().lookup(cell)
+            if result is None and opts.nearest_distance:
+                return self._lookup_nearest(cell, resolution, opts)
+            return result
 
-        for resolution in range(start_resolution, end_resolution - 1, -1):
+        end_resolution = MIN_RESOLUTION if opts.fallback else resolution
+        for candidate_resolution in range(resolution, end_resolution - 1, -1):
             candidate = (
-                h3_index
-                if resolution == input_resolution
-                else h3.cell_to_parent(h3_index, resolution)
+                cell
+                if candidate_resolution == resolution
+                else cell_to_parent(cell, candidate_resolution)
             )
-            store = self._data_loader.load_resolution_store(resolution, opts.debug)
+            store = self._data_loader.load_resolution_store(candidate_resolution)
+            position = store.find(candidate)
+            if position >= 0:
+                return store.result_at(
+                    position,
+                    candidate_resolution,
+                    "exact" if candidate_resolution == resolution else "parent",
+                )
+        if opts.fallback and opts.nearest_distance:
+            return self._lookup_nearest(cell, resolution, opts)
+        return None
+
+    def _find_nearest(
+        self,
+        cell: int,
+        resolution: int,
+        opts: GeocodeOptions,
+    ) -> Optional[Tuple[CompactStore, int, int]]:
+        """
+        Internal lookup of the nearest covered cell for a cell that has no match.
+
+        Args:
+            cell: Integer H3 cell ID at the given resolution.
+            resolution: Resolution of cell, between MIN_RESOLUTION and MAX_RESOLUTION.
+            opts: Lookup options (nearest_distance and debug are honored).
+
+        Returns:
+            Tuple of (store, position, matched resolution) for the row of the
+            nearest covered cell, or None when none is within range.
+        """
+        max_distance = _clamp_nearest_distance(opts.nearest_distance)
+        if max_distance == 0:
+            return None
+        loader = self._data_loader
+        nearest = loader.load_gap_index(resolution, opts.debug).nearest(cell, max_distance)
+        if nearest is None:
+            return None
+        if resolution == MAX_RESOLUTION:
+            store, position, matched_resolution, _ = loader.load_fallback_index(opts.debug).find(
+                nearest
+            )
+            return store, position, matched_resolution
+        store = loader.load_resolution_store(resolution, opts.debug)
+        return store, store.find(nearest), resolution
+
+    def _lookup_nearest(
+        self,
+        cell: int,
+        resolution: int,
+        opts: GeocodeOptions,
+    ) -> Optional[GeocodeResult]:
+        """
+        Internal nearest-covered-cell fallback for a cell that has no match.
+
+        Args:
+            cell: Integer H3 cell ID at the given resolution.
+            resolution: Resolution of cell, between MIN_RESOLUTION and MAX_RESOLUTION.
+            opts: Lookup options (nearest_distance and debug are honored).
+
+        Returns:
+            Shared result for the nearest covered cell, or None when none is in range.
+        """
+        found = self._find_nearest(cell, resolution, opts)
+        if found is None:
+            return None
+        store, position, matched_resolution = found
+        return store.result_at(position, matched_resolution, "nearest")
+
+    def _lookup_cell_debug(
+        self,
+        cell: int,
+        resolution: int,
+        opts: GeocodeOptions,
+    ) -> Optional[GeocodeResult]:
+        """
+        Internal variant of _lookup_cell() that probes each resolution and prints timings.
+
+        Args:
+            cell: Integer H3 cell ID at the given resolution.
+            resolution: Resolution of cell, between MIN_RESOLUTION and MAX_RESOLUTION.
+            opts: Lookup options.
+
+        Returns:
+            Shared result for the matched cell, or None when nothing matches.
+        """
+        start_time = time.perf_counter()
+        end_resolution = MIN_RESOLUTION if opts.fallback else resolution
+
+        for candidate_resolution in range(resolution, end_resolution - 1, -1):
+            candidate = (
+                cell
+                if candidate_resolution == resolution
+                else cell_to_parent(cell, candidate_resolution)
+            )
+            store = self._data_loader.load_resolution_store(candidate_resolution, opts.debug)
 
             lookup_start = time.perf_counter()
-            match = store.get(candidate)
-            if opts.debug:
-                lookup_elapsed_ms = (time.perf_counter() - lookup_start) * 1000
-                print(
-                    "[lakhua][debug] lookup key "
-                    f"{candidate} in r{resolution} took {lookup_elapsed_ms:.3f}ms"
-                )
+            position = store.find(candidate)
+            lookup_elapsed_ms = (time.perf_counter() - lookup_start) * 1000
+            print(
+                "[lakhua][debug] lookup key "
+                f"{format(candidate, 'x')} in r{candidate_resolution} "
+                f"took {lookup_elapsed_ms:.3f}ms"
+            )
 
-            if match:
-                if opts.debug:
-                    total_elapsed_ms = (time.perf_counter() - start_time) * 1000
-                    print(f"[lakhua][debug] match found in {total_elapsed_ms:.3f}ms")
-                return GeocodeResult(
-                    city=match.get("city", ""),
-                    state=match.get("state", ""),
-                    district=match.get("district"),
-                    pincode=match.get("pincode"),
-                    matched_h3=candidate,
-                    matched_resolution=resolution,
+            if position >= 0:
+                total_elapsed_ms = (time.perf_counter() - start_time) * 1000
+                print(f"[lakhua][debug] match found in {total_elapsed_ms:.3f}ms")
+                return store.result_at(
+                    position,
+                    candidate_resolution,
+                    "exact" if candidate_resolution == resolution else "parent",
                 )
 
-        if opts.debug:
-            total_elapsed_ms = (time.perf_counter() - start_time) * 1000
-            print(f"[lakhua][debug] no match found in {total_elapsed_ms:.3f}ms")
+        if opts.fallback and opts.nearest_distance:
+            result = self._lookup_nearest(cell, resolution, opts)
+            if result is not None:
+                total_elapsed_ms = (time.perf_counter() - start_time) * 1000
+                print(
+                    f"[lakhua][debug] nearest covered cell {result.matched_h3} "
+                    f"found in {total_elapsed_ms:.3f}ms"
+                )
+                return result
 
+        total_elapsed_ms = (time.perf_counter() - start_time) * 1000
+        print(f"[lakhua][debug] no match found in {total_elapsed_ms:.3f}ms")
         return None
 
     def geocode(
@@ -187,17 +641,446 @@ class ReverseGeocoder:
             ...     print(f"Found: {result.city}, {result.state}")
         """
         opts = options or GeocodeOptions()
+        observer = self._observer
+        if observer is not None:
+            return self._geocode_observed(observer, lat, lon, opts)
+
+        if not _is_valid_coordinate(lat, lon):
+            return None
 
-        if not (isinstance(lat, (int, float)) and isinstance(lon, (int, float))):
+        resolution = _clamp_resolution(opts.resolution)
+        raster = self._raster
+        if raster is not None and _raster_applies(raster, resolution, opts, self._data_loader):
+            slot = raster.find(lat, lon)
+            if slot >= 0:
+                return raster.results[slot]
+        coverage = self._coverage_for(resolution, opts)
+        if coverage is not None and not coverage.covers(lat, lon):
             return None
-        if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        cache = self._coordinate_cache
+        # The cell comes straight from latlng_to_cell, so it skips the validation
+        # and resolution checks geocode_h3() applies to caller-supplied cells.
+        if cache is None:
+            return self._lookup_cell(h3_int.latlng_to_cell(lat, lon, resolution), resolution, opts)
+        return self._lookup_cached(cache, lat, lon, resolution, opts)
+
+    def _lookup_cached(
+        self,
+        cache: CoordinateCache,
+        lat: float,
+        lon: float,
+        resolution: int,
+        opts: GeocodeOptions,
+    ) -> Optional[GeocodeResult]:
+        """Internal geocode() lookup of valid coordinates through the coordinate cache."""
+        key = cache.key(lat, lon, resolution, opts.fallback, opts.nearest_distance)
+        found, result = cache.get(key)
+        if not found:
+            # Read before the lookup, so a result computed from replaced data is dropped.
+            generation = self._data_loader.generation
+            cell = h3_int.latlng_to_cell(lat, lon, resolution)
+            result = self._lookup_cell(cell, resolution, opts)
+            cache.put(key, result, generation)
+        return result
+
+    def _geocode_observed(
+        self,
+        observer: GeocodeObserver,
+        lat: float,
+        lon: float,
+        opts: GeocodeOptions,
+    ) -> Optional[GeocodeResult]:
+        """
+        Internal variant of geocode() that reports to an observer.
+
+        Kept apart from geocode() so lookups without an observer never read the clock.
+        """
+        if not _is_valid_coordinate(lat, lon):
+            observer.on_invalid("coordinates")
             return None
 
+        start_time = time.perf_counter()
+        resolution = _clamp_resolution(opts.resolution)
+        raster = self._raster
+        slot = -1
+        if raster is not None and _raster_applies(raster, resolution, opts, self._data_loader):
+            slot = raster.find(lat, lon)
+        coverage = self._coverage_for(resolution, opts) if slot < 0 else None
+        cache = self._coordinate_cache
+        if raster is not None and slot >= 0:
+            result = raster.results[slot]
+        elif coverage is not None and not coverage.covers(lat, lon):
+            observer.on_out_of_coverage(1)
+            result = None
+        elif cache is None:
+            cell = h3_int.latlng_to_cell(lat, lon, resolution)
+            result = self._lookup_cell(cell, resolution, opts)
+        else:
+            result = self._lookup_cached(cache, lat, lon, resolution, opts)
+        observer.on_lookup(result, time.perf_counter() - start_time)
+        return result
+
+    def _geocode_points(
+        self,
+        lats: Sequence[float],
+        lons: Sequence[float],
+        opts: GeocodeOptions,
+    ) -> List[Optional[GeocodeResult]]:
+        """
+        Internal bulk variant of geocode() returning one shared result per point.
+
+        Used to answer micro-batched single-point requests: each distinct H3 cell
+        is looked up once, and every point gets exactly what geocode() would
+        return (the coordinate cache is not consulted).
+
+        Args:
+            lats: Latitudes in decimal degrees.
+            lons: Longitudes in decimal degrees, same length as lats.
+            opts: Lookup options.
+
+        Returns:
+            Result or None per point, in input order.
+        """
+        observer = self._observer
+        start_time = time.perf_counter() if observer is not None else 0.0
         resolution = _clamp_resolution(opts.resolution)
-        h3_index = h3.latlng_to_cell(lat, lon, resolution)
-        return self.geocode_h3(h3_index, opts)
+        latlng_to_cell = h3_int.latlng_to_cell
+        coverage = self._coverage_for(resolution, opts)
+        matches: Dict[int, Optional[GeocodeResult]] = {}
+        results: List[Optional[GeocodeResult]] = []
+        invalid = rejected = 0
+        for lat, lon in zip(lats, lons):
+            if not _is_valid_coordinate(lat, lon):
+                results.append(None)
+                invalid += 1
+                continue
+            if coverage is not None and not coverage.covers(lat, lon):
+                results.append(None)
+                rejected += 1
+                continue
+            cell = latlng_to_cell(lat, lon, resolution)
+            if cell in matches:
+                results.append(matches[cell])
+            else:
+                result = matches[cell] = self._lookup_cell(cell, resolution, opts)
+                results.append(result)
+
+        if observer is not None:
+            if rejected:
+                observer.on_out_of_coverage(rejected)
+            observer.on_batch(
+                [result.matched_resolution if result else None for result in results],
+                [result.match_kind if result else None for result in results],
+                invalid,
+                time.perf_counter() - start_time,
+            )
+        return results
+
+    def geocode_many(
+        self,
+        lats: Iterable[float],
+        lons: Iterable[float],
+        options: Optional[GeocodeOptions] = None,
+    ) -> BatchGeocodeResult:
+        """
+        Convert many latitude/longitude pairs into location information at once.
+
+        Use this instead of calling geocode() in a loop when you have thousands of
+        points. Repeated coordinates are converted to H3 once (points the raster
+        resolves, when enabled, skip the conversion), each distinct cell is looked
+        up only once, and parent fallback runs only for the cells that missed.
+        Results come back as integer array columns aligned with the input order;
+        strings and other per-row objects are only built when you read them.
+
+        Args:
+            lats: Latitudes in decimal degrees (list, tuple, or NumPy array).
+            lons: Longitudes in decimal degrees, same length as lats.
+            options: Optional settings to control resolution and fallback behavior.
+
+        Returns:
+            Columnar results with one entry per input point. Invalid or unmatched
+            points hold None in every column.
+
+        Raises:
+            ValueError: If lats and lons have different lengths.
+
+        Example:
+            >>> batch = geocoder.geocode_many([28.6139, 19.076], [77.2090, 72.8777])
+            >>> print(batch.city)
+        """
+        opts = options or GeocodeOptions()
+        lat_values = _as_value_list(lats)
+        lon_values = _as_value_list(lons)
+        if len(lat_values) != len(lon_values):
+            raise ValueError(
+                f"lats and lons must have the same length ({len(lat_values)} != {len(lon_values)})"
+            )
+
+        observer = self._observer
+        timed = opts.debug or observer is not None
+        start_time = time.perf_counter() if timed else 0.0
+        resolution = _clamp_resolution(opts.resolution)
+        latlng_to_cell = h3_int.latlng_to_cell
+        coverage = self._coverage_for(resolution, opts)
+        # Points the raster resolves skip H3: their slot's cell has the same match.
+        raster = self._raster
+        slots: Iterable[int] = itertools.repeat(-1)
+        slot_cells: List[int] = []
+        if raster is not None and _raster_applies(raster, resolution, opts, self._data_loader):
+            slots, slot_cells = raster.find_many(lat_values, lon_values), raster.cells
+        # Points seen before in the batch reuse their cell, or their rejection.
+        # Cell 0 means the point has no cell to look up.
+        point_keys: Dict[Tuple[float, float], int] = {}
+        point_cells: array[int] = array("Q")
+        add_cell = point_cells.append
+        invalid = rejected = 0
+        numbers = (int, float)
+        for lat, lon, slot in zip(lat_values, lon_values, slots):
+            # _is_valid_coordinate(), inlined: the call costs as much as the check.
+            if not (
+                isinstance(lat, numbers)
+                and isinstance(lon, numbers)
+                and -90 <= lat <= 90
+                and -180 <= lon <= 180
+            ):
+                add_cell(0)
+                invalid += 1
+            elif slot >= 0:
+                # Slot 0 (no match) holds cell 0.
+                add_cell(slot_cells[slot])
+            else:
+                cell = point_keys.get((lat, lon))
+                if cell is None:
+                    if coverage is not None and not coverage.covers(lat, lon):
+                        cell = 0
+                    else:
+                        cell = latlng_to_cell(lat, lon, resolution)
+                    point_keys[lat, lon] = cell
+                if not cell:
+                    rejected += 1
+                add_cell(cell)
+
+        distinct_cells = set(point_cells)
+        distinct_cells.discard(0)
+        matches = self._match_cells(distinct_cells, resolution, opts)
+
+        # Stores loaded together share one attribute table, so codes pass straight
+        # through. Only mixed sources (e.g. partial test overrides) need re-basing.
+        tables: Dict[int, Tuple[AttributeTable, int]] = {}
+        for _, table, _, _ in matches.values():
+            if id(table) not in tables:
+                offset = sum(len(known) for known, _ in tables.values())
+                tables[id(table)] = (table, offset)
+        attributes: Sequence[LocationRow]
+        if len(tables) == 1:
+            attributes = next(iter(tables.values()))[0]
+        else:
+            attributes = [row for table, _ in tables.values() for row in table]
+
+        # Spread the per-cell matches over the points as integer columns.
+        matched_cells: Dict[int, int] = {}
+        codes: Dict[int, int] = {}
+        kind_codes: Dict[int, int] = {}
+        for cell, (matched_cell, table, code, kind_code) in matches.items():
+            matched_cells[cell] = matched_cell
+            codes[cell] = code + tables[id(table)][1]
+            kind_codes[cell] = kind_code
+        result = BatchGeocodeResult(
+            codes=array("i", map(codes.get, point_cells, itertools.repeat(-1))),
+            attributes=attributes,
+            cells=array("Q", map(matched_cells.get, point_cells, itertools.repeat(0))),
+            kind_codes=array("b", map(kind_codes.get, point_cells, itertools.repeat(-1))),
+        )
+
+        if timed:
+            elapsed = time.perf_counter() - start_time
+            if opts.debug:
+                print(
+                    f"[lakhua][debug] batch of {len(result)} points "
+                    f"({len(matches)} matched cells) took {elapsed * 1000:.3f}ms"
+                )
+            if observer is not None:
+                if rejected:
+                    observer.on_out_of_coverage(rejected)
+                observer.on_batch(result.matched_resolution, result.match_kind, invalid, elapsed)
+
+        return result
+
+    @overload
+    def geocode_iter(
+        self,
+        points: Iterable[Any],
+        options: Optional[GeocodeOptions] = None,
+        *,
+        chunk_size: int = ...,
+        lat_key: str = ...,
+        lon_key: str = ...,
+        with_points: Literal[False] = ...,
+    ) -> Iterator[Optional[GeocodeResult]]: ...
+
+    @overload
+    def geocode_iter(
+        self,
+        points: Iterable[Any],
+        options: Optional[GeocodeOptions] = None,
+        *,
+        chunk_size: int = ...,
+        lat_key: str = ...,
+        lon_key: str = ...,
+        with_points: Literal[True],
+    ) -> Iterator[Tuple[Any, Optional[GeocodeResult]]]: ...
+
+    def geocode_iter(
+        self,
+        points: Iterable[Any],
+        options: Optional[GeocodeOptions] = None,
+        *,
+        chunk_size: int = 1024,
+        lat_key: str = "lat",
+        lon_key: str = "lon",
+        with_points: bool = False,
+    ) -> Union[Iterator[Optional[GeocodeResult]], Iterator[Tuple[Any, Optional[GeocodeResult]]]]:
+        """
+        Lazily geocode a stream of points, one fixed-size chunk at a time.
+
+        Sits between geocode() and geocode_many(): points are pulled from any
+        iterable (including unbounded ones such as a message consumer) chunk_size
+        at a time, each chunk is looked up in bulk, and results are yielded in
+        input order. Only one chunk is held in memory, however long the stream.
+        Each chunk is read in full before its first result is yielded, so on a
+        slow stream a smaller chunk_size gives lower latency.
+
+        Args:
+            points: Iterable of (lat, lon) tuples or lists, mappings with lat_key
+                and lon_key entries, or objects with lat_key and lon_key attributes.
+                Points with missing or invalid coordinates yield None.
+            options: Optional settings to control resolution and fallback behavior.
+            chunk_size: Number of points looked up together.
+            lat_key: Key or attribute name holding the latitude.
+            lon_key: Key or attribute name holding the longitude.
+            with_points: When True, yield (point, result) pairs instead of results,
+                so streamed inputs stay attached to their results.
+
+        Returns:
+            Iterator over the result (or (point, result) pair) of each point, where
+            each result is what geocode() would return for that point.
+
+        Raises:
+            ValueError: If chunk_size is less than 1.
+
+        Example:
+            >>> messages = ({"id": i, "lat": 28.61, "lon": 77.21} for i in range(3))
+            >>> for message, result in geocoder.geocode_iter(messages, with_points=True):
+            ...     print(message["id"], result.city if result else None)
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        opts = options or GeocodeOptions()
+        chunks = self._iter_chunks(iter(points), opts, chunk_size, lat_key, lon_key)
+        if with_points:
+            return itertools.chain.from_iterable(chunks)
+        return (result for chunk in chunks for _, result in chunk)
+
+    def _iter_chunks(
+        self,
+        points: Iterator[Any],
+        opts: GeocodeOptions,
+        chunk_size: int,
+        lat_key: str,
+        lon_key: str,
+    ) -> Iterator[List[Tuple[Any, Optional[GeocodeResult]]]]:
+        """Internal generator behind geocode_iter(): pairs each chunk's points with results."""
+        while True:
+            chunk = list(itertools.islice(points, chunk_size))
+            if not chunk:
+                return
+            coordinates = [_point_coordinates(point, lat_key, lon_key) for point in chunk]
+            results = self._geocode_points(
+                [lat for lat, _ in coordinates], [lon for _, lon in coordinates], opts
+            )
+            yield list(zip(chunk, results))
+
+    def _match_cells(
+        self,
+        cells: Iterable[int],
+        resolution: int,
+        opts: GeocodeOptions,
+    ) -> Dict[int, _CellMatch]:
+        """
+        Internal bulk lookup of distinct integer H3 cells, all at the same resolution.
+
+        With fallback enabled at the finest resolution, each cell is resolved by
+        one search in the fallback index. Otherwise every cell is probed against
+        the store for its own resolution first, and only the cells that miss are
+        mapped to their parents and probed again. With nearest_distance set, cells
+        that still miss are answered from the gap-fill index.
+
+        Args:
+            cells: Distinct integer H3 cells at the given resolution.
+            resolution: Resolution shared by all cells (already clamped).
+            opts: Lookup options (fallback, nearest_distance, and debug are honored).
+
+        Returns:
+            Mapping from input cell to (matched integer cell, attribute table,
+            attribute code, index of the match kind in MATCH_KINDS).
+            Cells without any match are omitted.
+        """
+        matches: Dict[int, _CellMatch] = {}
+        pending: List[int] = []
+        if opts.fallback and resolution == MAX_RESOLUTION and not opts.debug:
+            index = self._data_loader.load_fallback_index()
+            for cell in cells:
+                store, position, _, match_kind = index.find(cell)
+                if position >= 0:
+                    matches[cell] = (
+                        store.cell_at(position),
+                        store.attributes,
+                        store.code_at(position),
+                        _KIND_CODES[match_kind],
+                    )
+                else:
+                    pending.append(cell)
+        else:
+            end_resolution = MIN_RESOLUTION if opts.fallback else resolution
+            exact, parent = _KIND_CODES["exact"], _KIND_CODES["parent"]
+            pending = list(cells)
+            for candidate_resolution in range(resolution, end_resolution - 1, -1):
+                if not pending:
+                    break
+                store = self._data_loader.load_resolution_store(candidate_resolution, opts.debug)
+                misses: List[int] = []
+                for cell in pending:
+                    candidate = (
+                        cell
+                        if candidate_resolution == resolution
+                        else cell_to_parent(cell, candidate_resolution)
+                    )
+                    position = store.find(candidate)
+                    if position >= 0:
+                        matches[cell] = (
+                            candidate,
+                            store.attributes,
+                            store.code_at(position),
+                            exact if candidate_resolution == resolution else parent,
+                        )
+                    else:
+                        misses.append(cell)
+                pending = misses
+
+        if opts.fallback and opts.nearest_distance:
+            for cell in pending:
+                found = self._find_nearest(cell, resolution, opts)
+                if found is not None:
+                    store, position, _ = found
+                    matches[cell] = (
+                        store.cell_at(position),
+                        store.attributes,
+                        store.code_at(position),
+                        _KIND_CODES["nearest"],
+                    )
+
+        return matches
 
 
 # Default geocoder instance used by the top-level geocode() and geocode_h3() functions
 default_geocoder = ReverseGeocoder.get_instance()
-
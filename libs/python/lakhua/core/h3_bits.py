@@ -0,0 +1,98 @@
+"""
+H3 bit arithmetic on integer cell IDs.
+
+An H3 cell ID is a 64-bit integer: bits 52-55 hold the resolution and the low
+45 bits hold fifteen 3-bit digits, one per resolution, with unused digits set
+to 7. Deriving a parent cell therefore only needs a mask, which is cheaper than
+a round trip through the h3 library or through hex strings on hot lookup paths.
+These helpers assume valid cell IDs; validate untrusted input with h3 first.
+"""
+
+from typing import List, Tuple
+
+RESOLUTION_SHIFT: int = 52
+"""Position of the 4-bit resolution field, for vectorized (cell >> RESOLUTION_SHIFT) & 0xF."""
+
+_RESOLUTION_MASK = 0xF << RESOLUTION_SHIFT
+_MAX_H3_RESOLUTION = 15
+_BASE_CELL_SHIFT = 45
+_DIGITS = range(7)
+_PENTAGON_DIGITS = (0, 2, 3, 4, 5, 6)
+
+_PENTAGON_BASE_CELLS = frozenset({4, 14, 24, 38, 49, 58, 63, 72, 83, 97, 107, 117})
+
+PARENT_KEEP_MASK: int = ~_RESOLUTION_MASK
+"""Bits to keep from a child cell when computing its parent (everything but the resolution)."""
+
+PARENT_SET_MASKS: Tuple[int, ...] = tuple(
+    (resolution << RESOLUTION_SHIFT) | ((1 << (3 * (_MAX_H3_RESOLUTION - resolution))) - 1)
+    for resolution in range(_MAX_H3_RESOLUTION + 1)
+)
+"""Per target resolution: bits to set (resolution field and unused digits) for the parent."""
+
+
+def cell_resolution(cell: int) -> int:
+    """
+    Read the resolution of an integer H3 cell ID.
+
+    Args:
+        cell: Valid H3 cell ID as an integer.
+
+    Returns:
+        Resolution between 0 and 15.
+    """
+    return (cell & _RESOLUTION_MASK) >> RESOLUTION_SHIFT
+
+
+def cell_to_parent(cell: int, resolution: int) -> int:
+    """
+    Compute the parent of an integer H3 cell ID at a coarser resolution.
+
+    Equivalent to h3.cell_to_parent for valid cells, using two bitwise operations.
+
+    Args:
+        cell: Valid H3 cell ID as an integer.
+        resolution: Target resolution, not finer than the cell's own resolution.
+
+    Returns:
+        Parent cell ID as an integer (the cell itself at its own resolution).
+    """
+    return (cell & PARENT_KEEP_MASK) | PARENT_SET_MASKS[resolution]
+
+
+def cell_to_children(cell: int, resolution: int) -> List[int]:
+    """
+    List the children of an integer H3 cell ID at a finer resolution.
+
+    Fills every unused digit between the two resolutions with 0-6, except that
+    a pentagon has no child with digit 1 (the deleted k-axis subsequence), so
+    pentagon descendants yield only valid cells, as h3.cell_to_children does.
+
+    Args:
+        cell: Valid H3 cell ID as an integer.
+        resolution: Target resolution, not coarser than the cell's own resolution.
+
+    Returns:
+        Child cell IDs as integers, in ascending order.
+    """
+    parent_resolution = cell_resolution(cell)
+    base = (cell & PARENT_KEEP_MASK) | (resolution << RESOLUTION_SHIFT)
+    # A cell is a pentagon when its base cell is one and all its digits are 0;
+    # the center child (digit 0) of a pentagon is again a pentagon.
+    digit_bits = 3 * parent_resolution
+    digits = (cell >> (3 * _MAX_H3_RESOLUTION - digit_bits)) & ((1 << digit_bits) - 1)
+    base_cell = (cell >> _BASE_CELL_SHIFT) & 0x7F
+    is_pentagon = base_cell in _PENTAGON_BASE_CELLS and digits == 0
+    pentagon = base if is_pentagon else -1
+    children = [base]
+    for digit_resolution in range(parent_resolution + 1, resolution + 1):
+        shift = 3 * (_MAX_H3_RESOLUTION - digit_resolution)
+        clear = ~(7 << shift)
+        children = [
+            (child & clear) | (digit << shift)
+            for child in children
+            for digit in (_PENTAGON_DIGITS if child == pentagon else _DIGITS)
+        ]
+        if is_pentagon:
+            pentagon &= clear
+    return children
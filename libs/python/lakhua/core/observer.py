@@ -0,0 +1,212 @@
+"""
+Lookup and load instrumentation for lakhua.
+
+Install an observer with ReverseGeocoder.set_observer() to receive load events,
+lookup latencies, match kinds, and rejected inputs. StatsCollector is a built-in
+observer that keeps counters and a latency histogram you can snapshot and export
+to your metrics system. With no observer installed (the default), lookups don't
+time themselves or record anything.
+
+Example:
+    >>> from lakhua import StatsCollector, default_geocoder, geocode
+    >>> stats = StatsCollector()
+    >>> default_geocoder.set_observer(stats)
+    >>> geocode(28.6139, 77.2090)
+    >>> stats.snapshot().hits
+    {5: 1}
+"""
+
+import bisect
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from lakhua.types import GeocodeResult, InvalidKind, LoadEvent, MatchKind, StatsSnapshot
+
+LATENCY_BOUNDS: Tuple[float, ...] = (
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    1e-2,
+    1e-1,
+    float("inf"),
+)
+"""Upper bounds in seconds of StatsCollector's single-lookup latency buckets."""
+
+
+class GeocodeObserver:
+    """
+    Receives instrumentation events from the geocoder and data loader.
+
+    Subclass it and override the methods you need; the others do nothing.
+    Callbacks run synchronously on the thread doing the lookup, possibly on
+    several threads at once, so keep them short, thread-safe, and never raise.
+    """
+
+    def on_load(self, event: LoadEvent) -> None:
+        """
+        Called after a resolution store or lookup index is loaded or built.
+
+        Args:
+            event: What was loaded, from where, and how long it took.
+        """
+
+    def on_lookup(self, result: Optional[GeocodeResult], seconds: float) -> None:
+        """
+        Called after each valid single-point lookup (geocode() or geocode_h3()).
+
+        Args:
+            result: The lookup result, or None when nothing matched.
+            seconds: Time the lookup took, including any data loading it triggered.
+        """
+
+    def on_invalid(self, kind: InvalidKind) -> None:
+        """
+        Called when a single-point lookup rejects its input.
+
+        Args:
+            kind: Why the input was rejected.
+        """
+
+    def on_out_of_coverage(self, count: int) -> None:
+        """
+        Called when valid points are answered as misses by the coverage pre-filter.
+
+        Those points lie where no covered cell reaches, so they skip the H3
+        conversion and store searches. Each is also reported as a miss, by
+        on_lookup() or on_batch().
+
+        Args:
+            count: Points rejected (1 for a single lookup, or a bulk lookup's total).
+        """
+
+    def on_batch(
+        self,
+        matched_resolution: Sequence[Optional[int]],
+        match_kind: Sequence[Optional[MatchKind]],
+        invalid: int,
+        seconds: float,
+    ) -> None:
+        """
+        Called after each bulk lookup (geocode_many(), a geocode_iter() chunk, or a
+        micro-batch of geocode_async() calls).
+
+        Args:
+            matched_resolution: Matched resolution per point, None where unmatched.
+            match_kind: Match kind per point, None where unmatched.
+            invalid: Points rejected for invalid coordinates (also None above).
+            seconds: Time the bulk lookup took.
+        """
+
+
+class StatsCollector(GeocodeObserver):
+    """
+    Built-in observer keeping lookup counters and a latency histogram.
+
+    Updates take a lock, costing well under a microsecond per lookup. Read the
+    counters with snapshot(); reset() starts counting afresh.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        """Internal helper that zeroes every counter (caller holds the lock or owns self)."""
+        self._lookups = 0
+        self._batch_points = 0
+        self._batches = 0
+        self._hits: Dict[int, int] = {}
+        self._kinds: Dict[Optional[str], int] = {}
+        self._invalid: Dict[str, int] = {}
+        self._out_of_coverage = 0
+        self._latency_counts: List[int] = [0] * len(LATENCY_BOUNDS)
+        self._latency_sum = 0.0
+        self._batch_seconds = 0.0
+        self._loads: List[LoadEvent] = []
+
+    def on_load(self, event: LoadEvent) -> None:
+        with self._lock:
+            self._loads.append(event)
+
+    def on_lookup(self, result: Optional[GeocodeResult], seconds: float) -> None:
+        bucket = bisect.bisect_left(LATENCY_BOUNDS, seconds)
+        with self._lock:
+            self._lookups += 1
+            self._latency_counts[bucket] += 1
+            self._latency_sum += seconds
+            if result is None:
+                self._kinds[None] = self._kinds.get(None, 0) + 1
+            else:
+                resolution = result.matched_resolution
+                self._hits[resolution] = self._hits.get(resolution, 0) + 1
+                self._kinds[result.match_kind] = self._kinds.get(result.match_kind, 0) + 1
+
+    def on_invalid(self, kind: InvalidKind) -> None:
+        with self._lock:
+            self._lookups += 1
+            self._invalid[kind] = self._invalid.get(kind, 0) + 1
+
+    def on_out_of_coverage(self, count: int) -> None:
+        with self._lock:
+            self._out_of_coverage += count
+
+    def on_batch(
+        self,
+        matched_resolution: Sequence[Optional[int]],
+        match_kind: Sequence[Optional[MatchKind]],
+        invalid: int,
+        seconds: float,
+    ) -> None:
+        hits = Counter(matched_resolution)
+        kinds = Counter(match_kind)
+        # Invalid points are unmatched too; count them as invalid, not as misses.
+        kinds[None] -= invalid
+        with self._lock:
+            self._batches += 1
+            self._batch_points += len(matched_resolution)
+            self._batch_seconds += seconds
+            for resolution, count in hits.items():
+                if resolution is not None:
+                    self._hits[resolution] = self._hits.get(resolution, 0) + count
+            for kind, count in kinds.items():
+                self._kinds[kind] = self._kinds.get(kind, 0) + count
+            if invalid:
+                self._invalid["coordinates"] = self._invalid.get("coordinates", 0) + invalid
+
+    def snapshot(self) -> StatsSnapshot:
+        """
+        Copy the current counters.
+
+        Returns:
+            Immutable snapshot; later lookups don't change it.
+        """
+        with self._lock:
+            return StatsSnapshot(
+                lookups=self._lookups,
+                batch_points=self._batch_points,
+                batches=self._batches,
+                hits=dict(sorted(self._hits.items())),
+                fallbacks=self._kinds.get("parent", 0),
+                nearest=self._kinds.get("nearest", 0),
+                misses=self._kinds.get(None, 0),
+                out_of_coverage=self._out_of_coverage,
+                invalid=dict(self._invalid),
+                latency_bounds=LATENCY_BOUNDS,
+                latency_counts=tuple(self._latency_counts),
+                latency_sum=self._latency_sum,
+                batch_seconds=self._batch_seconds,
+                loads=tuple(self._loads),
+            )
+
+    def reset(self) -> None:
+        """Zero every counter and forget recorded load events."""
+        with self._lock:
+            self._reset()
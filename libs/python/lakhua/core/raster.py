@@ -0,0 +1,314 @@
+"""
+Latitude/longitude raster for H3-free coordinate lookups.
+
+A default geocode() spends most of its time converting the point to an H3 cell.
+This module precomputes the answer on a regular latitude/longitude grid over the
+data's coverage: every pixel whose four corners fall in the same resolution-5
+cell lies inside that cell (cells are convex), so it stores the cell's final
+match as a small integer. A lookup is then two multiplications and an array
+index. Pixels that straddle a cell boundary keep a match only when every cell
+they can touch resolves to it (e.g. open sea, or children sharing a parent
+match); the rest are marked unresolved and looked up through H3 as usual, so
+answers stay exact. It's opt-in via
+ReverseGeocoder.enable_raster(); you typically don't use it directly.
+"""
+
+import math
+import random
+import time
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import h3.api.basic_int as h3_int
+
+from lakhua.core.constants import MAX_RESOLUTION
+from lakhua.core.data_loader import DataLoader, default_data_loader
+from lakhua.core.fallback_index import FallbackIndex
+from lakhua.types import GeocodeResult, RasterReport
+
+DEFAULT_RASTER_STEP = 0.02
+"""Default grid step in degrees (about 2.2 km of latitude)."""
+
+_KM_PER_DEGREE = 111.32  # length of a degree of latitude, and at most of longitude
+_MIN_EDGE_KM = 4.8  # half the average resolution-5 edge, allowing for distortion
+
+MIN_RASTER_STEP = 0.001
+"""Smallest grid step accepted; finer grids take minutes and gigabytes to build."""
+
+
+class RasterIndex:
+    """
+    Grid of pixels over the coverage area, each holding a result slot.
+
+    Slot 0 is "no match", slots 1 and up index results, and the largest value of
+    the array type marks pixels that must be looked up through H3. Slots take
+    two bytes per pixel (four if the data has 65,534 or more distinct matches).
+    cells holds, per slot, a resolution-5 cell whose fallback match is that
+    slot's result, so bulk lookups can resolve raster hits by cell.
+
+    The index remembers the DataLoader generation it was built from; callers
+    compare it to skip a raster that no longer matches the data.
+    """
+
+    __slots__ = (
+        "step",
+        "rows",
+        "cols",
+        "min_lat",
+        "min_lon",
+        "generation",
+        "build_seconds",
+        "results",
+        "cells",
+        "_pixels",
+        "_unresolved",
+        "_inverse_step",
+        "_fallback_index",
+    )
+
+    def __init__(
+        self,
+        fallback_index: FallbackIndex,
+        step: float = DEFAULT_RASTER_STEP,
+        generation: int = 0,
+    ) -> None:
+        """
+        Rasterize the coverage of a fallback index.
+
+        Args:
+            fallback_index: Index resolving resolution-5 cells to their final match.
+            step: Grid step in degrees of latitude and longitude.
+            generation: DataLoader generation the fallback index belongs to.
+
+        Raises:
+            ValueError: If step is smaller than MIN_RASTER_STEP or not finite.
+        """
+        if not math.isfinite(step) or step < MIN_RASTER_STEP:
+            raise ValueError(f"step must be at least {MIN_RASTER_STEP} degrees, got {step}")
+        start_time = time.perf_counter()
+        if len(fallback_index):
+            # The coverage filter's bounding box holds every cell, with a little to
+            # spare. Snapped outwards to whole steps, so the same step always lines
+            # up the same grid.
+            coverage = fallback_index.coverage
+            min_lat = math.floor(coverage.min_lat / step) * step
+            min_lon = math.floor(coverage.min_lon / step) * step
+            rows = math.ceil((coverage.max_lat - min_lat) / step)
+            cols = math.ceil((coverage.max_lon - min_lon) / step)
+        else:
+            min_lat = min_lon = 0.0
+            rows = cols = 0
+
+        # A pixel holds a single cell's match, so there are at most len(cells) slots.
+        typecode = "H" if len(fallback_index) < 0xFFFF - 1 else "I"
+        pixels: array[int] = array(typecode)
+        unresolved = (1 << (8 * pixels.itemsize)) - 1
+        results: List[Optional[GeocodeResult]] = [None]
+        slot_cells: List[int] = [0]
+        result_slots: Dict[GeocodeResult, int] = {}
+        cell_slots: Dict[int, int] = {}
+        ring_slots: Dict[int, int] = {}
+        # Cells that don't touch each other are at least one edge apart, so a pixel
+        # narrower than that only meets cells adjacent to its corners' cells.
+        use_rings = step * math.sqrt(2) * _KM_PER_DEGREE < _MIN_EDGE_KM
+
+        def cell_slot(cell: int) -> int:
+            slot = cell_slots.get(cell)
+            if slot is None:
+                result = fallback_index.lookup(cell)
+                if result is None:
+                    slot = 0
+                else:
+                    slot = result_slots.setdefault(result, len(results))
+                    if slot == len(results):
+                        results.append(result)
+                        slot_cells.append(cell)
+                cell_slots[cell] = slot
+            return slot
+
+        def ring_slot(cell: int) -> int:
+            slot = ring_slots.get(cell)
+            if slot is None:
+                slots = {cell_slot(neighbor) for neighbor in h3_int.grid_disk(cell, 1)}
+                slot = ring_slots[cell] = slots.pop() if len(slots) == 1 else unresolved
+            return slot
+
+        latlng_to_cell = h3_int.latlng_to_cell
+        lons = [min_lon + col * step for col in range(cols + 1)]
+
+        def corner_cells(row: int) -> List[int]:
+            lat = min_lat + row * step
+            return [latlng_to_cell(lat, lon, MAX_RESOLUTION) for lon in lons]
+
+        lower = corner_cells(0) if rows else []
+        for row in range(rows):
+            upper = corner_cells(row + 1)
+            for cell, right, above, corner in zip(lower, lower[1:], upper, upper[1:]):
+                if cell == right == above == corner:
+                    # Cells are convex, so the whole pixel lies in the corners' cell.
+                    pixels.append(cell_slot(cell))
+                elif use_rings:
+                    # Straddles cells, but every cell it can meet has the same match.
+                    pixels.append(ring_slot(cell))
+                else:
+                    pixels.append(unresolved)
+            lower = upper
+
+        self.step = step
+        self.rows: int = rows
+        self.cols: int = cols
+        self.min_lat: float = min_lat
+        self.min_lon: float = min_lon
+        self.generation = generation
+        self.results = results
+        self.cells = slot_cells
+        self._pixels: array[int] = pixels
+        self._unresolved = unresolved
+        self._inverse_step = 1.0 / step
+        self._fallback_index = fallback_index
+        self.build_seconds = time.perf_counter() - start_time
+
+    @classmethod
+    def from_loader(
+        cls, data_loader: Optional[DataLoader] = None, step: float = DEFAULT_RASTER_STEP
+    ) -> "RasterIndex":
+        """
+        Rasterize the data a loader currently serves.
+
+        Args:
+            data_loader: Loader to read the fallback index from; defaults to the
+                shared loader.
+            step: Grid step in degrees of latitude and longitude.
+
+        Returns:
+            Raster tagged with the loader's current generation.
+        """
+        loader = data_loader or default_data_loader
+        generation = loader.generation
+        return cls(loader.load_fallback_index(), step, generation)
+
+    def find(self, lat: float, lon: float) -> int:
+        """
+        Find the result slot for valid coordinates.
+
+        Args:
+            lat: Latitude in decimal degrees.
+            lon: Longitude in decimal degrees.
+
+        Returns:
+            Index into results (0 means no match), or -1 when the point lies
+            outside the grid or in a pixel that straddles a cell boundary and
+            has to be looked up through H3.
+        """
+        row = (lat - self.min_lat) * self._inverse_step
+        col = (lon - self.min_lon) * self._inverse_step
+        if 0.0 <= row < self.rows and 0.0 <= col < self.cols:
+            slot = self._pixels[int(row) * self.cols + int(col)]
+            if slot != self._unresolved:
+                return slot
+        return -1
+
+    def find_many(self, lats: Sequence[Any], lons: Sequence[Any]) -> List[int]:
+        """
+        Find the result slots of many points at once, like find() per point.
+
+        Attribute lookups are hoisted out of the loop, so each point costs a
+        fraction of a find() call. Values that aren't numbers get -1 as well.
+
+        Args:
+            lats: Latitudes in decimal degrees.
+            lons: Longitudes in decimal degrees, same length as lats.
+
+        Returns:
+            Result slot per point, as returned by find().
+        """
+        min_lat, min_lon, inverse_step = self.min_lat, self.min_lon, self._inverse_step
+        rows, cols, pixels, unresolved = self.rows, self.cols, self._pixels, self._unresolved
+        slots: List[int] = []
+        append = slots.append
+        for lat, lon in zip(lats, lons):
+            try:
+                row = (lat - min_lat) * inverse_step
+                col = (lon - min_lon) * inverse_step
+            except TypeError:
+                append(-1)
+                continue
+            if 0.0 <= row < rows and 0.0 <= col < cols:
+                slot = pixels[int(row) * cols + int(col)]
+                append(-1 if slot == unresolved else slot)
+            else:
+                append(-1)
+        return slots
+
+    @property
+    def memory_bytes(self) -> int:
+        """Size of the pixel array in bytes (results are shared with the stores)."""
+        return len(self._pixels) * self._pixels.itemsize
+
+    def report(self, samples: int = 10_000, seed: int = 0) -> RasterReport:
+        """
+        Measure the raster against the H3 lookup on random points in its grid.
+
+        Args:
+            samples: Number of uniformly drawn points to check.
+            seed: Seed for the point generator, for reproducible reports.
+
+        Returns:
+            Memory, build time, boundary share, and sampled accuracy of the raster.
+        """
+        rng = random.Random(seed)
+        max_lat = self.min_lat + self.rows * self.step
+        max_lon = self.min_lon + self.cols * self.step
+        fast = agreed = 0
+        for _ in range(samples):
+            lat = rng.uniform(self.min_lat, max_lat)
+            lon = rng.uniform(self.min_lon, max_lon)
+            slot = self.find(lat, lon)
+            if slot < 0:
+                # Unresolved pixels go through the H3 lookup, so they always agree.
+                agreed += 1
+                continue
+            fast += 1
+            exact = self._fallback_index.lookup(h3_int.latlng_to_cell(lat, lon, MAX_RESOLUTION))
+            agreed += self.results[slot] == exact
+        unresolved = self._pixels.count(self._unresolved)
+        pixels = len(self._pixels)
+        return RasterReport(
+            step=self.step,
+            rows=self.rows,
+            cols=self.cols,
+            memory_bytes=self.memory_bytes,
+            build_seconds=self.build_seconds,
+            unresolved_share=unresolved / pixels if pixels else 0.0,
+            samples=samples,
+            fast_share=fast / samples if samples else 0.0,
+            accuracy=agreed / samples if samples else 1.0,
+        )
+
+
+def raster_report(
+    steps: Iterable[float],
+    data_loader: Optional[DataLoader] = None,
+    samples: int = 10_000,
+    seed: int = 0,
+) -> List[RasterReport]:
+    """
+    Compare grid steps by building a raster for each and sampling it.
+
+    Use it to pick the step for ReverseGeocoder.enable_raster(): finer steps
+    answer more points without H3 but take quadratically more memory and build time.
+
+    Args:
+        steps: Grid steps in degrees to try.
+        data_loader: Loader whose data is rasterized; defaults to the shared loader.
+        samples: Random points checked per step.
+        seed: Seed for the point generator, for reproducible reports.
+
+    Returns:
+        One report per step, in the given order.
+
+    Example:
+        >>> for report in raster_report([0.05, 0.02, 0.01]):
+        ...     print(report.step, report.memory_bytes, report.fast_share)
+    """
+    return [RasterIndex.from_loader(data_loader, step).report(samples, seed) for step in steps]
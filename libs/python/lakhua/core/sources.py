@@ -0,0 +1,273 @@
+"""
+User-supplied data sources for lakhua reverse geocoding.
+
+By default the DataLoader reads the data files bundled with the package. A
+DataSource points it at other files instead: a directory of per-resolution
+JSON files, or open binary files (e.g. fetched from object storage). Files may
+be plain JSON or gzip- or zstd-compressed JSON; the format is detected from the
+content, not the file name.
+
+Data from a source is validated when it's loaded, and a compiled binary copy is
+cached under a name derived from the source digests, so later processes loading
+the same data memory-map it instead of parsing JSON again.
+"""
+
+import os
+from pathlib import Path
+from typing import IO, Any, Dict, List, Mapping, Optional, Union, cast
+
+from lakhua.core.constants import DATA_FILE_PREFIX, SUPPORTED_RESOLUTIONS
+from lakhua.types import ReverseGeoStore
+
+SourceFile = Union[str, "os.PathLike[str]", IO[bytes]]
+"""A data file: a path, or a binary file object opened for reading."""
+
+SOURCE_SUFFIXES = (".json", ".json.gz", ".json.zst")
+"""File name suffixes DataSource.from_directory() looks for, in order of preference."""
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _zstd_decompress(raw: bytes) -> bytes:
+    """
+    Internal utility to decompress zstd data with whichever implementation is available.
+
+    Raises:
+        ImportError: If neither compression.zstd (Python 3.14+) nor zstandard is installed.
+    """
+    import importlib
+
+    try:
+        zstd = importlib.import_module("compression.zstd")
+    except ImportError:
+        pass
+    else:
+        return cast(bytes, zstd.decompress(raw))
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstd-compressed data needs the zstandard package; "
+            "install it with: pip install lakhua[zstd]"
+        ) from None
+    with zstandard.ZstdDecompressor().stream_reader(raw) as reader:
+        return cast(bytes, reader.read())
+
+
+def validate_store(data: Any, resolution: int, name: str) -> ReverseGeoStore:
+    """
+    Check that parsed JSON has the shape of one resolution's data.
+
+    Args:
+        data: Parsed JSON value.
+        resolution: H3 resolution every key must have.
+        name: Source name used in error messages.
+
+    Returns:
+        data, unchanged, typed as a store.
+
+    Raises:
+        ValueError: If data isn't an object of H3 cells at this resolution mapping
+            to objects of strings, or holds no located cell at all.
+    """
+    import h3
+
+    if not isinstance(data, dict):
+        raise ValueError(f"{name}: expected a JSON object of H3 cells, got {type(data).__name__}")
+    located = 0
+    for h3_index, value in data.items():
+        if not h3.is_valid_cell(h3_index) or h3.get_resolution(h3_index) != resolution:
+            raise ValueError(f"{name}: {h3_index!r} isn't an H3 cell at resolution {resolution}")
+        if not isinstance(value, dict) or not all(
+            isinstance(field, str) for field in value.values()
+        ):
+            raise ValueError(f"{name}: location of {h3_index} must be an object of strings")
+        if value:
+            located += 1
+    if not located:
+        raise ValueError(f"{name}: dataset has no cells at resolution {resolution}")
+    return cast(ReverseGeoStore, data)
+
+
+def parse_store(raw: bytes, resolution: int, name: str) -> ReverseGeoStore:
+    """
+    Decompress (if needed), parse, and validate one resolution's data.
+
+    Args:
+        raw: File contents: JSON, gzip-compressed JSON, or zstd-compressed JSON.
+        resolution: H3 resolution the data is for.
+        name: Source name used in error messages.
+
+    Returns:
+        Dictionary mapping H3 cell IDs to location metadata.
+
+    Raises:
+        ValueError: If the data can't be decompressed or parsed, or fails validate_store().
+        ImportError: If the data is zstd-compressed and no zstd implementation is installed.
+    """
+    import json
+
+    try:
+        if raw.startswith(_GZIP_MAGIC):
+            import gzip
+
+            raw = gzip.decompress(raw)
+        elif raw.startswith(_ZSTD_MAGIC):
+            raw = _zstd_decompress(raw)
+        data = json.loads(raw)
+    except ImportError:
+        raise
+    except Exception as error:  # zlib, zstd, JSON and UTF-8 errors all mean corrupt data
+        raise ValueError(f"{name}: corrupt data file: {error}") from error
+    return validate_store(data, resolution, name)
+
+
+def default_cache_dir() -> Path:
+    """
+    Get the directory compiled data from DataSource objects is cached in.
+
+    Returns:
+        $LAKHUA_CACHE_DIR if set, else lakhua under $XDG_CACHE_HOME, else ~/.cache/lakhua.
+    """
+    configured = os.environ.get("LAKHUA_CACHE_DIR")
+    if configured:
+        return Path(configured)
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    return (Path(cache_home) if cache_home else Path.home() / ".cache") / "lakhua"
+
+
+class DataSource:
+    """
+    Where a DataLoader reads its data from, instead of the bundled data files.
+
+    Give one data file per supported resolution, as a path or as a binary file
+    object. File objects are read once, when the source is created; paths are
+    read on every load, so DataLoader.reload() and DataLoader.watch() pick up
+    changed files.
+
+    Example:
+        >>> source = DataSource({5: "geo/r5.json.gz", 4: open("geo/r4.json", "rb")})
+        >>> loader = DataLoader.from_source(source)
+    """
+
+    def __init__(
+        self,
+        files: Mapping[int, SourceFile],
+        *,
+        cache_dir: Optional[Union[str, "os.PathLike[str]"]] = None,
+        cache: bool = True,
+    ) -> None:
+        """
+        Create a source from one data file per resolution.
+
+        Args:
+            files: Data file for each supported resolution (4 and 5).
+            cache_dir: Directory for compiled copies of the data; defaults to
+                default_cache_dir().
+            cache: When False, always parse the files and never write a cache.
+
+        Raises:
+            ValueError: If files doesn't cover exactly the supported resolutions.
+            FileNotFoundError: If a given path doesn't exist.
+        """
+        if sorted(files) != sorted(SUPPORTED_RESOLUTIONS):
+            raise ValueError(
+                f"need one data file per resolution {sorted(SUPPORTED_RESOLUTIONS)}, "
+                f"got {sorted(files)}"
+            )
+        self._paths: Dict[int, Path] = {}
+        self._contents: Dict[int, bytes] = {}
+        self._names: Dict[int, str] = {}
+        for resolution, file in files.items():
+            if isinstance(file, (str, os.PathLike)):
+                path = Path(file)
+                if not path.is_file():
+                    raise FileNotFoundError(
+                        f"data file for resolution {resolution} not found: {path}"
+                    )
+                self._paths[resolution] = path
+                self._names[resolution] = str(path)
+            else:
+                self._contents[resolution] = file.read()
+                self._names[resolution] = str(getattr(file, "name", f"<r{resolution} data>"))
+        self._cache_dir: Optional[Path] = None
+        if cache:
+            self._cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+
+    @classmethod
+    def from_directory(
+        cls,
+        directory: Union[str, "os.PathLike[str]"],
+        *,
+        cache_dir: Optional[Union[str, "os.PathLike[str]"]] = None,
+        cache: bool = True,
+    ) -> "DataSource":
+        """
+        Create a source from a directory laid out like the bundled data.
+
+        For each resolution r it uses reverse_geo_{r}.json, reverse_geo_{r}.json.gz,
+        or reverse_geo_{r}.json.zst, whichever exists first in that order.
+
+        Args:
+            directory: Directory holding the data files.
+            cache_dir: Directory for compiled copies of the data; defaults to
+                default_cache_dir().
+            cache: When False, always parse the files and never write a cache.
+
+        Returns:
+            Source reading the files in directory.
+
+        Raises:
+            FileNotFoundError: If a resolution has no data file in directory.
+        """
+        root = Path(directory)
+        files: Dict[int, SourceFile] = {}
+        for resolution in SUPPORTED_RESOLUTIONS:
+            candidates = [
+                root / f"{DATA_FILE_PREFIX}{resolution}{suffix}" for suffix in SOURCE_SUFFIXES
+            ]
+            found = [path for path in candidates if path.is_file()]
+            if not found:
+                raise FileNotFoundError(
+                    f"no data file for resolution {resolution} in {root} "
+                    f"(looked for {', '.join(path.name for path in candidates)})"
+                )
+            files[resolution] = found[0]
+        return cls(files, cache_dir=cache_dir, cache=cache)
+
+    def read(self, resolution: int) -> bytes:
+        """
+        Read the raw (possibly compressed) contents of one resolution's data file.
+
+        Args:
+            resolution: Supported H3 resolution.
+
+        Returns:
+            File contents as stored.
+
+        Raises:
+            OSError: If the file can no longer be read.
+        """
+        contents = self._contents.get(resolution)
+        return contents if contents is not None else self._paths[resolution].read_bytes()
+
+    def name(self, resolution: int) -> str:
+        """Describe one resolution's data file (its path or file object name) for messages."""
+        return self._names[resolution]
+
+    @property
+    def paths(self) -> List[Path]:
+        """Data files read from disk on every load (file objects aren't included)."""
+        return [self._paths[resolution] for resolution in sorted(self._paths)]
+
+    @property
+    def cache_dir(self) -> Optional[Path]:
+        """Directory compiled copies are cached in, or None when caching is off."""
+        return self._cache_dir
+
+    def __repr__(self) -> str:
+        files = ", ".join(
+            f"{resolution}: {self._names[resolution]!r}" for resolution in sorted(self._names)
+        )
+        return f"DataSource({{{files}}}, cache_dir={self._cache_dir!r})"
@@ -0,0 +1,418 @@
+"""
+Compact in-memory store backend for lakhua reverse geocoding.
+
+The JSON data files map H3 cell strings to small dictionaries. Keeping that shape
+in memory costs several Python objects per cell, which adds up to tens of MB per
+process. This module keeps the same data as a sorted array of 64-bit integer cell
+IDs plus a parallel array of row indices into an attribute table, and answers
+lookups with a binary search. Attribute rows are dictionary-encoded: each distinct
+(city, state, district, pincode) tuple is stored once in an AttributeTable and
+cells refer to it by a small integer code. You typically don't need to use this
+module directly.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+    overload,
+)
+
+from lakhua.types import GeocodeResult, LocationRow, MatchKind
+
+if TYPE_CHECKING:
+    from lakhua.core.coverage import CoverageFilter
+
+ATTRIBUTE_FIELDS: Tuple[str, ...] = ("city", "state", "district", "pincode")
+"""Location fields stored per cell, in attribute-row order."""
+
+
+def _to_location_row(value: Mapping[str, str]) -> LocationRow:
+    """
+    Internal utility to convert a JSON cell value into an attribute row.
+
+    Args:
+        value: Cell metadata as stored in the JSON data files.
+
+    Returns:
+        Tuple of (city, state, district, pincode). Missing city/state become "".
+    """
+    return (
+        value.get("city", ""),
+        value.get("state", ""),
+        value.get("district"),
+        value.get("pincode"),
+    )
+
+
+class AttributeTable(Sequence[LocationRow]):
+    """
+    Dictionary-encoded table of distinct (city, state, district, pincode) rows.
+
+    Each distinct tuple is stored once and identified by its position (its code).
+    Equal strings across rows share a single string object. Stores for every
+    resolution loaded by the same DataLoader share one table, so a code means the
+    same location tuple no matter which resolution matched.
+
+    Batch callers can use codes as category IDs: grouping rows by code, or by a
+    per-field code from column(), avoids touching the strings at all.
+    """
+
+    __slots__ = ("_rows", "_codes", "_strings", "_columns")
+
+    def __init__(self) -> None:
+        self._rows: List[LocationRow] = []
+        self._codes: Optional[Dict[LocationRow, int]] = {}
+        self._strings: Optional[Dict[str, str]] = {}
+        self._columns: Dict[str, Tuple[List[Optional[str]], array[int]]] = {}
+
+    def intern(self, row: LocationRow) -> int:
+        """
+        Return the code for a row, adding it to the table if it's new.
+
+        Args:
+            row: Tuple of (city, state, district, pincode).
+
+        Returns:
+            Integer code of the row in this table.
+        """
+        if self._codes is None or self._strings is None:
+            self._rebuild_indexes()
+        codes = cast(Dict[LocationRow, int], self._codes)
+        code = codes.get(row)
+        if code is None:
+            strings = cast(Dict[str, str], self._strings)
+            city, state, district, pincode = row
+            interned: LocationRow = (
+                strings.setdefault(city, city),
+                strings.setdefault(state, state),
+                None if district is None else strings.setdefault(district, district),
+                None if pincode is None else strings.setdefault(pincode, pincode),
+            )
+            code = len(self._rows)
+            self._rows.append(interned)
+            codes[interned] = code
+            self._columns.clear()
+        return code
+
+    def seal(self) -> None:
+        """
+        Drop the build-time indexes used by intern() once loading is done.
+
+        The row -> code and string pool dictionaries are only needed while rows
+        are being added; releasing them roughly halves the table's memory. They
+        are rebuilt automatically if intern() is called again later.
+        """
+        self._codes = None
+        self._strings = None
+
+    def materialize(self) -> None:
+        """
+        Decode every row now rather than on first access.
+
+        Rows of an in-memory table already exist, so this only does work for
+        tables backed by a memory-mapped binary store.
+        """
+
+    def _rebuild_indexes(self) -> None:
+        strings: Dict[str, str] = {}
+        for row in self._rows:
+            for value in row:
+                if value is not None:
+                    strings.setdefault(value, value)
+        self._strings = strings
+        self._codes = {row: code for code, row in enumerate(self._rows)}
+
+    def column(self, field: str) -> Tuple[List[Optional[str]], "array[int]"]:
+        """
+        Dictionary-encode a single field across the table.
+
+        Useful for building categorical columns: take the per-row field code with
+        the row's attribute code, then look the value up in the categories list.
+
+        Args:
+            field: One of "city", "state", "district", "pincode".
+
+        Returns:
+            Tuple of (categories, field_codes) where categories holds each distinct
+            value once (None included when present) and field_codes[code] is the
+            category index for the attribute row with that code. The result is
+            computed once and shared by later calls, so don't modify it.
+
+        Raises:
+            ValueError: If field isn't one of the attribute fields.
+        """
+        cached = self._columns.get(field)
+        if cached is not None:
+            return cached
+        if field not in ATTRIBUTE_FIELDS:
+            raise ValueError(
+                f"unknown attribute field {field!r}; expected one of {ATTRIBUTE_FIELDS}"
+            )
+        field_index = ATTRIBUTE_FIELDS.index(field)
+        categories: List[Optional[str]] = []
+        category_codes: Dict[Optional[str], int] = {}
+        field_codes = array("I")
+        for row in self._rows:
+            value = row[field_index]
+            category = category_codes.get(value)
+            if category is None:
+                category = category_codes[value] = len(categories)
+                categories.append(value)
+            field_codes.append(category)
+        self._columns[field] = (categories, field_codes)
+        return categories, field_codes
+
+    @overload
+    def __getitem__(self, code: int) -> LocationRow: ...
+
+    @overload
+    def __getitem__(self, code: slice) -> Sequence[LocationRow]: ...
+
+    def __getitem__(self, code: "int | slice") -> "LocationRow | Sequence[LocationRow]":
+        return self._rows[code]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+def field_categories(
+    attributes: Sequence[LocationRow],
+    field: str,
+) -> Tuple[List[str], List[int]]:
+    """
+    Dictionary-encode one location field of an attribute table for categorical columns.
+
+    Unlike AttributeTable.column(), missing values are not a category: they map
+    to -1, which is how pandas and Arrow mark nulls in dictionary-encoded data.
+
+    Args:
+        attributes: AttributeTable, or BatchGeocodeResult.attributes.
+        field: One of "city", "state", "district", "pincode".
+
+    Returns:
+        Tuple of (categories, lookup) where categories holds each distinct non-None
+        value once and lookup[code] is the category index of the attribute row
+        with that code, or -1 when the field is None in that row.
+
+    Raises:
+        ValueError: If field isn't one of the attribute fields.
+    """
+    if isinstance(attributes, AttributeTable):
+        values, field_codes = attributes.column(field)
+    else:
+        table = AttributeTable()
+        for row in attributes:
+            table._rows.append(row)
+        values, field_codes = table.column(field)
+    if None not in values:
+        return cast(List[str], values), field_codes.tolist()
+    missing = values.index(None)
+    categories = [value for value in values if value is not None]
+    lookup = [
+        -1 if category == missing else category - (category > missing) for category in field_codes
+    ]
+    return categories, lookup
+
+
+class CompactStore(Mapping[str, Dict[str, str]]):
+    """
+    Read-only store of H3 cells kept as sorted uint64 keys with row indices.
+
+    Internally the store holds three flat structures:
+    - cells: sorted H3 cell IDs as unsigned 64-bit integers
+    - rows: for each cell, the code of its row in the attribute table
+    - attributes: the shared AttributeTable of (city, state, district, pincode) rows
+
+    Lookups use find() with an integer cell ID. For backward compatibility the
+    store also behaves like the old Dict[str, Dict[str, str]] mapping, so
+    store.get("8560145bfffffff") still returns a metadata dictionary.
+    """
+
+    __slots__ = ("_cells", "_rows", "_attributes", "_results", "_coverage")
+
+    def __init__(
+        self,
+        cells: Sequence[int],
+        rows: Sequence[int],
+        attributes: AttributeTable,
+    ) -> None:
+        """
+        Wrap prebuilt arrays. Use from_mapping() to build a store from JSON data.
+
+        Args:
+            cells: Sorted H3 cell IDs (array of typecode "Q", or a uint64 memoryview).
+            rows: Attribute code per cell (array of typecode "I", or a uint32 memoryview).
+            attributes: Attribute table the codes refer to.
+        """
+        self._cells = cells
+        self._rows = rows
+        self._attributes = attributes
+        self._results: Dict[str, List[Optional[GeocodeResult]]] = {}
+        self._coverage: Optional[CoverageFilter] = None
+
+    @classmethod
+    def from_mapping(
+        cls,
+        mapping: Mapping[str, Mapping[str, str]],
+        attributes: Optional[AttributeTable] = None,
+    ) -> "CompactStore":
+        """
+        Build a compact store from the JSON shape (H3 string -> metadata dict).
+
+        Cells with empty metadata are skipped, matching how lookups always treated
+        them as misses.
+
+        Args:
+            mapping: Dictionary mapping H3 cell IDs to location metadata.
+            attributes: Table to encode rows into, so several stores can share
+                codes. A new table is created when omitted.
+
+        Returns:
+            A new CompactStore holding the same data.
+        """
+        table = attributes if attributes is not None else AttributeTable()
+        entries = sorted(
+            (int(h3_index, 16), table.intern(_to_location_row(value)))
+            for h3_index, value in mapping.items()
+            if value
+        )
+        cells = array("Q", [cell for cell, _ in entries])
+        rows = array("I", [code for _, code in entries])
+        return cls(cells, rows, table)
+
+    @property
+    def attributes(self) -> AttributeTable:
+        """The attribute table referenced by this store's codes."""
+        return self._attributes
+
+    @property
+    def cells(self) -> Sequence[int]:
+        """Sorted integer H3 cell IDs held by this store."""
+        return self._cells
+
+    @property
+    def codes(self) -> Sequence[int]:
+        """Attribute code per cell, aligned with cells."""
+        return self._rows
+
+    @property
+    def coverage(self) -> "CoverageFilter":
+        """Coverage bitmap of this store's cells, built on first access."""
+        coverage = self._coverage
+        if coverage is None:
+            from lakhua.core.coverage import CoverageFilter
+
+            coverage = self._coverage = CoverageFilter(self._cells)
+        return coverage
+
+    def find(self, cell: int) -> int:
+        """
+        Find the position of an integer H3 cell ID using binary search.
+
+        Args:
+            cell: H3 cell ID as an integer.
+
+        Returns:
+            Position of the cell in the store, or -1 when it isn't present.
+        """
+        cells = self._cells
+        position = bisect_left(cells, cell)
+        if position < len(cells) and cells[position] == cell:
+            return position
+        return -1
+
+    def cell_at(self, position: int) -> int:
+        """Return the integer H3 cell ID stored at a position returned by find()."""
+        return self._cells[position]
+
+    def code_at(self, position: int) -> int:
+        """Return the attribute code for a position returned by find()."""
+        return self._rows[position]
+
+    def row_at(self, position: int) -> LocationRow:
+        """Return the attribute row for a position returned by find()."""
+        return self._attributes[self._rows[position]]
+
+    def result_at(
+        self,
+        position: int,
+        resolution: int,
+        match_kind: MatchKind = "exact",
+    ) -> GeocodeResult:
+        """
+        Return the shared GeocodeResult for a position returned by find().
+
+        Results are immutable, so each cell's result is built once per match kind
+        on first match and the same instance is returned by every later lookup of
+        that cell. The cache lives on the store and is dropped with it when data
+        is reloaded.
+
+        Args:
+            position: Position of the matched cell in this store.
+            resolution: H3 resolution of this store's cells.
+            match_kind: How the lookup reached this cell ("exact", "parent", "nearest").
+
+        Returns:
+            Prebuilt result for the matched cell.
+        """
+        results = self._results.get(match_kind)
+        if results is None:
+            results = self._results[match_kind] = [None] * len(self._cells)
+        result = results[position]
+        if result is None:
+            city, state, district, pincode = self.row_at(position)
+            result = results[position] = GeocodeResult(
+                city=city,
+                state=state,
+                district=district,
+                pincode=pincode,
+                matched_h3=format(self._cells[position], "x"),
+                matched_resolution=resolution,
+                match_kind=match_kind,
+            )
+        return result
+
+    def prebuild_results(self, resolution: int, match_kinds: Sequence[MatchKind]) -> None:
+        """
+        Build the shared result of every cell for the given match kinds now.
+
+        result_at() otherwise builds results on first match, writing into the
+        store's result cache. Prebuilding in a parent process lets forked
+        children read the cache without adding to it.
+
+        Args:
+            resolution: H3 resolution of this store's cells.
+            match_kinds: Match kinds lookups will request from this store.
+        """
+        for match_kind in match_kinds:
+            for position in range(len(self._cells)):
+                self.result_at(position, resolution, match_kind)
+
+    def __getitem__(self, h3_index: str) -> Dict[str, str]:
+        try:
+            cell = int(h3_index, 16)
+        except (TypeError, ValueError):
+            raise KeyError(h3_index) from None
+        position = self.find(cell)
+        if position < 0:
+            raise KeyError(h3_index)
+        return {
+            field: value
+            for field, value in zip(ATTRIBUTE_FIELDS, self.row_at(position))
+            if value is not None
+        }
+
+    def __iter__(self) -> Iterator[str]:
+        return (format(cell, "x") for cell in self._cells)
+
+    def __len__(self) -> int:
+        return len(self._cells)
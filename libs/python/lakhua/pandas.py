@@ -0,0 +1,117 @@
+"""
+pandas integration for lakhua.
+
+geocode_frame() looks up whole coordinate columns in one bulk call and adds the
+location fields as categorical columns, built straight from the dictionary codes
+of the lookup instead of one Python object per row. This module needs pandas
+(pip install pandas) and is only imported when you import it; the core package
+doesn't depend on pandas.
+
+Example:
+    >>> from lakhua.pandas import geocode_frame
+    >>> enriched = geocode_frame(df, lat_col="lat", lon_col="lon")
+    >>> enriched.groupby("state", observed=True).size()
+"""
+
+from typing import Any, Optional, Sequence
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError as error:  # pragma: no cover - exercised only without pandas
+    raise ImportError("lakhua.pandas requires pandas: pip install 'lakhua[pandas]'") from error
+
+from lakhua.core import default_geocoder
+from lakhua.core.h3_bits import RESOLUTION_SHIFT
+from lakhua.core.store import ATTRIBUTE_FIELDS, field_categories
+from lakhua.types import MATCH_KINDS, BatchGeocodeResult, GeocodeOptions
+
+FRAME_FIELDS = (*ATTRIBUTE_FIELDS, "matched_h3", "matched_resolution", "match_kind")
+"""Columns geocode_frame() can add; the first four are added by default."""
+
+
+def _coordinates(frame: Any, column: str) -> Any:
+    """Internal utility to read a coordinate column as float64, with NaN for unparseable values."""
+    values = pd.to_numeric(frame[column], errors="coerce")
+    return values.to_numpy(dtype="float64", na_value=np.nan)
+
+
+def _field_column(batch: BatchGeocodeResult, codes: Any, cells: Any, field: str) -> Any:
+    """
+    Internal utility to build one output column from a batch result.
+
+    Location fields become pandas Categoricals whose categories are every value
+    in the loaded dataset, so frames enriched separately share categories and
+    concatenate without converting back to strings. Every column is computed
+    from the batch's integer arrays; only matched_h3 formats strings, once per
+    distinct cell.
+    """
+    if field in ATTRIBUTE_FIELDS:
+        categories, lookup = field_categories(batch.attributes, field)
+        # Unmatched rows have code -1, which indexes the trailing -1 (missing) slot.
+        field_codes = np.asarray([*lookup, -1], dtype=np.int32)[codes]
+        return pd.Categorical.from_codes(field_codes, categories=categories)
+    if field == "matched_resolution":
+        resolutions = ((cells >> RESOLUTION_SHIFT) & 0xF).astype(np.int8)
+        return pd.arrays.IntegerArray(resolutions, cells == 0)
+    if field == "match_kind":
+        kind_codes = np.frombuffer(batch.kind_codes, dtype=np.int8)
+        return pd.Categorical.from_codes(kind_codes, categories=list(MATCH_KINDS))
+    distinct, positions = np.unique(cells, return_inverse=True)
+    names = [format(cell, "x") if cell else None for cell in distinct.tolist()]
+    return pd.array(np.asarray(names, dtype=object)[positions], dtype="string")
+
+
+def geocode_frame(
+    frame: Any,
+    lat_col: str = "lat",
+    lon_col: str = "lon",
+    options: Optional[GeocodeOptions] = None,
+    *,
+    fields: Sequence[str] = ATTRIBUTE_FIELDS,
+    prefix: str = "",
+) -> Any:
+    """
+    Reverse geocode the coordinate columns of a DataFrame.
+
+    Returns a copy of frame with one column per requested field. city, state,
+    district, and pincode are categorical; rows with invalid coordinates or no
+    match hold missing values.
+
+    Args:
+        frame: pandas DataFrame holding the coordinates.
+        lat_col: Name of the latitude column.
+        lon_col: Name of the longitude column.
+        options: Optional settings to control resolution and fallback behavior.
+        fields: Columns to add, any of FRAME_FIELDS. matched_resolution is a
+            nullable Int8 column, match_kind a categorical, and matched_h3 a
+            string column.
+        prefix: Prepended to every added column name, e.g. "geo_".
+
+    Returns:
+        New DataFrame with the added columns, same index and row order as frame.
+
+    Raises:
+        KeyError: If a coordinate column is missing.
+        ValueError: If fields holds an unknown column name.
+
+    Example:
+        >>> df = pd.DataFrame({"lat": [28.6139, 19.076], "lon": [77.2090, 72.8777]})
+        >>> geocode_frame(df)["city"].tolist()
+        ['New Delhi', 'Mumbai']
+    """
+    unknown = [field for field in fields if field not in FRAME_FIELDS]
+    if unknown:
+        raise ValueError(f"unknown fields {unknown}; expected any of {FRAME_FIELDS}")
+
+    batch = default_geocoder.geocode_many(
+        _coordinates(frame, lat_col), _coordinates(frame, lon_col), options
+    )
+    # Views of the batch's arrays, not copies.
+    codes = np.frombuffer(batch.codes, dtype=np.int32)
+    cells = np.frombuffer(batch.cells, dtype=np.uint64)
+    result = frame.copy()
+    for field in fields:
+        column = _field_column(batch, codes, cells, field)
+        result[prefix + field] = pd.Series(column, index=frame.index, copy=False)
+    return result
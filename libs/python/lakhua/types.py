@@ -5,11 +5,31 @@ These dataclasses define the structure of location results and options you can
 pass to geocoding functions.
 """
 
+import sys
+from array import array
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
 
+from lakhua.core.h3_bits import cell_resolution
 
-@dataclass
+# __slots__ support in dataclasses needs Python 3.10+; older versions get regular instances.
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+MatchKind = Literal["exact", "parent", "nearest"]
+"""
+How a lookup found its match.
+
+- "exact": the cell at the requested resolution has data.
+- "parent": the cell had no data and a coarser parent cell matched.
+- "nearest": neither matched and the nearest covered cell was used instead
+  (only with GeocodeOptions.nearest_distance > 0).
+"""
+
+MATCH_KINDS: Tuple[MatchKind, ...] = ("exact", "parent", "nearest")
+"""Match kinds in the order BatchGeocodeResult.kind_codes numbers them."""
+
+
+@dataclass(frozen=True, **_SLOTS)
 class GeocodeResult:
     """
     Complete result from a geocoding lookup, including match metadata.
@@ -17,6 +37,9 @@ class GeocodeResult:
     This is the main data structure returned by geocode() and geocode_h3(),
     containing location details (city, state, etc.) plus metadata about which
     H3 cell was matched and at what resolution.
+
+    Results are immutable. Lookups that match the same cell return the same
+    shared instance, so don't rely on identity to tell two calls apart.
     """
 
     city: str
@@ -47,6 +70,14 @@ class GeocodeResult:
     pincode: Optional[str] = None
     """Postal code (PIN code), when available in the dataset."""
 
+    match_kind: MatchKind = "exact"
+    """
+    Which kind of match produced this result: "exact", "parent", or "nearest".
+
+    For "nearest", matched_h3 is the covered cell closest to your input rather
+    than a cell containing it.
+    """
+
 
 # Kept for backward compatibility, but GeocodeResult is the main type
 LocationDetails = GeocodeResult
@@ -79,6 +110,17 @@ class GeocodeOptions:
     the chance of finding a match, though at lower geographic precision.
     """
 
+    nearest_distance: int = 0
+    """
+    Maximum H3 grid distance (k-ring) to search for the nearest covered cell.
+
+    When greater than 0 and both the exact cell and its parent have no data,
+    lakhua returns the closest cell that does, as long as it's within this many
+    rings, and marks the result with match_kind "nearest". Useful on highways and
+    in rural areas between covered cells. Default is 0 (disabled). Values above
+    MAX_NEAREST_DISTANCE are capped, and nothing happens when fallback is False.
+    """
+
     debug: bool = False
     """
     Enable debug logging to see timing information for data loading and lookups.
@@ -88,6 +130,345 @@ class GeocodeOptions:
     """
 
 
+LocationRow = Tuple[str, str, Optional[str], Optional[str]]
+"""
+One dictionary-encoded attribute row: (city, state, district, pincode).
+
+Batch results refer to these rows by integer code instead of repeating the strings.
+"""
+
+
+@dataclass
+class BatchGeocodeResult:
+    """
+    Columnar result from a batch lookup via geocode_many().
+
+    Each column has one entry per input point, in input order, and is stored as
+    an integer array (array.array) rather than as Python objects per row.
+    Location fields are dictionary-encoded: codes[i] is the index of row i's
+    (city, state, district, pincode) tuple in attributes, or -1 when the point
+    is invalid or has no match; cells and kind_codes encode the match the same
+    way. The city/state/district/pincode, matched_h3, matched_resolution and
+    match_kind properties decode them into lists on demand; unmatched rows hold
+    None in every one of those columns.
+    """
+
+    codes: "array[int]"
+    """Attribute code per input point: an index into attributes, or -1 for no match."""
+
+    attributes: Sequence[LocationRow]
+    """Table of distinct (city, state, district, pincode) rows referenced by codes."""
+
+    cells: "array[int]"
+    """Integer H3 cell that matched per input point (may be a fallback parent), or 0."""
+
+    kind_codes: "array[int]"
+    """Match kind per input point as an index into MATCH_KINDS, or -1 for no match."""
+
+    def _decode(self, field_index: int) -> List[Optional[str]]:
+        attributes = self.attributes
+        return [attributes[code][field_index] if code >= 0 else None for code in self.codes]
+
+    @property
+    def matched_h3(self) -> List[Optional[str]]:
+        """H3 cell ID that matched per input point (may be a fallback parent cell)."""
+        return [format(cell, "x") if cell else None for cell in self.cells]
+
+    @property
+    def matched_resolution(self) -> List[Optional[int]]:
+        """H3 resolution of the matched cell per input point."""
+        return [cell_resolution(cell) if cell else None for cell in self.cells]
+
+    @property
+    def match_kind(self) -> List[Optional[MatchKind]]:
+        """Kind of match per input point ("exact", "parent", "nearest"), or None for no match."""
+        return [MATCH_KINDS[kind] if kind >= 0 else None for kind in self.kind_codes]
+
+    @property
+    def city(self) -> List[Optional[str]]:
+        """City or town name per input point."""
+        return self._decode(0)
+
+    @property
+    def state(self) -> List[Optional[str]]:
+        """State or union territory name per input point."""
+        return self._decode(1)
+
+    @property
+    def district(self) -> List[Optional[str]]:
+        """District name per input point, when available in the dataset."""
+        return self._decode(2)
+
+    @property
+    def pincode(self) -> List[Optional[str]]:
+        """Postal code (PIN code) per input point, when available in the dataset."""
+        return self._decode(3)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> Optional[GeocodeResult]:
+        """
+        Return the row at index as a GeocodeResult, or None when it has no match.
+
+        Handy for spot checks and tests; for bulk processing, read the columns
+        directly instead of materializing one object per row.
+        """
+        code = self.codes[index]
+        cell = self.cells[index]
+        if code < 0 or not cell:
+            return None
+        city, state, district, pincode = self.attributes[code]
+        return GeocodeResult(
+            city=city,
+            state=state,
+            district=district,
+            pincode=pincode,
+            matched_h3=format(cell, "x"),
+            matched_resolution=cell_resolution(cell),
+            match_kind=MATCH_KINDS[self.kind_codes[index]],
+        )
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Snapshot of coordinate cache counters.
+
+    Returned by ReverseGeocoder.coordinate_cache_stats() when the coordinate cache
+    is enabled. Counters accumulate for the lifetime of the cache.
+    """
+
+    hits: int
+    """Lookups answered from the cache."""
+
+    misses: int
+    """Lookups that weren't cached and went through the full geocoding path."""
+
+    evictions: int
+    """Entries dropped because the cache was full."""
+
+    size: int
+    """Number of entries currently cached."""
+
+    max_size: int
+    """Maximum number of entries before the least recently used is evicted."""
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (0.0 when there were none)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass(frozen=True)
+class BulkStats:
+    """
+    Summary of a bulk file run.
+
+    Returned by geocode_file() and printed by the lakhua bulk command.
+    """
+
+    rows: int
+    """Data rows read from the input (header excluded)."""
+
+    matched: int
+    """Rows that received a location."""
+
+    seconds: float
+    """Wall-clock time of the run, including reading and writing."""
+
+    workers: int
+    """Number of worker processes used (1 means the run stayed in-process)."""
+
+    @property
+    def rows_per_second(self) -> float:
+        """Throughput of the run (0.0 for an empty or instantaneous run)."""
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def match_rate(self) -> float:
+        """Fraction of rows that received a location (0.0 when there were none)."""
+        return self.matched / self.rows if self.rows else 0.0
+
+
+@dataclass(frozen=True)
+class BuildStats:
+    """
+    Summary of a dataset build.
+
+    Returned by lakhua.build.build_dataset() and printed by the lakhua build command.
+    """
+
+    records: int
+    """Input records read."""
+
+    duplicates: int
+    """Repeated (cell, location) pairs that were dropped."""
+
+    rows: int
+    """Distinct (city, state, district, pincode) tuples in the output."""
+
+    cells: Dict[int, int]
+    """Cells written per resolution."""
+
+    compacted: int
+    """Resolution-5 cells left out because their parent cell stands for them."""
+
+    seconds: float
+    """Wall-clock time of the build, including reading and writing."""
+
+
+@dataclass(frozen=True)
+class RasterReport:
+    """
+    Size and sampled accuracy of a lookup raster.
+
+    Returned by RasterIndex.report() and lakhua.core.raster.raster_report() to
+    help pick the grid step for ReverseGeocoder.enable_raster().
+    """
+
+    step: float
+    """Grid step in degrees of latitude and longitude."""
+
+    rows: int
+    """Pixel rows in the grid."""
+
+    cols: int
+    """Pixel columns in the grid."""
+
+    memory_bytes: int
+    """Size of the pixel array."""
+
+    build_seconds: float
+    """Wall-clock time it took to build the raster."""
+
+    unresolved_share: float
+    """Fraction of pixels that straddle a cell boundary and are looked up through H3."""
+
+    samples: int
+    """Random points checked against the H3 lookup."""
+
+    fast_share: float
+    """Fraction of sampled points answered from the raster alone."""
+
+    accuracy: float
+    """Fraction of sampled points whose raster lookup matched the H3 lookup."""
+
+
+LoadKind = Literal["store", "fallback_index", "gap_index"]
+"""What a load event built: a resolution store or one of the lookup indexes."""
+
+InvalidKind = Literal["coordinates", "h3_index", "resolution"]
+"""
+Why a single lookup rejected its input.
+
+- "coordinates": latitude/longitude missing, not numeric, or out of range.
+- "h3_index": the string isn't a valid H3 cell.
+- "resolution": the H3 cell is coarser than the coarsest stored resolution.
+"""
+
+
+@dataclass(frozen=True)
+class LoadEvent:
+    """
+    Data loaded or built by the DataLoader, reported to observers.
+
+    Each store and index is loaded once per data generation, so these events are
+    rare: a handful per process, plus a few after clear_store_cache().
+    """
+
+    kind: LoadKind
+    """What was loaded: "store", "fallback_index", or "gap_index"."""
+
+    resolution: int
+    """H3 resolution the store or index serves."""
+
+    source: str
+    """Where it came from: "binary" (memory-mapped), "json" (parsed), or "built" (index)."""
+
+    seconds: float
+    """Wall-clock time spent loading or building."""
+
+    cells: int
+    """Number of H3 cells in the loaded store or index."""
+
+
+@dataclass(frozen=True)
+class StatsSnapshot:
+    """
+    Point-in-time copy of the counters kept by StatsCollector.
+
+    Counters accumulate from the collector's creation (or last reset()). Export
+    them to Prometheus, StatsD, or logs as you see fit: every field is a plain
+    number, dict, or list.
+    """
+
+    lookups: int
+    """Single-point lookups observed (geocode() and geocode_h3()), including invalid ones."""
+
+    batch_points: int
+    """Points looked up in bulk (geocode_many(), geocode_iter(), async micro-batches)."""
+
+    batches: int
+    """Bulk lookups observed."""
+
+    hits: Dict[int, int]
+    """Matches per matched resolution, over single and bulk lookups."""
+
+    fallbacks: int
+    """Matches found through a coarser parent cell (match_kind "parent")."""
+
+    nearest: int
+    """Matches found through the nearest covered cell (match_kind "nearest")."""
+
+    misses: int
+    """Valid inputs with no match."""
+
+    out_of_coverage: int
+    """Misses answered by the coverage pre-filter, without an H3 lookup (also in misses)."""
+
+    invalid: Dict[str, int]
+    """Rejected inputs by reason ("coordinates", "h3_index", "resolution")."""
+
+    latency_bounds: Tuple[float, ...]
+    """Upper bounds in seconds of the single-lookup latency buckets; the last is infinity."""
+
+    latency_counts: Tuple[int, ...]
+    """Single lookups per latency bucket (not cumulative), aligned with latency_bounds."""
+
+    latency_sum: float
+    """Total seconds spent in observed single lookups."""
+
+    batch_seconds: float
+    """Total seconds spent in observed bulk lookups."""
+
+    loads: Tuple[LoadEvent, ...]
+    """Every load event observed, oldest first."""
+
+    def latency_quantile(self, quantile: float) -> float:
+        """
+        Estimate a single-lookup latency quantile from the histogram.
+
+        Args:
+            quantile: Quantile between 0 and 1, e.g. 0.99.
+
+        Returns:
+            Upper bound in seconds of the bucket holding that quantile (0.0 when
+            no lookups were observed; infinity if it falls in the last bucket).
+        """
+        total = sum(self.latency_counts)
+        if total == 0:
+            return 0.0
+        rank = quantile * total
+        seen = 0
+        for bound, count in zip(self.latency_bounds, self.latency_counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.latency_bounds[-1]
+
+
 # Type alias for internal data storage
 ReverseGeoStore = Dict[str, Dict[str, str]]
 """
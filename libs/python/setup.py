@@ -22,14 +22,21 @@ setup(
     },
     packages=find_packages(),
     package_data={
-        "lakhua": ["data/*.json", "py.typed"],
+        "lakhua": ["data/*.json", "data/*.bin", "py.typed"],
     },
     include_package_data=True,
     python_requires=">=3.8",
     install_requires=[
         "h3>=3.7.0",
     ],
+    entry_points={
+        "console_scripts": ["lakhua=lakhua.cli:main"],
+    },
     extras_require={
+        "parquet": ["pyarrow>=10.0.0"],
+        "arrow": ["pyarrow>=10.0.0"],
+        "pandas": ["pandas>=1.3.0"],
+        "zstd": ["zstandard>=0.18.0"],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
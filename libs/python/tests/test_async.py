@@ -0,0 +1,206 @@
+"""Unit tests for the asyncio API."""
+
+import asyncio
+import random
+import threading
+
+import pytest
+
+from lakhua import (
+    AsyncGeocoder,
+    DataLoader,
+    GeocodeOptions,
+    ReverseGeocoder,
+    geocode,
+    geocode_async,
+    geocode_many,
+    geocode_many_async,
+)
+from lakhua.core import data_loader as data_loader_module
+
+
+class CountingGeocoder:
+    """Geocoder stand-in that records bulk calls and the threads they ran on."""
+
+    def __init__(self):
+        self._geocoder = ReverseGeocoder.get_instance()
+        self._data_loader = self._geocoder._data_loader
+        self.batch_sizes = []
+        self.threads = []
+
+    def geocode(self, lat, lon, options=None):
+        self.threads.append(threading.current_thread())
+        return self._geocoder.geocode(lat, lon, options)
+
+    def geocode_many(self, lats, lons, options=None):
+        self.threads.append(threading.current_thread())
+        return self._geocoder.geocode_many(lats, lons, options)
+
+    def _geocode_points(self, lats, lons, opts):
+        self.batch_sizes.append(len(lats))
+        self.threads.append(threading.current_thread())
+        return self._geocoder._geocode_points(lats, lons, opts)
+
+
+def _points(count, seed=3):
+    rng = random.Random(seed)
+    return [(rng.uniform(6.5, 35.5), rng.uniform(68.0, 97.5)) for _ in range(count)]
+
+
+def test_async_results_match_sync():
+    """The async functions return exactly what their sync counterparts return."""
+    points = _points(200)
+    lats = [lat for lat, _ in points]
+    lons = [lon for _, lon in points]
+
+    async def run():
+        singles = await asyncio.gather(*(geocode_async(lat, lon) for lat, lon in points))
+        batch = await geocode_many_async(lats, lons)
+        return singles, batch
+
+    singles, batch = asyncio.run(run())
+    assert singles == [geocode(lat, lon) for lat, lon in points]
+    assert batch == geocode_many(lats, lons)
+    assert asyncio.run(geocode_async("bad", None)) is None
+
+
+def test_cold_load_runs_off_loop(monkeypatch):
+    """The first lookup loads data on an executor thread, not the loop thread."""
+    loader = DataLoader.get_instance()
+    loader.clear_store_cache()
+    load_threads = []
+    load_store = DataLoader._load_store_locked
+
+    def recording_load(self, resolution, debug):
+        load_threads.append(threading.current_thread())
+        return load_store(self, resolution, debug)
+
+    monkeypatch.setattr(data_loader_module.DataLoader, "_load_store_locked", recording_load)
+
+    async def run():
+        return threading.current_thread(), await AsyncGeocoder().geocode(28.6139, 77.2090)
+
+    loop_thread, result = asyncio.run(run())
+    assert result.city == geocode(28.6139, 77.2090).city
+    assert load_threads
+    assert loop_thread not in load_threads
+
+
+def test_warm_keys_follow_the_data_generation():
+    """Warm keys of replaced data are dropped, and clamped resolutions share one key."""
+    counting = CountingGeocoder()
+    geocoder = AsyncGeocoder(counting)
+    loader = counting._data_loader
+
+    async def run():
+        for _ in range(3):
+            loader.clear_store_cache()
+            await geocoder.geocode(28.6139, 77.2090)
+            await geocoder.geocode(28.6139, 77.2090, GeocodeOptions(resolution=9))
+        counting.threads.clear()
+        await geocoder.geocode(28.6139, 77.2090, GeocodeOptions(resolution=9))
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(run())
+    assert geocoder._warm == {(loader.generation, 5, True, False)}
+    assert counting.threads == [loop_thread]
+
+
+def test_warm_lookups_answer_on_loop():
+    """Without batching, warm single-point lookups skip the executor entirely."""
+    counting = CountingGeocoder()
+    geocoder = AsyncGeocoder(counting)
+
+    async def run():
+        await geocoder.geocode(28.6139, 77.2090)  # warm up on the executor
+        counting.threads.clear()
+        await asyncio.gather(geocoder.geocode(28.6139, 77.2090), geocoder.geocode(19.07, 72.87))
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(run())
+    assert counting.threads == [loop_thread, loop_thread]
+    assert counting.batch_sizes == []
+
+
+def test_concurrent_requests_are_micro_batched():
+    """Requests arriving in the same loop iteration share one bulk lookup."""
+    counting = CountingGeocoder()
+    geocoder = AsyncGeocoder(counting, batch_window=0, max_batch_size=64)
+    points = _points(150)
+
+    async def run():
+        await geocoder.geocode(*points[0])  # warm up on the executor
+        counting.batch_sizes.clear()
+        return await asyncio.gather(*(geocoder.geocode(lat, lon) for lat, lon in points))
+
+    results = asyncio.run(run())
+    assert results == [geocode(lat, lon) for lat, lon in points]
+    assert counting.batch_sizes == [64, 64, 22]
+
+
+def test_batches_group_by_options():
+    """Requests with different options are never answered by the same batch."""
+    counting = CountingGeocoder()
+    geocoder = AsyncGeocoder(counting, batch_window=0.005)
+    coarse = GeocodeOptions(resolution=4)
+
+    async def run():
+        await asyncio.gather(geocoder.geocode(28.6, 77.2), geocoder.geocode(28.6, 77.2, coarse))
+        counting.batch_sizes.clear()
+        return await asyncio.gather(
+            geocoder.geocode(28.6, 77.2),
+            geocoder.geocode(28.6, 77.2, coarse),
+            geocoder.geocode(19.07, 72.87),
+        )
+
+    fine_result, coarse_result, other = asyncio.run(run())
+    assert fine_result.matched_resolution == 5
+    assert coarse_result.matched_resolution == 4
+    assert other == geocode(19.07, 72.87)
+    assert sorted(counting.batch_sizes) == [1, 2]
+
+
+def test_large_batches_run_on_executor():
+    """geocode_many() batches above the threshold leave the event loop thread."""
+    counting = CountingGeocoder()
+    geocoder = AsyncGeocoder(counting, executor_threshold=100)
+    small, large = _points(10), _points(100)
+
+    async def run():
+        await geocoder.geocode_many([28.6], [77.2])  # warm up
+        counting.threads.clear()
+        await geocoder.geocode_many([p[0] for p in small], [p[1] for p in small])
+        await geocoder.geocode_many([p[0] for p in large], [p[1] for p in large])
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(run())
+    assert counting.threads[0] is loop_thread
+    assert counting.threads[1] is not loop_thread
+
+
+def test_full_micro_batches_run_on_executor():
+    """Micro-batches that reach max_batch_size leave the loop even below executor_threshold."""
+    counting = CountingGeocoder()
+    geocoder = AsyncGeocoder(counting, batch_window=0, max_batch_size=4)
+    points = _points(6)
+
+    async def run():
+        await geocoder.geocode(28.6, 77.2)  # warm up
+        counting.threads.clear()
+        results = await asyncio.gather(*(geocoder.geocode(lat, lon) for lat, lon in points))
+        return threading.current_thread(), results
+
+    loop_thread, results = asyncio.run(run())
+    assert results == [geocode(lat, lon) for lat, lon in points]
+    on_loop = {
+        size: thread is loop_thread for size, thread in zip(counting.batch_sizes, counting.threads)
+    }
+    assert on_loop == {4: False, 2: True}
+
+
+def test_invalid_settings():
+    """Batching settings are validated up front."""
+    with pytest.raises(ValueError, match="batch_window"):
+        AsyncGeocoder(batch_window=-1)
+    with pytest.raises(ValueError, match="max_batch_size"):
+        AsyncGeocoder(max_batch_size=0)
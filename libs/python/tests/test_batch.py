@@ -0,0 +1,136 @@
+"""Unit tests for lakhua batch geocoding."""
+
+import h3
+import pytest
+
+from lakhua import BatchGeocodeResult, DataLoader, GeocodeOptions, geocode, geocode_many
+from lakhua.types import MATCH_KINDS
+
+TEST_CELL_5 = "8560145bfffffff"
+
+
+@pytest.fixture
+def test_data_loader():
+    """Fixture providing a data loader with a resolution-5 cell and its resolution-4 parent."""
+    loader = DataLoader.get_instance()
+    loader.set_stores_for_testing(
+        {
+            5: {
+                TEST_CELL_5: {
+                    "city": "New Delhi",
+                    "state": "Delhi",
+                    "district": "Central Delhi",
+                    "pincode": "110001",
+                }
+            },
+            4: {
+                h3.cell_to_parent(TEST_CELL_5, 4): {
+                    "city": "Delhi Region",
+                    "state": "Delhi",
+                }
+            },
+        }
+    )
+    yield loader
+    loader.set_stores_for_testing(None)
+    loader.clear_store_cache()
+
+
+def _sibling_point(cell_5: str):
+    parent_cell_4 = h3.cell_to_parent(cell_5, 4)
+    sibling = next(c for c in h3.cell_to_children(parent_cell_4, 5) if c != cell_5)
+    return h3.cell_to_latlng(sibling)
+
+
+def test_geocode_many_matches_per_call_results(test_data_loader):
+    """Batch results line up with geocode() for exact, fallback, miss, and invalid rows."""
+    exact = h3.cell_to_latlng(TEST_CELL_5)
+    fallback = _sibling_point(TEST_CELL_5)
+    points = [exact, fallback, (0.0, 0.0), (999.0, 999.0), exact]
+    lats = [lat for lat, _ in points]
+    lons = [lon for _, lon in points]
+
+    batch = geocode_many(lats, lons)
+
+    assert isinstance(batch, BatchGeocodeResult)
+    assert len(batch) == len(points)
+    for row, (lat, lon) in enumerate(points):
+        assert batch[row] == geocode(lat, lon)
+    assert batch.city == ["New Delhi", "Delhi Region", None, None, "New Delhi"]
+    assert batch.matched_resolution == [5, 4, None, None, 5]
+    assert batch.pincode[0] == "110001"
+
+
+def test_geocode_many_no_fallback(test_data_loader):
+    """Fallback rows become misses when fallback is disabled."""
+    lat, lon = _sibling_point(TEST_CELL_5)
+    batch = geocode_many([lat], [lon], GeocodeOptions(fallback=False))
+    assert batch.matched_h3 == [None]
+    assert batch[0] is None
+
+
+def test_geocode_many_accepts_numpy_arrays(test_data_loader):
+    """NumPy arrays are accepted as coordinate columns."""
+    np = pytest.importorskip("numpy")
+    lat, lon = h3.cell_to_latlng(TEST_CELL_5)
+    batch = geocode_many(np.array([lat, np.nan]), np.array([lon, lon]))
+    assert batch.city == ["New Delhi", None]
+
+
+def test_geocode_many_converts_repeated_points_once(test_data_loader, monkeypatch):
+    """Repeated coordinates in a batch are converted to H3 once and share their row."""
+    import h3.api.basic_int as h3_int
+
+    exact = h3.cell_to_latlng(TEST_CELL_5)
+    fallback = _sibling_point(TEST_CELL_5)
+    points = [exact, fallback, exact, exact, fallback]
+    calls = []
+    latlng_to_cell = h3_int.latlng_to_cell
+    monkeypatch.setattr(
+        h3_int, "latlng_to_cell", lambda *args: calls.append(args) or latlng_to_cell(*args)
+    )
+
+    batch = geocode_many([lat for lat, _ in points], [lon for _, lon in points])
+
+    assert len(calls) == 2
+    assert batch.city == ["New Delhi", "Delhi Region", "New Delhi", "New Delhi", "Delhi Region"]
+
+
+def test_geocode_many_length_mismatch():
+    """Mismatched coordinate columns are rejected."""
+    with pytest.raises(ValueError, match="same length"):
+        geocode_many([28.6], [77.2, 77.3])
+
+
+def test_geocode_many_empty():
+    """Empty input yields an empty result."""
+    assert len(geocode_many([], [])) == 0
+
+
+def test_geocode_many_returns_attribute_codes(test_data_loader):
+    """Rows with the same location share a code into the attributes table."""
+    exact = h3.cell_to_latlng(TEST_CELL_5)
+    fallback = _sibling_point(TEST_CELL_5)
+    batch = geocode_many(
+        [exact[0], fallback[0], 0.0, exact[0]], [exact[1], fallback[1], 0.0, exact[1]]
+    )
+    assert batch.codes[0] == batch.codes[3]
+    assert batch.codes[2] == -1
+    assert batch.attributes[batch.codes[0]] == ("New Delhi", "Delhi", "Central Delhi", "110001")
+    assert batch.attributes[batch.codes[1]] == ("Delhi Region", "Delhi", None, None)
+    assert batch.attributes is test_data_loader.load_resolution_store(5).attributes
+
+
+def test_geocode_many_keeps_columns_as_integer_arrays(test_data_loader):
+    """Matches stay integer arrays; strings and resolutions are decoded only on request."""
+    exact = h3.cell_to_latlng(TEST_CELL_5)
+    fallback = _sibling_point(TEST_CELL_5)
+    parent = h3.cell_to_parent(TEST_CELL_5, 4)
+    batch = geocode_many([exact[0], fallback[0], 0.0], [exact[1], fallback[1], 0.0])
+    typecodes = [column.typecode for column in (batch.codes, batch.cells, batch.kind_codes)]
+    assert typecodes == ["i", "Q", "b"]
+    assert list(batch.cells) == [h3.str_to_int(TEST_CELL_5), h3.str_to_int(parent), 0]
+    assert [MATCH_KINDS[kind] for kind in batch.kind_codes[:2]] == ["exact", "parent"]
+    assert batch.kind_codes[2] == -1
+    assert batch.matched_h3 == [TEST_CELL_5, parent, None]
+    assert batch.match_kind == ["exact", "parent", None]
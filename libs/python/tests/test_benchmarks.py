@@ -0,0 +1,45 @@
+"""Smoke tests for the benchmark scripts, so API changes that break them are caught."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from lakhua.core.constants import get_binary_file_path
+
+SUITE = Path(__file__).resolve().parents[3] / "benchmarks" / "python" / "suite.py"
+
+pytestmark = pytest.mark.skipif(not SUITE.is_file(), reason="benchmarks are not in this checkout")
+
+
+def _run_suite(*args):
+    """Run the regression suite in a fresh interpreter and return its stdout."""
+    completed = subprocess.run(
+        [sys.executable, str(SUITE), *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return completed.stdout
+
+
+@pytest.mark.parametrize("source", ["binary", "json"])
+def test_cold_load_probes(source):
+    """Both cold-load probes run and report their timings without touching the binary store."""
+    binary_path = get_binary_file_path()
+    before = binary_path.stat().st_mtime_ns if binary_path.exists() else None
+    probe = json.loads(_run_suite("--probe", source))
+    assert probe["load_ms"] > 0
+    assert probe["first_lookup_ms"] > 0
+    assert (binary_path.stat().st_mtime_ns if binary_path.exists() else None) == before
+
+
+def test_suite_runs(tmp_path):
+    """A tiny run of the whole suite writes every metric group."""
+    output = tmp_path / "results.json"
+    _run_suite("--points", "200", "--latency-points", "20", "--repeat", "1", "--json", str(output))
+    results = json.loads(output.read_text())
+    assert set(results) == {"meta", "load", "memory", "latency", "throughput"}
+    assert results["throughput"]["out_of_coverage"]["match_rate"] == 0.0
@@ -0,0 +1,150 @@
+"""Unit tests for the precompiled binary store format."""
+
+import json
+import os
+from array import array
+
+import h3
+import pytest
+
+from lakhua import DataLoader
+from lakhua.core import data_loader as data_loader_module
+from lakhua.core.binary_store import BinaryStoreFile, write_binary_store
+from lakhua.core.constants import get_binary_file_path
+from lakhua.core.store import AttributeTable, CompactStore
+
+RAW_STORES = {
+    5: {
+        "8560145bfffffff": {
+            "city": "New Delhi",
+            "state": "Delhi",
+            "district": "Central Delhi",
+            "pincode": "110001",
+        },
+        "853d838bfffffff": {"city": "Orchha", "state": "Madhya Pradesh"},
+    },
+    4: {"843d839ffffffff": {"city": "Orchha", "state": "Madhya Pradesh"}},
+}
+
+
+@pytest.fixture
+def compiled(tmp_path):
+    """Write RAW_STORES as JSON sources plus a compiled binary store."""
+    attributes = AttributeTable()
+    stores = {}
+    sources = {}
+    for resolution, raw in RAW_STORES.items():
+        sources[resolution] = tmp_path / f"reverse_geo_{resolution}.json"
+        sources[resolution].write_text(json.dumps(raw), encoding="utf-8")
+        stores[resolution] = CompactStore.from_mapping(raw, attributes)
+    binary_path = tmp_path / "reverse_geo.bin"
+    write_binary_store(binary_path, stores, sources)
+    return binary_path, sources
+
+
+def test_binary_roundtrip(compiled):
+    """Mapped stores read back exactly what was compiled."""
+    binary_path, _ = compiled
+    binary = BinaryStoreFile.open(binary_path)
+    assert binary.resolutions == (4, 5)
+    for resolution, raw in RAW_STORES.items():
+        store = binary.store(resolution)
+        assert dict(store.items()) == raw
+    store_4 = binary.store(4)
+    store_5 = binary.store(5)
+    orchha_4 = store_4.code_at(store_4.find(h3.str_to_int("843d839ffffffff")))
+    orchha_5 = store_5.code_at(store_5.find(h3.str_to_int("853d838bfffffff")))
+    assert orchha_4 == orchha_5
+    assert len(binary.attributes) == 2
+    assert binary.attributes.column("state")[0] == ["Delhi", "Madhya Pradesh"]
+
+
+def test_mapped_attributes_intern(compiled):
+    """Rows interned into a mapped table extend its length, indexing and slicing."""
+    binary_path, _ = compiled
+    attributes = BinaryStoreFile.open(binary_path).attributes
+    existing = attributes[1]
+    assert attributes.intern(existing) == 1
+    row = ("Jhansi", "Uttar Pradesh", None, None)
+    assert attributes.intern(row) == 2
+    assert len(attributes) == 3
+    assert attributes[-1] == attributes[2] == row
+    assert list(attributes[1:]) == [existing, row]
+    assert attributes.intern(row) == 2
+    assert len(attributes) == 3
+
+
+def test_binary_staleness(compiled):
+    """A section is current only while its JSON source is unchanged."""
+    binary_path, sources = compiled
+    binary = BinaryStoreFile.open(binary_path)
+    assert binary.is_current(5, sources[5])
+
+    # Same contents with a new timestamp (e.g. a fresh install) is still current.
+    stat = sources[5].stat()
+    os.utime(sources[5], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert binary.is_current(5, sources[5])
+
+    # New contents of the same size and timestamp are not.
+    stat = sources[5].stat()
+    sources[5].write_text(json.dumps(RAW_STORES[5]).replace("New", "Old"), encoding="utf-8")
+    os.utime(sources[5], ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert sources[5].stat().st_size == stat.st_size
+    assert not binary.is_current(5, sources[5])
+
+    changed = dict(RAW_STORES[5])
+    changed["8560145bfffffff"] = {"city": "Old Delhi", "state": "Delhi"}
+    sources[5].write_text(json.dumps(changed), encoding="utf-8")
+    assert not binary.is_current(5, sources[5])
+    assert not binary.is_current(6, sources[5])
+
+
+def test_corrupt_binary_rejected(tmp_path):
+    """Files that aren't valid binary stores raise ValueError."""
+    path = tmp_path / "reverse_geo.bin"
+    path.write_bytes(b"not a binary store" * 10)
+    with pytest.raises(ValueError, match="not a lakhua binary store"):
+        BinaryStoreFile.open(path)
+
+
+def test_loader_falls_back_to_json(monkeypatch, tmp_path):
+    """A stale or corrupt binary store is ignored and results come from JSON."""
+    broken = tmp_path / "reverse_geo.bin"
+    broken.write_bytes(b"\0" * 64)
+    monkeypatch.setattr(data_loader_module, "get_binary_file_path", lambda: broken)
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("LAKHUA_CACHE_DIR", str(cache_dir))
+
+    loader = DataLoader.get_instance()
+    loader.clear_store_cache()
+    try:
+        store = loader.load_resolution_store(5)
+        assert isinstance(store.cells, array)  # parsed, not mapped
+        assert store.get("853d838bfffffff") == {
+            "city": "Orchha",
+            "state": "Madhya Pradesh",
+            "district": "Orchha Tahsil",
+            "pincode": "472246",
+        }
+        # Once every resolution is parsed, a binary store is compiled into the
+        # cache directory, and the package's own file is left alone.
+        loader.preload()
+        assert broken.read_bytes() == b"\0" * 64
+        (compiled,) = cache_dir.iterdir()
+        assert BinaryStoreFile.open(compiled).resolutions == (4, 5)
+
+        loader.clear_store_cache()
+        store = loader.load_resolution_store(5)
+        assert not isinstance(store.cells, array)  # mapped from the cache
+        assert store.get("853d838bfffffff")["city"] == "Orchha"
+    finally:
+        loader.clear_store_cache()
+
+
+def test_shipped_binary_store_is_current():
+    """The binary store bundled with the package matches the bundled JSON."""
+    binary = BinaryStoreFile.open(get_binary_file_path())
+    loader = DataLoader.get_instance()
+    for resolution in (4, 5):
+        assert binary.is_current(resolution, data_loader_module.get_data_file_path(resolution))
+        assert len(binary.store(resolution)) == len(loader.load_resolution_store(resolution))
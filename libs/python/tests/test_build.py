@@ -0,0 +1,142 @@
+"""Unit tests for building the data files."""
+
+import json
+import tracemalloc
+
+import h3
+import pytest
+
+from lakhua import DataLoader, GeocodeOptions, ReverseGeocoder
+from lakhua.build import build_dataset
+from lakhua.core.binary_store import BinaryStoreFile
+from lakhua.core.constants import get_data_file_path
+
+PARENT = "843da11ffffffff"
+CHILDREN = sorted(h3.cell_to_children(PARENT, 5))
+NEIGHBOR_CHILD = sorted(h3.cell_to_children(sorted(h3.grid_ring(PARENT, 1))[0], 5))[0]
+DELHI = {"city": "New Delhi", "state": "Delhi", "pincode": "110001"}
+NOIDA = {"city": "Noida", "state": "Uttar Pradesh"}
+
+
+def _records(cells, location):
+    """Return one input record per cell, all with the same location."""
+    return [{"h3": cell, **location} for cell in cells]
+
+
+def _read(output_dir, resolution):
+    """Parse one resolution's built data file."""
+    return json.loads((output_dir / f"reverse_geo_{resolution}.json").read_text("utf-8"))
+
+
+def test_build_writes_loadable_files(tmp_path):
+    """Both resolutions are written minified, derived from resolution 5, and loadable."""
+    records = _records(CHILDREN[:3], DELHI) + _records(CHILDREN[3:5], NOIDA)
+    stats = build_dataset(records, tmp_path)
+
+    assert (stats.records, stats.duplicates, stats.rows) == (5, 0, 2)
+    assert stats.cells == {5: 5, 4: 1}
+    text = (tmp_path / "reverse_geo_5.json").read_text("utf-8")
+    assert " " not in text.replace("New Delhi", "").replace("Uttar Pradesh", "")
+    assert "\n" not in text
+    assert _read(tmp_path, 5)[CHILDREN[0]] == DELHI
+    # The parent takes the location most of its children have.
+    assert _read(tmp_path, 4) == {PARENT: DELHI}
+
+    binary = BinaryStoreFile.open(tmp_path / "reverse_geo.bin")
+    for resolution in (4, 5):
+        assert binary.is_current(resolution, tmp_path / f"reverse_geo_{resolution}.json")
+    geocoder = ReverseGeocoder.from_loader(DataLoader.from_directory(tmp_path, cache=False))
+    assert geocoder.geocode_h3(CHILDREN[4]).city == "Noida"
+    assert geocoder.geocode_h3(CHILDREN[6]).city == "New Delhi"
+
+
+def test_parent_ties_go_to_the_first_child(tmp_path):
+    """With equally common locations, the location of the smallest child cell wins."""
+    build_dataset(_records(CHILDREN[:1], NOIDA) + _records(CHILDREN[1:2], DELHI), tmp_path)
+    assert _read(tmp_path, 4)[PARENT] == NOIDA
+
+
+def test_duplicates_and_conflicts(tmp_path):
+    """Repeated records are dropped; one cell with two locations is an error."""
+    stats = build_dataset(_records(CHILDREN[:2] * 3, DELHI), tmp_path, binary=False)
+    assert (stats.records, stats.duplicates, stats.cells[5]) == (6, 4, 2)
+    assert not (tmp_path / "reverse_geo.bin").exists()
+
+    records = _records(CHILDREN[:1], DELHI) + _records(CHILDREN[:1], NOIDA)
+    with pytest.raises(ValueError, match="conflicting locations"):
+        build_dataset(records, tmp_path / "conflict")
+    assert not (tmp_path / "conflict").exists()
+
+
+def test_coarse_cells_expand_and_compact(tmp_path):
+    """Coarse input cells cover their children; compaction leaves uniform sets to the parent."""
+    stats = build_dataset(_records([PARENT], DELHI), tmp_path / "full")
+    assert (stats.cells, stats.compacted) == ({5: 7, 4: 1}, 0)
+    assert sorted(_read(tmp_path / "full", 5)) == CHILDREN
+
+    records = _records([PARENT], DELHI) + [{"h3": h3.str_to_int(CHILDREN[0]), **DELHI}]
+    records += _records([NEIGHBOR_CHILD], NOIDA)
+    stats = build_dataset(records, tmp_path / "compact", compact=True)
+    assert (stats.cells, stats.compacted, stats.duplicates) == ({5: 1, 4: 2}, 7, 1)
+    geocoder = ReverseGeocoder.from_loader(
+        DataLoader.from_directory(tmp_path / "compact", cache=False)
+    )
+    result = geocoder.geocode_h3(CHILDREN[2])
+    assert (result.city, result.match_kind, result.matched_h3) == ("New Delhi", "parent", PARENT)
+    assert geocoder.geocode_h3(CHILDREN[2], GeocodeOptions(fallback=False)) is None
+
+
+@pytest.mark.parametrize(
+    ("record", "message"),
+    [
+        ({"h3": "not-a-cell", **DELHI}, "isn't a valid H3 cell"),
+        ({**DELHI}, "isn't a valid H3 cell"),
+        ({"h3": h3.cell_to_children(CHILDREN[0], 6)[0], **DELHI}, "finer than resolution 5"),
+        ({"h3": CHILDREN[0], "city": " ", "state": "Delhi"}, "city and state are required"),
+    ],
+)
+def test_invalid_records(tmp_path, record, message):
+    """Invalid records stop the build with the record number."""
+    with pytest.raises(ValueError, match=f"record 2: .*{message}"):
+        build_dataset([{"h3": CHILDREN[1], **DELHI}, record], tmp_path)
+    with pytest.raises(ValueError, match="no records"):
+        build_dataset([], tmp_path)
+
+
+def test_build_streams_in_bounded_memory(tmp_path):
+    """Memory is bounded by the sort chunk, not by the number of input records."""
+    count = 60_000
+
+    def records():
+        for number in range(count):
+            yield {"h3": CHILDREN[number % len(CHILDREN)], **DELHI}
+
+    peaks = {}
+    for chunk_size in (count, 1_000):
+        tracemalloc.start()
+        stats = build_dataset(records(), tmp_path / str(chunk_size), chunk_size=chunk_size)
+        peaks[chunk_size] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert stats.duplicates == count - len(CHILDREN)
+
+    for name in ("reverse_geo_4.json", "reverse_geo_5.json"):
+        whole = (tmp_path / str(count) / name).read_bytes()
+        assert (tmp_path / "1000" / name).read_bytes() == whole
+    assert peaks[1_000] * 2 < peaks[count]
+
+
+def test_build_round_trips_bundled_data(tmp_path):
+    """Rebuilding the bundled resolution-5 data through spilled chunks reproduces it."""
+    bundled = json.loads(get_data_file_path(5).read_text("utf-8"))
+    records = ({"h3": cell, **location} for cell, location in bundled.items())
+    stats = build_dataset(records, tmp_path, chunk_size=1_000)
+
+    assert stats.cells[5] == len(bundled)
+    # Values are stripped of surrounding whitespace on the way in.
+    stripped = {
+        cell: {name: value.strip() for name, value in location.items()}
+        for cell, location in bundled.items()
+    }
+    assert _read(tmp_path, 5) == stripped
+    parents = {h3.cell_to_parent(cell, 4) for cell in bundled}
+    assert set(_read(tmp_path, 4)) == parents
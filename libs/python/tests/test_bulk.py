@@ -0,0 +1,157 @@
+"""Unit tests for bulk file enrichment and the command line."""
+
+import csv
+import multiprocessing
+import os
+import random
+
+import pytest
+
+from lakhua import DataLoader, GeocodeOptions, geocode
+from lakhua.bulk import OUTPUT_FIELDS, geocode_file
+from lakhua.cli import main
+from lakhua.core import data_loader
+from lakhua.core.coverage import CoverageFilter
+
+
+def _points(count, seed=5):
+    rng = random.Random(seed)
+    return [(rng.uniform(6.5, 35.5), rng.uniform(68.0, 97.5)) for _ in range(count)]
+
+
+def _write_csv(path, points, delimiter=","):
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle, delimiter=delimiter)
+        writer.writerow(["id", "lat", "lon"])
+        for row, (lat, lon) in enumerate(points):
+            writer.writerow([row, repr(lat), repr(lon)])
+
+
+def _read_csv(path, delimiter=","):
+    with open(path, newline="", encoding="utf-8") as handle:
+        return list(csv.DictReader(handle, delimiter=delimiter))
+
+
+def _expected_row(lat, lon, options=None):
+    result = geocode(lat, lon, options)
+    if result is None:
+        return dict.fromkeys(OUTPUT_FIELDS, "")
+    return {
+        "city": result.city,
+        "state": result.state,
+        "district": result.district or "",
+        "pincode": result.pincode or "",
+        "matched_h3": result.matched_h3,
+        "matched_resolution": str(result.matched_resolution),
+        "match_kind": result.match_kind,
+    }
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_csv_rows_match_geocode(tmp_path, workers):
+    """Every output row carries the input columns plus what geocode() returns, in order."""
+    points = _points(700)
+    source, target = tmp_path / "in.csv", tmp_path / "out.csv"
+    _write_csv(source, points)
+
+    stats = geocode_file(source, target, workers=workers, chunk_size=128)
+
+    rows = _read_csv(target)
+    assert list(rows[0]) == ["id", "lat", "lon", *OUTPUT_FIELDS]
+    assert [row["id"] for row in rows] == [str(index) for index in range(len(points))]
+    for row, (lat, lon) in zip(rows, points):
+        assert {field: row[field] for field in OUTPUT_FIELDS} == _expected_row(lat, lon)
+    assert (stats.rows, stats.workers) == (len(points), workers)
+    assert stats.matched == sum(1 for row in rows if row["city"])
+    assert stats.rows_per_second > 0
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork", reason="workers only inherit data when forked"
+)
+def test_forked_workers_use_the_parents_indexes(tmp_path, monkeypatch):
+    """Workers inherit the parent's fallback index and coverage filters instead of rebuilding."""
+    DataLoader.get_instance().clear_store_cache()
+    parent = os.getpid()
+    build_index, build_filter = data_loader.FallbackIndex, CoverageFilter.__init__
+
+    def in_parent(build):
+        def wrapper(*args, **kwargs):
+            assert os.getpid() == parent, "a worker rebuilt a lookup index"
+            return build(*args, **kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(data_loader, "FallbackIndex", in_parent(build_index))
+    monkeypatch.setattr(CoverageFilter, "__init__", in_parent(build_filter))
+    points = _points(300)
+    source, target = tmp_path / "in.csv", tmp_path / "out.csv"
+    _write_csv(source, points)
+
+    assert geocode_file(source, target, workers=2, chunk_size=64).rows == len(points)
+
+
+def test_tsv_options_and_bad_values(tmp_path):
+    """TSV input, lookup options, and unparseable coordinates are handled."""
+    source, target = tmp_path / "in.tsv", tmp_path / "out.tsv"
+    with open(source, "w", encoding="utf-8") as handle:
+        handle.write("name\tlatitude\tlongitude\n")
+        handle.write("delhi\t28.6139\t77.2090\n")
+        handle.write("blank\t\t77.2\n")
+        handle.write("text\tabc\t77.2\n")
+        handle.write("ocean\t0\t0")  # no trailing newline
+    options = GeocodeOptions(resolution=4)
+
+    stats = geocode_file(
+        source, target, lat_column="latitude", lon_column="longitude", options=options
+    )
+
+    rows = _read_csv(target, delimiter="\t")
+    assert [row["name"] for row in rows] == ["delhi", "blank", "text", "ocean"]
+    assert rows[0]["matched_resolution"] == "4"
+    assert rows[0]["city"] == geocode(28.6139, 77.2090, options).city
+    assert all(row["city"] == "" for row in rows[1:])
+    assert (stats.rows, stats.matched) == (4, 1)
+
+
+def test_missing_column_is_reported(tmp_path):
+    """A missing coordinate column fails before any work is done."""
+    source = tmp_path / "in.csv"
+    _write_csv(source, _points(3))
+    with pytest.raises(ValueError, match="latitude"):
+        geocode_file(source, tmp_path / "out.csv", lat_column="latitude")
+    with pytest.raises(ValueError, match="workers"):
+        geocode_file(source, tmp_path / "out.csv", workers=0)
+
+
+def test_parquet_round_trip(tmp_path):
+    """Parquet input keeps its columns and gains typed location columns."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    points = _points(300)
+    source, target = tmp_path / "in.parquet", tmp_path / "out.parquet"
+    pq.write_table(pa.table({"lat": [p[0] for p in points], "lon": [p[1] for p in points]}), source)
+
+    stats = geocode_file(source, target, workers=2, chunk_size=64)
+
+    table = pq.read_table(target)
+    assert table.column_names == ["lat", "lon", *OUTPUT_FIELDS]
+    assert table.schema.field("matched_resolution").type == pa.int8()
+    cities = table.column("city").to_pylist()
+    for city, (lat, lon) in zip(cities, points):
+        result = geocode(lat, lon)
+        assert city == (result.city if result else None)
+    assert stats.rows == len(points)
+
+
+def test_cli_bulk(tmp_path, capsys):
+    """The bulk command writes the output and reports throughput on stderr."""
+    source, target = tmp_path / "in.csv", tmp_path / "out.csv"
+    _write_csv(source, _points(50))
+
+    assert main(["bulk", str(source), str(target), "--workers", "1", "--no-fallback"]) == 0
+    assert len(_read_csv(target)) == 50
+    assert "rows/sec" in capsys.readouterr().err
+
+    assert main(["bulk", str(tmp_path / "missing.csv"), str(target)]) == 1
+    assert "error" in capsys.readouterr().err
@@ -0,0 +1,123 @@
+"""Unit tests for the lakhua coordinate cache."""
+
+import h3
+import pytest
+
+from lakhua import DataLoader, GeocodeOptions, ReverseGeocoder
+from lakhua.core.cache import CoordinateCache
+
+TEST_CELL_5 = "8560145bfffffff"
+
+
+@pytest.fixture
+def geocoder():
+    """Fixture providing the shared geocoder with a small cache and test data."""
+    loader = DataLoader.get_instance()
+    loader.set_stores_for_testing(
+        {5: {TEST_CELL_5: {"city": "New Delhi", "state": "Delhi"}}, 4: {}}
+    )
+    instance = ReverseGeocoder.get_instance()
+    instance.enable_coordinate_cache(max_size=2, precision=4)
+    yield instance
+    instance.disable_coordinate_cache()
+    loader.set_stores_for_testing(None)
+    loader.clear_store_cache()
+
+
+def test_cache_hits_return_same_result(geocoder):
+    """Repeated and nearby coordinates are answered from the cache."""
+    lat, lon = (round(value, 4) + 0.00002 for value in h3.cell_to_latlng(TEST_CELL_5))
+    first = geocoder.geocode(lat, lon)
+    assert first is not None
+    assert geocoder.geocode(lat, lon) is first
+    assert geocoder.geocode(lat + 0.00005, lon) is first  # floors to the same key
+    stats = geocoder.coordinate_cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (2, 1, 1)
+    assert stats.hit_rate == pytest.approx(2 / 3)
+
+
+def test_cache_keys_include_options(geocoder):
+    """Lookups with different options don't share entries; misses are cached too."""
+    lat, lon = h3.cell_to_latlng(TEST_CELL_5)
+    geocoder.geocode(lat, lon)
+    geocoder.geocode(lat, lon, GeocodeOptions(fallback=False))
+    # Near the covered cell, so the coverage pre-filter lets it through to the cache.
+    assert geocoder.geocode(lat - 0.09, lon - 0.09) is None
+    assert geocoder.geocode(lat - 0.09, lon - 0.09) is None
+    stats = geocoder.coordinate_cache_stats()
+    assert stats.misses == 3
+    assert stats.hits == 1
+
+
+def test_cache_evicts_least_recently_used(geocoder):
+    """The cache stays bounded and evicts the least recently used coordinate."""
+    lat, lon = h3.cell_to_latlng(TEST_CELL_5)
+    geocoder.geocode(lat, lon)
+    geocoder.geocode(lat + 0.001, lon)
+    geocoder.geocode(lat, lon)  # refresh, so lat + 0.001 is now least recent
+    geocoder.geocode(lat + 0.002, lon)
+    assert geocoder.coordinate_cache_stats().evictions == 1
+    geocoder.geocode(lat, lon)
+    assert geocoder.coordinate_cache_stats().hits == 2
+
+
+def test_clear_store_cache_invalidates_coordinate_cache(geocoder):
+    """Changing the data drops cached coordinates."""
+    lat, lon = h3.cell_to_latlng(TEST_CELL_5)
+    assert geocoder.geocode(lat, lon).city == "New Delhi"
+    DataLoader.get_instance().set_stores_for_testing(
+        {5: {TEST_CELL_5: {"city": "Old Delhi", "state": "Delhi"}}, 4: {}}
+    )
+    assert geocoder.geocode(lat, lon).city == "Old Delhi"
+    DataLoader.get_instance().clear_store_cache()
+    geocoder.geocode(lat, lon)
+    stats = geocoder.coordinate_cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (0, 3, 1)
+
+
+def test_cache_disabled_by_default():
+    """Without enable_coordinate_cache() there are no stats."""
+    assert ReverseGeocoder.get_instance().coordinate_cache_stats() is None
+
+
+def test_cache_rejects_invalid_settings():
+    """Non-positive sizes and negative precision are rejected."""
+    with pytest.raises(ValueError, match="max_size"):
+        CoordinateCache(max_size=0)
+    with pytest.raises(ValueError, match="precision"):
+        CoordinateCache(precision=-1)
+
+
+def test_keys_floor_coordinates():
+    """Buckets are one step wide on both sides of zero, not a double-width bucket at zero."""
+    cache = CoordinateCache(precision=2)
+    assert cache.key(0.004, 0.0, 5, True)[:2] == cache.key(0.009, 0.0, 5, True)[:2]
+    assert cache.key(-0.004, 0.0, 5, True)[:2] != cache.key(0.004, 0.0, 5, True)[:2]
+    assert cache.key(-0.004, -0.009, 5, True)[:2] == (-1, -1)
+
+
+def test_used_entries_get_a_second_chance():
+    """A full cache evicts the oldest entry that wasn't used since it was inserted."""
+    cache = CoordinateCache(max_size=2)
+    first, second, third = (cache.key(lat, 77.0, 5, True) for lat in (28.1, 28.2, 28.3))
+    cache.put(first, None, 0)
+    cache.put(second, None, 0)
+    assert cache.get(first) == (True, None)
+    cache.put(third, None, 0)
+    assert cache.get(second) == (False, None)
+    assert cache.get(first) == (True, None)
+    assert cache.stats().evictions == 1
+
+
+def test_invalidate_drops_stale_results():
+    """Invalidating empties the cache, and results computed before it aren't stored."""
+    cache = CoordinateCache()
+    key = cache.key(28.6139, 77.2090, 5, True)
+    cache.put(key, None, 0)
+    cache.invalidate(1)
+    assert cache.get(key) == (False, None)
+    cache.put(key, None, 0)  # computed against the old data
+    assert cache.stats().size == 0
+    cache.invalidate(0)  # late notifications of older generations are ignored
+    cache.put(key, None, 1)
+    assert cache.get(key) == (True, None)
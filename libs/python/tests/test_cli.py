@@ -0,0 +1,143 @@
+"""Unit tests for the lakhua command line."""
+
+import csv
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+
+from lakhua import GeocodeOptions, geocode
+from lakhua.bulk import OUTPUT_FIELDS
+from lakhua.cli import main
+
+CSV_INPUT = "id,lat,lon\n1,28.6139,77.2090\n2,0,0\n3,bad,77.2\n"
+
+
+def _run(monkeypatch, capsys, argv, stdin=""):
+    monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+    exit_code = main(argv)
+    captured = capsys.readouterr()
+    return exit_code, captured.out, captured.err
+
+
+def test_enrich_stdin_to_jsonl(monkeypatch, capsys):
+    """CSV from stdin becomes JSONL records carrying the input fields and the location."""
+    exit_code, out, _ = _run(monkeypatch, capsys, ["enrich"], CSV_INPUT)
+
+    records = [json.loads(line) for line in out.splitlines()]
+    assert exit_code == 0
+    assert [record["id"] for record in records] == ["1", "2", "3"]
+    expected = geocode(28.6139, 77.2090)
+    assert records[0]["city"] == expected.city
+    assert records[0]["matched_resolution"] == 5
+    assert records[0]["match_kind"] == "exact"
+    assert all(records[row][field] is None for row in (1, 2) for field in OUTPUT_FIELDS)
+
+
+def test_enrich_jsonl_file_to_csv(monkeypatch, capsys, tmp_path):
+    """JSONL files with custom columns and options are written as CSV in order."""
+    source, target = tmp_path / "in.jsonl", tmp_path / "out.csv"
+    points = [(19.07, 72.87), (28.6139, 77.2090), (12.97, 77.59)]
+    source.write_text(
+        "".join(json.dumps({"y": lat, "x": lon}) + "\n" for lat, lon in points) + "\n"
+    )
+
+    argv = ["enrich", str(source), "-o", str(target), "--lat-column", "y", "--lon-column", "x"]
+    argv += ["--resolution", "4", "--chunk-size", "2"]
+    exit_code, out, _ = _run(monkeypatch, capsys, argv)
+
+    assert (exit_code, out) == (0, "")
+    with open(target, newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert list(rows[0]) == ["y", "x", *OUTPUT_FIELDS]
+    for row, (lat, lon) in zip(rows, points):
+        assert row["city"] == geocode(lat, lon, GeocodeOptions(resolution=4)).city
+        assert row["matched_resolution"] == "4"
+
+
+def test_enrich_csv_header_covers_the_first_chunk(monkeypatch, capsys):
+    """The CSV header holds every input column of the first chunk plus the lakhua fields."""
+    lines = [{"lat": 28.6139, "lon": 77.2090}, {"lat": 0, "lon": 0, "note": "sea", "city": "x"}]
+    stdin = "".join(json.dumps(line) + "\n" for line in lines)
+    argv = ["enrich", "--input-format", "jsonl", "--output-format", "csv"]
+    exit_code, out, _ = _run(monkeypatch, capsys, argv, stdin)
+
+    rows = list(csv.DictReader(io.StringIO(out)))
+    assert exit_code == 0
+    assert list(rows[0]) == ["lat", "lon", "note", *OUTPUT_FIELDS]
+    assert (rows[0]["note"], rows[1]["note"]) == ("", "sea")
+    assert rows[0]["city"] == geocode(28.6139, 77.2090).city
+    assert rows[1]["city"] == ""
+
+
+def test_enrich_csv_rejects_late_columns(monkeypatch, capsys):
+    """A column first seen after the CSV header was written is an error, not dropped."""
+    lines = [{"lat": 28.6139, "lon": 77.2090}, {"lat": 0, "lon": 0, "note": "sea"}]
+    stdin = "".join(json.dumps(line) + "\n" for line in lines)
+    argv = ["enrich", "--input-format", "jsonl", "--output-format", "csv", "--chunk-size", "1"]
+    exit_code, _, err = _run(monkeypatch, capsys, argv, stdin)
+
+    assert exit_code == 1
+    assert "column(s) note first appear after the CSV header was written" in err
+
+
+def test_enrich_stats(monkeypatch, capsys):
+    """--stats reports throughput, hit rate per resolution, and load time on stderr."""
+    exit_code, _, err = _run(monkeypatch, capsys, ["enrich", "--stats", "--no-fallback"], CSV_INPUT)
+
+    assert exit_code == 0
+    assert "rows: 3" in err
+    assert "load time:" in err
+    assert "rows/sec" in err
+    assert "matched at resolution 5: 1 (33.3%)" in err
+    assert "unmatched: 2 (66.7%)" in err
+
+
+def test_enrich_errors(monkeypatch, capsys, tmp_path):
+    """Bad input is reported with a non-zero exit code instead of a traceback."""
+    exit_code, _, err = _run(monkeypatch, capsys, ["enrich", "--input-format", "jsonl"], "[1, 2]\n")
+    assert exit_code == 1
+    assert "expected a JSON object" in err
+
+    exit_code, _, err = _run(monkeypatch, capsys, ["enrich", str(tmp_path / "missing.csv")])
+    assert exit_code == 1
+
+    with pytest.raises(SystemExit):
+        main(["enrich", "--resolution", "9"])
+
+
+def test_enrich_stops_quietly_when_the_reader_goes_away(tmp_path):
+    """Closing the output pipe early ends enrich with exit code 0 and nothing on stderr."""
+    source = tmp_path / "in.csv"
+    source.write_text("id,lat,lon\n" + "".join(f"{i},28.6139,77.2090\n" for i in range(50_000)))
+    with open(source, "rb") as stdin:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "lakhua", "enrich", "--chunk-size", "100"],
+            stdin=stdin,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        assert process.stdout.readline()
+        process.stdout.close()
+        assert process.wait(timeout=60) == 0
+    assert process.stderr.read() == b""
+
+
+def test_build_from_stdin(monkeypatch, capsys, tmp_path):
+    """build compiles CSV cells and locations into data files and reports counts."""
+    table = "h3,city,state,district\n8560145bfffffff,Delhi,Delhi,\n8560145bfffffff,Delhi,Delhi,\n"
+    argv = ["build", "-o", str(tmp_path), "--no-binary"]
+    exit_code, out, err = _run(monkeypatch, capsys, argv, table)
+
+    assert (exit_code, out) == (0, "")
+    assert "2 records (1 duplicates), 1 distinct locations -> r4: 1 cells, r5: 1 cells" in err
+    assert json.loads((tmp_path / "reverse_geo_5.json").read_text()) == {
+        "8560145bfffffff": {"city": "Delhi", "state": "Delhi"}
+    }
+    assert not (tmp_path / "reverse_geo.bin").exists()
+
+    exit_code, _, err = _run(monkeypatch, capsys, ["build", "-o", str(tmp_path)], "h3,city\nx,y\n")
+    assert exit_code == 1
+    assert "lakhua build: error: record 1" in err
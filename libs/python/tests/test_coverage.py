@@ -0,0 +1,182 @@
+"""Unit tests for the coverage pre-filter."""
+
+import io
+import json
+import random
+
+import h3
+import pytest
+
+from lakhua import DataLoader, DataSource, GeocodeOptions, ReverseGeocoder, StatsCollector
+from lakhua.core.coverage import CoverageFilter
+
+PARENT = "853d838bfffffff"
+CHILDREN = sorted(h3.cell_to_children(h3.cell_to_parent(PARENT, 4), 5))
+STORES = {
+    5: {
+        CHILDREN[0]: {"city": "Orchha", "state": "Madhya Pradesh"},
+        CHILDREN[1]: {"city": "Jhansi", "state": "Uttar Pradesh"},
+    },
+    4: {h3.cell_to_parent(PARENT, 4): {"city": "Niwari", "state": "Madhya Pradesh"}},
+}
+OUTSIDE = [(0.0, 0.0), (51.5074, -0.1278), (-33.8688, 151.2093), (15.0, 65.0)]
+
+
+@pytest.fixture
+def geocoder():
+    """Fixture providing a geocoder over a small dataset: two cells and their parent."""
+    source = DataSource(
+        {resolution: io.BytesIO(json.dumps(STORES[resolution]).encode()) for resolution in STORES},
+        cache=False,
+    )
+    return ReverseGeocoder.from_loader(DataLoader.from_source(source))
+
+
+def test_filter_is_conservative():
+    """Every point inside a cell is covered; far away points are not."""
+    cells = [h3.str_to_int(cell) for cell in CHILDREN[:2]]
+    coverage = CoverageFilter(cells)
+    for cell in CHILDREN[:2]:
+        for lat, lon in (h3.cell_to_latlng(cell), *h3.cell_to_boundary(cell)):
+            assert coverage.covers(lat, lon)
+    for lat, lon in OUTSIDE:
+        assert not coverage.covers(lat, lon)
+    assert 0.0 < coverage.covered_share <= 1.0
+
+    empty = CoverageFilter([])
+    assert not empty.covers(0.0, 0.0)
+    assert empty.covered_share == 0.0
+
+
+def test_filter_covers_children_of_their_parents_box():
+    """Cells boxed through their resolution-4 parent stay covered up to their vertices."""
+    for lat, lon in ((0.5, 10.0), (28.6, 77.2), (55.7, 37.6), (79.0, -40.0), (-45.0, 170.0)):
+        parent = h3.latlng_to_cell(lat, lon, 4)
+        cells = [h3.str_to_int(cell) for cell in h3.cell_to_children(parent, 5)]
+        coverage = CoverageFilter(cells)
+        for cell in cells:
+            for vertex_lat, vertex_lon in h3.cell_to_boundary(h3.int_to_str(cell)):
+                assert coverage.covers(vertex_lat, vertex_lon)
+
+
+def test_union_covers_what_any_filter_covers():
+    """A combined filter covers every point its parts cover, and not the gap between them."""
+    first = CoverageFilter([h3.str_to_int(h3.latlng_to_cell(28.6, 77.2, 5))])
+    second = CoverageFilter([h3.str_to_int(h3.latlng_to_cell(12.9, 80.2, 4))])
+    combined = CoverageFilter.union([first, second, CoverageFilter([])])
+    rng = random.Random(3)
+    for _ in range(2_000):
+        lat, lon = rng.uniform(12.0, 30.0), rng.uniform(76.0, 82.0)
+        if first.covers(lat, lon) or second.covers(lat, lon):
+            assert combined.covers(lat, lon)
+    assert combined.covers(28.6, 77.2)
+    assert combined.covers(12.9, 80.2)
+    assert not combined.covers(20.0, 79.0)
+    assert combined.covered_share < 0.1
+    assert not CoverageFilter.union([]).covers(0.0, 0.0)
+    with pytest.raises(ValueError, match="steps"):
+        CoverageFilter.union([first, CoverageFilter([], step=0.5)])
+
+
+def test_filters_are_built_with_the_data(geocoder):
+    """Loading the stores and the fallback index builds their filters, not the first lookup."""
+    loader = geocoder._data_loader
+    loader.load_fallback_index()
+    assert loader.load_fallback_index()._coverage is not None
+    assert all(loader.load_resolution_store(res)._coverage is not None for res in (4, 5))
+
+
+def test_filter_never_rejects_a_match():
+    """On random points over the bundled data, rejected points never match through H3."""
+    geocoder = ReverseGeocoder.get_instance()
+    coverage = DataLoader.get_instance().load_coverage_filter(5)
+    rng = random.Random(7)
+    rejected = 0
+    for _ in range(5_000):
+        lat, lon = rng.uniform(0.0, 40.0), rng.uniform(60.0, 100.0)
+        if not coverage.covers(lat, lon):
+            rejected += 1
+            assert geocoder.geocode_h3(h3.latlng_to_cell(lat, lon, 5)) is None
+    assert rejected > 0
+
+
+def test_single_and_batch_paths_agree(geocoder):
+    """Out-of-coverage points are misses in every path, and covered points still match."""
+    inside = h3.cell_to_latlng(CHILDREN[0])
+    points = [inside, *OUTSIDE]
+    lats, lons = [lat for lat, _ in points], [lon for _, lon in points]
+
+    single = [geocoder.geocode(lat, lon) for lat, lon in points]
+    assert single[0].city == "Orchha"
+    assert single[1:] == [None] * len(OUTSIDE)
+    assert list(geocoder.geocode_iter(points)) == single
+    assert geocoder.geocode_many(lats, lons).city == [result and result.city for result in single]
+
+
+def test_rejections_are_counted(geocoder):
+    """StatsCollector reports rejected points as out-of-coverage misses, not invalid ones."""
+    stats = StatsCollector()
+    geocoder.set_observer(stats)
+    inside = h3.cell_to_latlng(CHILDREN[1])
+    for lat, lon in (inside, *OUTSIDE):
+        geocoder.geocode(lat, lon)
+    points = [inside, *OUTSIDE, (91.0, 0.0)]
+    geocoder.geocode_many([lat for lat, _ in points], [lon for _, lon in points])
+    list(geocoder.geocode_iter(points, chunk_size=2))
+
+    snapshot = stats.snapshot()
+    assert snapshot.out_of_coverage == 3 * len(OUTSIDE)
+    assert snapshot.invalid == {"coordinates": 2}
+    assert snapshot.misses == 3 * len(OUTSIDE)
+
+
+def test_nearest_and_debug_bypass_the_filter(geocoder, monkeypatch, capsys):
+    """Nearest-cell and debug lookups don't consult the filter."""
+
+    def failing_covers(self, lat, lon):
+        raise AssertionError("coverage used")
+
+    monkeypatch.setattr(CoverageFilter, "covers", failing_covers)
+    lat, lon = h3.cell_to_latlng(CHILDREN[0])
+    assert geocoder.geocode(lat, lon, GeocodeOptions(debug=True)).city == "Orchha"
+    assert geocoder.geocode(0.0, 0.0, GeocodeOptions(nearest_distance=1)) is None
+    with pytest.raises(AssertionError, match="coverage used"):
+        geocoder.geocode(0.0, 0.0)
+    capsys.readouterr()
+
+
+def test_filter_follows_data_changes(geocoder):
+    """Filters are per resolution and rebuilt when the data changes."""
+    loader = geocoder._data_loader
+    fallback = loader.load_coverage_filter(5)
+    assert loader.load_coverage_filter(5) is fallback
+    assert loader.load_coverage_filter(5, fallback=False) is not fallback
+    assert loader.load_coverage_filter(4) is not fallback
+
+    lat, lon = h3.cell_to_latlng(CHILDREN[0])
+    far = CHILDREN[0].replace("853d8", "8560a")
+    far_lat, far_lon = h3.cell_to_latlng(far)
+    assert geocoder.geocode(far_lat, far_lon) is None
+    loader.set_stores_for_testing({5: {far: {"city": "Elsewhere", "state": "Nowhere"}}, 4: {}})
+    assert loader.load_coverage_filter(5) is not fallback
+    assert geocoder.geocode(far_lat, far_lon).city == "Elsewhere"
+    assert geocoder.geocode(lat, lon) is None
+
+
+def test_geocoder_holds_filters_per_generation(geocoder, monkeypatch):
+    """Lookups reuse the geocoder's filters until the data changes."""
+    loader = geocoder._data_loader
+    lat, lon = h3.cell_to_latlng(CHILDREN[0])
+    assert geocoder.geocode(lat, lon).city == "Orchha"
+    calls = []
+    load = loader.load_coverage_filter
+    monkeypatch.setattr(
+        loader, "load_coverage_filter", lambda *args: calls.append(args) or load(*args)
+    )
+    for _ in range(3):
+        assert geocoder.geocode(0.0, 0.0) is None
+    assert calls == []
+    loader.clear_store_cache()
+    assert geocoder.geocode(0.0, 0.0) is None
+    assert geocoder.geocode(lat, lon).city == "Orchha"
+    assert calls == [(5, True)]
@@ -0,0 +1,119 @@
+"""Unit tests for lakhua data loading."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from lakhua import DataLoader, GeocodeOptions, geocode_h3
+from lakhua.core import data_loader as data_loader_module
+
+
+@pytest.fixture
+def fresh_loader():
+    """Fixture providing the shared loader with nothing loaded yet."""
+    loader = DataLoader.get_instance()
+    loader.clear_store_cache()
+    yield loader
+    loader.clear_store_cache()
+
+
+@pytest.fixture
+def json_reads(monkeypatch, tmp_path):
+    """Record which resolutions are parsed from JSON (binary store disabled)."""
+    reads = []
+    read_store = data_loader_module.read_reverse_geo_store
+
+    def recording_read(resolution):
+        reads.append(resolution)
+        return read_store(resolution)
+
+    monkeypatch.setattr(data_loader_module, "read_reverse_geo_store", recording_read)
+    binary_path = tmp_path / "reverse_geo.bin"
+    monkeypatch.setattr(data_loader_module, "get_binary_file_path", lambda: binary_path)
+    monkeypatch.setenv("LAKHUA_CACHE_DIR", str(tmp_path / "cache"))
+    return reads
+
+
+def test_resolutions_load_on_demand(fresh_loader, json_reads):
+    """Requesting one resolution loads only that resolution."""
+    fresh_loader.load_resolution_store(4)
+    assert fresh_loader.is_loaded(4)
+    assert not fresh_loader.is_loaded(5)
+    assert json_reads == [4]
+
+
+def test_no_fallback_lookup_skips_parent_resolution(fresh_loader, json_reads):
+    """A resolution-5 lookup without fallback never loads resolution 4."""
+    geocode_h3("8560145bfffffff", GeocodeOptions(fallback=False))
+    assert json_reads == [5]
+
+
+def test_preload_declares_resolutions(fresh_loader, json_reads):
+    """preload() loads the declared resolutions up front, once."""
+    fresh_loader.preload((4,))
+    fresh_loader.preload((4,))
+    assert json_reads == [4]
+    fresh_loader.preload()
+    assert json_reads == [4, 5]
+    assert fresh_loader.is_loaded(5)
+
+
+def test_binary_store_loads_on_demand(fresh_loader):
+    """With the binary store, resolutions are still mapped one at a time."""
+    fresh_loader.load_resolution_store(5)
+    assert fresh_loader.is_loaded(5)
+    assert not fresh_loader.is_loaded(4)
+
+
+def test_concurrent_first_load_is_single_flight(fresh_loader, json_reads, monkeypatch):
+    """Threads racing on a cold loader trigger exactly one load per resolution."""
+    read_store = data_loader_module.read_reverse_geo_store
+
+    def slow_read(resolution):
+        time.sleep(0.05)  # widen the window in which a racing thread could load too
+        return read_store(resolution)
+
+    monkeypatch.setattr(data_loader_module, "read_reverse_geo_store", slow_read)
+    thread_count = 16
+    barrier = threading.Barrier(thread_count)
+
+    def load(_):
+        barrier.wait()
+        return fresh_loader.load_resolution_store(5)
+
+    with ThreadPoolExecutor(max_workers=thread_count) as pool:
+        stores = list(pool.map(load, range(thread_count)))
+
+    assert json_reads == [5]
+    assert all(store is stores[0] for store in stores)
+
+
+def test_clear_store_cache_during_lookups(fresh_loader):
+    """Clearing the cache while other threads geocode never breaks a lookup."""
+    expected = geocode_h3("8560145bfffffff")
+    errors = []
+    mismatches = []
+    stop = threading.Event()
+
+    def lookups():
+        while not stop.is_set():
+            try:
+                if geocode_h3("8560145bfffffff") != expected:
+                    mismatches.append(True)
+            except Exception as error:
+                errors.append(error)
+
+    threads = [threading.Thread(target=lookups) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for _ in range(20):
+        fresh_loader.clear_store_cache()
+        time.sleep(0.005)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert mismatches == []
@@ -0,0 +1,130 @@
+"""Unit tests for the pandas and Arrow integrations."""
+
+import random
+
+import pytest
+
+from lakhua import DataLoader, GeocodeOptions, geocode
+from lakhua.core.store import AttributeTable, field_categories
+
+POINTS = [(28.6139, 77.2090), (0.0, 0.0), (19.076, 72.8777), (12.9716, 77.5946)]
+
+
+def _random_points(count, seed=21):
+    rng = random.Random(seed)
+    return [(rng.uniform(6.5, 35.5), rng.uniform(68.0, 97.5)) for _ in range(count)]
+
+
+def _expected(points, field, options=None):
+    values = []
+    for lat, lon in points:
+        result = geocode(lat, lon, options)
+        values.append(getattr(result, field) if result is not None else None)
+    return values
+
+
+def test_field_categories_drop_missing_values():
+    """Missing values map to -1 and the remaining categories stay aligned."""
+    rows = [("A", "S", None, "1"), ("B", "S", "D", None), ("A", "T", None, "1")]
+    table = AttributeTable()
+    for row in rows:
+        table.intern(row)
+
+    for source in (table, rows):
+        categories, lookup = field_categories(source, "district")
+        assert (categories, lookup) == (["D"], [-1, 0, -1])
+        categories, lookup = field_categories(source, "state")
+        assert (categories, lookup) == (["S", "T"], [0, 0, 1])
+    with pytest.raises(ValueError, match="unknown attribute field"):
+        field_categories(table, "country")
+
+
+def test_geocode_frame_categoricals():
+    """Location columns are categorical and match geocode() row for row."""
+    pd = pytest.importorskip("pandas")
+    from lakhua.pandas import geocode_frame
+
+    points = [*POINTS, *_random_points(300)]
+    lats = [lat for lat, _ in points]
+    lats[1] = "not a number"
+    index = range(100, 100 + len(points))
+    frame = pd.DataFrame(
+        {"y": pd.Series(lats, index=index, dtype=object), "x": [lon for _, lon in points]},
+        index=index,
+    )
+    points[1] = (None, 0.0)
+
+    fields = ("city", "district", "matched_h3", "matched_resolution", "match_kind")
+    enriched = geocode_frame(frame, "y", "x", fields=fields)
+
+    assert list(enriched.index) == list(frame.index)
+    assert list(enriched.columns) == ["y", "x", *fields]
+    assert isinstance(enriched["city"].dtype, pd.CategoricalDtype)
+    assert enriched["matched_resolution"].dtype == "Int8"
+    for field in fields:
+        values = [None if pd.isna(value) else value for value in enriched[field]]
+        assert values == _expected(points, field)
+    assert "city" not in frame
+
+
+def test_geocode_frame_options_and_prefix():
+    """Options, prefixes, and field validation are honored."""
+    pd = pytest.importorskip("pandas")
+    from lakhua.pandas import geocode_frame
+
+    frame = pd.DataFrame({"lat": [p[0] for p in POINTS], "lon": [p[1] for p in POINTS]})
+    options = GeocodeOptions(resolution=4)
+    enriched = geocode_frame(frame, options=options, fields=("state", "match_kind"), prefix="geo_")
+    assert list(enriched.columns) == ["lat", "lon", "geo_state", "geo_match_kind"]
+    states = enriched["geo_state"].astype(object).where(enriched["geo_state"].notna(), None)
+    assert states.tolist() == _expected(POINTS, "state", options)
+    assert enriched["geo_match_kind"].isna().tolist() == [False, True, False, False]
+    assert enriched["geo_match_kind"][0] == "exact"
+    with pytest.raises(ValueError, match="unknown fields"):
+        geocode_frame(frame, fields=("country",))
+
+
+def test_geocode_table_dictionary_columns():
+    """Arrow output is dictionary-encoded and matches geocode() row for row."""
+    pa = pytest.importorskip("pyarrow")
+    from lakhua.arrow import TABLE_FIELDS, geocode_table
+
+    points = [*POINTS, *_random_points(300)]
+    table = pa.table({"lat": [lat for lat, _ in points], "lon": [lon for _, lon in points]})
+    fields = TABLE_FIELDS
+
+    enriched = geocode_table(table, fields=fields)
+
+    assert enriched.column_names == ["lat", "lon", *fields]
+    assert pa.types.is_dictionary(enriched.schema.field("city").type)
+    assert enriched.schema.field("matched_resolution").type == pa.int8()
+    for field in fields:
+        assert enriched.column(field).to_pylist() == _expected(points, field)
+
+
+def test_geocode_table_unparseable_coordinates():
+    """Null and non-numeric coordinates give null rows; numeric strings are parsed."""
+    pa = pytest.importorskip("pyarrow")
+    from lakhua.arrow import geocode_table
+
+    lats = pa.chunked_array([["28.6139", None, "bad"], [" 19.076 ", "1e400"]])
+    lons = pa.array([77.2090, 77.2, None, 72.8777, 1.0])
+
+    enriched = geocode_table(pa.table({"lat": lats, "lon": lons}), fields=("city",))
+
+    cities = enriched.column("city").to_pylist()
+    assert cities == [_expected(POINTS, "city")[0], None, None, _expected(POINTS, "city")[2], None]
+
+
+def test_categories_cover_the_whole_dataset():
+    """Separately enriched tables share one dictionary per field."""
+    pa = pytest.importorskip("pyarrow")
+    from lakhua.arrow import geocode_table
+
+    first = geocode_table(pa.table({"lat": [28.6139], "lon": [77.2090]}))
+    second = geocode_table(pa.table({"lat": [19.076], "lon": [72.8777]}))
+    table = DataLoader.get_instance().load_attribute_table()
+    categories, _ = field_categories(table, "city")
+    assert first.column("city").chunk(0).dictionary.to_pylist() == categories
+    dictionary = first.column("city").chunk(0).dictionary
+    assert second.column("city").chunk(0).dictionary.equals(dictionary)
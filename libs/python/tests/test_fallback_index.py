@@ -0,0 +1,115 @@
+"""Unit tests for the single-probe fallback index and H3 bit helpers."""
+
+import random
+
+import h3
+import h3.api.basic_int as h3_int
+import pytest
+
+from lakhua import DataLoader, GeocodeOptions, geocode, geocode_h3, geocode_many
+from lakhua.core.fallback_index import FallbackIndex
+from lakhua.core.h3_bits import cell_resolution, cell_to_children, cell_to_parent
+from lakhua.core.store import AttributeTable, CompactStore
+
+
+def _random_cells(count, resolution, seed=7):
+    rng = random.Random(seed)
+    return [
+        h3_int.latlng_to_cell(rng.uniform(6.5, 35.5), rng.uniform(68.0, 97.5), resolution)
+        for _ in range(count)
+    ]
+
+
+def test_bit_helpers_match_h3():
+    """Bit arithmetic agrees with the h3 library for parents, children, and resolution."""
+    for cell in _random_cells(500, 9):
+        assert cell_resolution(cell) == 9
+        for resolution in range(10):
+            assert cell_to_parent(cell, resolution) == h3_int.cell_to_parent(cell, resolution)
+    for cell in _random_cells(200, 4):
+        assert cell_to_children(cell, 4) == [cell]
+        assert cell_to_children(cell, 6) == sorted(h3_int.cell_to_children(cell, 6))
+
+
+def test_pentagon_children_skip_the_deleted_subsequence():
+    """Pentagon descendants are the valid cells h3 lists, without digit-1 children."""
+    for pentagon in [*h3_int.get_pentagons(0), *h3_int.get_pentagons(4)]:
+        resolution = h3_int.get_resolution(pentagon)
+        for target in range(resolution + 1, resolution + 3):
+            children = cell_to_children(pentagon, target)
+            assert children == sorted(h3_int.cell_to_children(pentagon, target))
+            assert all(h3_int.is_valid_cell(child) for child in children)
+
+
+def test_index_matches_per_resolution_fallback():
+    """One index probe returns what probing r5 and then the r4 parent would."""
+    loader = DataLoader.get_instance()
+    fine = loader.load_resolution_store(5)
+    coarse = loader.load_resolution_store(4)
+    index = FallbackIndex(fine, 5, coarse, 4)
+
+    for cell in _random_cells(5000, 5):
+        position = fine.find(cell)
+        if position >= 0:
+            expected = fine.result_at(position, 5)
+        else:
+            parent_position = coarse.find(h3_int.cell_to_parent(cell, 4))
+            expected = (
+                coarse.result_at(parent_position, 4, "parent") if parent_position >= 0 else None
+            )
+        assert index.lookup(cell) is expected
+
+
+def test_fine_cells_win_over_parents():
+    """A cell present at r5 keeps its own row even when its r4 parent is stored too."""
+    parent = "843da11ffffffff"
+    child, sibling = sorted(h3.cell_to_children(parent, 5))[:2]
+    attributes = AttributeTable()
+    fine = CompactStore.from_mapping({child: {"city": "Child", "state": "S"}}, attributes)
+    coarse = CompactStore.from_mapping({parent: {"city": "Parent", "state": "S"}}, attributes)
+    index = FallbackIndex(fine, 5, coarse, 4)
+
+    assert index.lookup(h3.str_to_int(child)).city == "Child"
+    result = index.lookup(h3.str_to_int(sibling))
+    assert (result.city, result.matched_h3, result.matched_resolution) == ("Parent", parent, 4)
+    assert result.match_kind == "parent"
+    assert index.lookup(h3.str_to_int("8560145bfffffff")) is None
+
+
+def test_index_follows_test_overrides():
+    """The loader rebuilds the index when the stores it was built from change."""
+    loader = DataLoader.get_instance()
+    parent = "843da11ffffffff"
+    sibling = sorted(h3.cell_to_children(parent, 5))[1]
+    lat, lon = h3.cell_to_latlng(sibling)
+    try:
+        loader.set_stores_for_testing({5: {}, 4: {parent: {"city": "Override", "state": "S"}}})
+        assert geocode(lat, lon).city == "Override"
+        assert geocode_many([lat], [lon]).city == ["Override"]
+        loader.set_stores_for_testing({5: {}, 4: {}})
+        assert geocode(lat, lon) is None
+    finally:
+        loader.set_stores_for_testing(None)
+
+
+@pytest.mark.parametrize("resolution", [4, 5])
+def test_geocode_paths_agree(resolution):
+    """geocode(), geocode_h3(), and geocode_many() return the same matches."""
+    options = GeocodeOptions(resolution=resolution)
+    rng = random.Random(11)
+    points = [(rng.uniform(6.5, 35.5), rng.uniform(68.0, 97.5)) for _ in range(500)]
+    batch = geocode_many([lat for lat, _ in points], [lon for _, lon in points], options)
+
+    for row, (lat, lon) in enumerate(points):
+        result = geocode(lat, lon, options)
+        assert result is geocode_h3(h3.latlng_to_cell(lat, lon, resolution), options)
+        assert batch[row] == result
+
+
+def test_geocode_h3_handles_fine_and_coarse_cells():
+    """Fine cells are looked up through their r5 parent; cells coarser than r4 miss."""
+    fine_cell = h3.latlng_to_cell(28.6139, 77.2090, 9)
+    result = geocode_h3(fine_cell)
+    assert result is not None
+    assert result.matched_h3 == "853da117fffffff"
+    assert geocode_h3(h3.latlng_to_cell(28.6139, 77.2090, 3)) is None
@@ -0,0 +1,79 @@
+"""Unit tests for sharing frozen data with forked worker processes."""
+
+import gc
+import os
+import subprocess
+import sys
+
+import pytest
+
+from lakhua import DataLoader, geocode
+from lakhua.core.constants import MAX_RESOLUTION, MIN_RESOLUTION
+
+WORKER_SCRIPT = """
+import os, random, sys
+import lakhua
+
+def private_kb():
+    total = 0
+    with open("/proc/self/smaps_rollup") as rollup:
+        for line in rollup:
+            if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                total += int(line.split()[1])
+    return total
+
+loader = lakhua.default_data_loader
+loader.freeze() if sys.argv[1] == "freeze" else loader.preload()
+read_end, write_end = os.pipe()
+if os.fork() == 0:
+    before = private_kb()
+    rng = random.Random(7)
+    for _ in range(int(sys.argv[2])):
+        lakhua.geocode(rng.uniform(8.0, 35.0), rng.uniform(68.0, 97.0))
+    os.write(write_end, str(private_kb() - before).encode())
+    os._exit(0)
+os.wait()
+print(os.read(read_end, 64).decode())
+"""
+
+
+def _worker_growth_kb(mode, lookups):
+    """Fork one worker after preload() or freeze(); return its USS growth over its lookups."""
+    completed = subprocess.run(
+        [sys.executable, "-c", WORKER_SCRIPT, mode, str(lookups)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(completed.stdout)
+
+
+@pytest.mark.skipif(
+    not (hasattr(os, "fork") and os.path.exists("/proc/self/smaps_rollup")),
+    reason="needs fork and Linux /proc/<pid>/smaps_rollup",
+)
+def test_frozen_workers_stay_shared():
+    """Forked workers of a frozen parent add less private memory (USS) per lookup."""
+    preloaded = _worker_growth_kb("preload", 60_000)
+    frozen = _worker_growth_kb("freeze", 60_000)
+    assert frozen < preloaded
+    # Preloaded workers build their own fallback index and result caches.
+    assert preloaded - frozen > 1024
+
+
+def test_freeze_prebuilds_everything():
+    """freeze() loads all data, builds shared results, and freezes the collector."""
+    loader = DataLoader.get_instance()
+    loader.clear_store_cache()
+    try:
+        loader.freeze()
+        assert loader.is_ready()
+        assert gc.get_freeze_count() > 0
+        fine = loader.load_resolution_store(MAX_RESOLUTION)
+        coarse = loader.load_resolution_store(MIN_RESOLUTION)
+        assert None not in fine._results["exact"]
+        assert None not in coarse._results["parent"]
+        assert geocode(28.6139, 77.2090) is not None
+    finally:
+        gc.unfreeze()
+        loader.clear_store_cache()
@@ -1,5 +1,7 @@
 """Unit tests for lakhua geocoder."""
 
+import dataclasses
+
 import h3
 import pytest
 
@@ -148,3 +150,16 @@ def test_geocode_result_structure(test_data_loader):
     assert hasattr(result, "matched_h3")
     assert hasattr(result, "matched_resolution")
 
+
+def test_geocode_result_is_shared_and_immutable(test_data_loader):
+    """Repeated lookups of one cell return the same frozen result instance."""
+    first = geocode_h3("8560145bfffffff")
+    second = geocode_h3("8560145bfffffff")
+    assert first is second
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.city = "Changed"  # type: ignore[misc]
+
+    fallback_first = geocode_h3(_get_sibling_cell("8560145bfffffff"))
+    fallback_second = geocode_h3(_get_sibling_cell("8560145bfffffff"))
+    assert fallback_first is fallback_second
+    assert fallback_first.matched_resolution == 4
@@ -0,0 +1,54 @@
+"""Regression tests for the cost of importing lakhua."""
+
+import subprocess
+import sys
+
+import pytest
+
+import lakhua
+
+
+def _import_times(statement):
+    """Run statement under -X importtime; map module -> (self, cumulative) microseconds."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        if self_us.strip().isdigit():
+            times[module.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def test_import_is_lazy():
+    """import lakhua loads only the package module, not h3, json, or the engine."""
+    baseline = _import_times("pass")
+    times = _import_times("import lakhua")
+    added = set(times) - set(baseline)
+    assert added == {"lakhua"}, f"import lakhua also imported {sorted(added - {'lakhua'})}"
+    # Generous bound; importing everything eagerly took over 100 ms.
+    assert times["lakhua"][1] < 20_000
+
+
+def test_first_use_imports_the_engine():
+    """Accessing a lookup function imports the engine, and only the sync parts."""
+    times = _import_times("import lakhua; lakhua.geocode")
+    assert "lakhua.core.geocoder" in times
+    assert "asyncio" not in times
+
+
+def test_lazy_attributes():
+    """Public names resolve on access, are cached, and appear in dir()."""
+    from lakhua.core.geocoder import default_geocoder
+
+    assert lakhua.default_geocoder is default_geocoder
+    assert "default_geocoder" in vars(lakhua)
+    assert set(lakhua.__all__) <= set(dir(lakhua))
+    with pytest.raises(AttributeError, match="no_such_name"):
+        lakhua.no_such_name  # noqa: B018
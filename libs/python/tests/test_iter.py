@@ -0,0 +1,71 @@
+"""Unit tests for the streaming geocode_iter() API."""
+
+import itertools
+import random
+from collections import namedtuple
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from lakhua import GeocodeOptions, ReverseGeocoder, geocode, geocode_iter
+
+Ping = namedtuple("Ping", ["lon", "lat"])
+
+
+def _points(count, seed=9):
+    rng = random.Random(seed)
+    return [(rng.uniform(6.5, 35.5), rng.uniform(68.0, 97.5)) for _ in range(count)]
+
+
+def test_results_match_geocode_in_order():
+    """Every point yields exactly what geocode() returns, in input order."""
+    points = _points(500)
+    options = GeocodeOptions(resolution=4)
+    results = list(geocode_iter(iter(points), options, chunk_size=64))
+    assert results == [geocode(lat, lon, options) for lat, lon in points]
+
+
+def test_point_shapes():
+    """Tuples, dicts, objects, named tuples, and array rows are all understood."""
+    lat, lon = 28.6139, 77.2090
+    expected = geocode(lat, lon)
+    points = [
+        (lat, lon),
+        [lat, lon],
+        {"lat": lat, "lon": lon, "id": 1},
+        SimpleNamespace(lat=lat, lon=lon),
+        Ping(lon=lon, lat=lat),
+        np.array([lat, lon]),
+        {"latitude": lat},
+        object(),
+        ("bad", None),
+    ]
+    results = list(geocode_iter(points))
+    assert results[:6] == [expected] * 6
+    assert results[6:] == [None, None, None]
+
+    renamed = [{"y": lat, "x": lon}, SimpleNamespace(y=lat, x=lon)]
+    assert list(geocode_iter(renamed, lat_key="y", lon_key="x")) == [expected, expected]
+
+
+def test_stream_is_consumed_lazily():
+    """Only one chunk is pulled ahead of the consumer, even from an endless stream."""
+    pulled = []
+
+    def endless():
+        for index in itertools.count():
+            pulled.append(index)
+            yield {"id": index, "lat": 28.6139, "lon": 77.2090}
+
+    stream = ReverseGeocoder.get_instance().geocode_iter(endless(), chunk_size=10, with_points=True)
+    first = list(itertools.islice(stream, 15))
+    assert [point["id"] for point, _ in first] == list(range(15))
+    assert all(result.city == geocode(28.6139, 77.2090).city for _, result in first)
+    assert len(pulled) == 20
+
+
+def test_invalid_chunk_size():
+    """chunk_size is validated when the iterator is created."""
+    with pytest.raises(ValueError, match="chunk_size"):
+        geocode_iter([], chunk_size=0)
@@ -0,0 +1,92 @@
+"""Unit tests for the nearest-covered-cell fallback."""
+
+import random
+
+import h3
+import h3.api.basic_int as h3_int
+import pytest
+
+from lakhua import DataLoader, GeocodeOptions, ReverseGeocoder, geocode, geocode_h3, geocode_many
+from lakhua.core.gap_index import GapFillIndex
+
+COVERED = "853da117fffffff"
+
+
+@pytest.fixture
+def single_cell_store():
+    """Fixture serving one covered resolution-5 cell and no resolution-4 data."""
+    loader = DataLoader.get_instance()
+    loader.set_stores_for_testing({5: {COVERED: {"city": "Covered", "state": "S"}}, 4: {}})
+    yield loader
+    loader.set_stores_for_testing(None)
+
+
+def test_nearest_is_opt_in(single_cell_store):
+    """Cells two rings away only match once nearest_distance reaches 2."""
+    gap_cell = sorted(h3.grid_ring(COVERED, 2))[0]
+    assert geocode_h3(gap_cell) is None
+    assert geocode_h3(gap_cell, GeocodeOptions(nearest_distance=1)) is None
+    assert geocode_h3(gap_cell, GeocodeOptions(nearest_distance=2, fallback=False)) is None
+
+    result = geocode_h3(gap_cell, GeocodeOptions(nearest_distance=2))
+    assert result is not None
+    assert (result.city, result.matched_h3, result.match_kind) == ("Covered", COVERED, "nearest")
+    assert geocode_h3(COVERED, GeocodeOptions(nearest_distance=2)).match_kind == "exact"
+
+
+def test_nearest_in_batch_and_cache(single_cell_store):
+    """geocode_many() and the coordinate cache honor nearest_distance too."""
+    lat, lon = h3.cell_to_latlng(sorted(h3.grid_ring(COVERED, 1))[0])
+    options = GeocodeOptions(nearest_distance=1)
+
+    batch = geocode_many([lat, lat], [lon, lon + 5], options)
+    assert batch.city == ["Covered", None]
+    assert batch.match_kind == ["nearest", None]
+    assert batch[0] == geocode(lat, lon, options)
+
+    geocoder = ReverseGeocoder.get_instance()
+    geocoder.enable_coordinate_cache()
+    try:
+        assert geocode(lat, lon) is None
+        assert geocode(lat, lon, options).match_kind == "nearest"
+    finally:
+        geocoder.disable_coordinate_cache()
+
+
+def test_gap_index_finds_closest_cell():
+    """Recorded distances match a brute-force k-ring search around each gap."""
+    covered = sorted(h3_int.latlng_to_cell(lat, 78.0, 5) for lat in (20.0, 20.5, 21.0))
+    index = GapFillIndex(covered, 4)
+    nearby = {cell for center in covered for cell in h3_int.grid_disk(center, 6)}
+
+    for cell in nearby.difference(covered):
+        closest = min(h3_int.grid_distance(cell, other) for other in covered)
+        distance = index.distance(cell)
+        if closest > 4:
+            assert distance is None
+            continue
+        assert distance == closest
+        nearest = index.nearest(cell, distance)
+        assert h3_int.grid_distance(cell, nearest) == closest
+        assert index.nearest(cell, distance - 1) is None
+    assert index.nearest(covered[0], 4) is None
+
+
+@pytest.mark.parametrize("resolution", [4, 5])
+def test_nearest_on_real_data(resolution):
+    """Nearest matches stay within range and only replace misses."""
+    options = GeocodeOptions(resolution=resolution, nearest_distance=2)
+    rng = random.Random(13)
+    kinds = set()
+    for _ in range(2000):
+        lat, lon = rng.uniform(6.5, 35.5), rng.uniform(68.0, 97.5)
+        plain = geocode(lat, lon, GeocodeOptions(resolution=resolution))
+        result = geocode(lat, lon, options)
+        if plain is not None:
+            assert result is plain
+        elif result is not None:
+            kinds.add(result.match_kind)
+            assert result.match_kind == "nearest"
+            cell = h3.latlng_to_cell(lat, lon, result.matched_resolution)
+            assert h3.grid_distance(cell, result.matched_h3) <= 2
+    assert kinds == {"nearest"}
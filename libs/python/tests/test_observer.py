@@ -0,0 +1,129 @@
+"""Unit tests for lookup observers and the built-in stats collector."""
+
+import h3
+import pytest
+
+from lakhua import (
+    DataLoader,
+    GeocodeObserver,
+    GeocodeOptions,
+    ReverseGeocoder,
+    StatsCollector,
+    geocode_iter,
+)
+
+TEST_CELL_5 = "8560145bfffffff"
+OTHER_CELL_5 = "85618c4bfffffff"
+
+
+@pytest.fixture
+def stats():
+    """Fixture installing a collector on the shared geocoder over small test data."""
+    loader = DataLoader.get_instance()
+    loader.set_stores_for_testing(
+        {
+            5: {TEST_CELL_5: {"city": "New Delhi", "state": "Delhi"}},
+            4: {h3.cell_to_parent(OTHER_CELL_5, 4): {"city": "Pune", "state": "Maharashtra"}},
+        }
+    )
+    collector = StatsCollector()
+    geocoder = ReverseGeocoder.get_instance()
+    geocoder.set_observer(collector)
+    yield collector
+    geocoder.set_observer(None)
+    loader.set_stores_for_testing(None)
+    loader.clear_store_cache()
+
+
+def test_single_lookups_are_counted(stats):
+    """Hits, fallbacks, misses, and rejected inputs land in their own counters."""
+    geocoder = ReverseGeocoder.get_instance()
+    assert geocoder.geocode(*h3.cell_to_latlng(TEST_CELL_5)) is not None
+    assert geocoder.geocode_h3(OTHER_CELL_5).match_kind == "parent"
+    assert geocoder.geocode(0.0, 0.0) is None
+    assert geocoder.geocode(100.0, 0.0) is None
+    assert geocoder.geocode_h3("not-a-cell") is None
+    assert geocoder.geocode_h3(h3.cell_to_parent(TEST_CELL_5, 2)) is None
+
+    snapshot = stats.snapshot()
+    assert snapshot.lookups == 6
+    assert snapshot.hits == {4: 1, 5: 1}
+    assert (snapshot.fallbacks, snapshot.nearest, snapshot.misses) == (1, 0, 1)
+    assert snapshot.invalid == {"coordinates": 1, "h3_index": 1, "resolution": 1}
+    assert sum(snapshot.latency_counts) == 3
+    assert snapshot.latency_sum > 0
+    assert 0 < snapshot.latency_quantile(0.5) <= snapshot.latency_quantile(1.0)
+
+
+def test_batches_are_counted(stats):
+    """geocode_many() and geocode_iter() report per-point outcomes once per batch."""
+    geocoder = ReverseGeocoder.get_instance()
+    lat, lon = h3.cell_to_latlng(TEST_CELL_5)
+    geocoder.geocode_many([lat, 0.0, "bad"], [lon, 0.0, 1.0])
+    list(geocode_iter([(lat, lon), (0.0, 0.0)], chunk_size=1))
+
+    snapshot = stats.snapshot()
+    assert (snapshot.batches, snapshot.batch_points, snapshot.lookups) == (3, 5, 0)
+    assert snapshot.hits == {5: 2}
+    assert snapshot.misses == 2
+    assert snapshot.invalid == {"coordinates": 1}
+    assert snapshot.batch_seconds > 0
+    assert sum(snapshot.latency_counts) == 0
+
+
+def test_snapshot_is_a_copy_and_reset_clears(stats):
+    """Snapshots don't change after more lookups, and reset() starts from zero."""
+    geocoder = ReverseGeocoder.get_instance()
+    geocoder.geocode(0.0, 0.0)
+    snapshot = stats.snapshot()
+    geocoder.geocode(0.0, 0.0)
+    assert snapshot.misses == 1
+    assert stats.snapshot().misses == 2
+    stats.reset()
+    assert stats.snapshot().misses == 0
+    assert stats.snapshot().latency_quantile(0.99) == 0.0
+
+
+def test_load_events_are_reported():
+    """Store loads and index builds are reported with their source and size."""
+    loader = DataLoader.get_instance()
+    loader.clear_store_cache()
+    collector = StatsCollector()
+    geocoder = ReverseGeocoder.get_instance()
+    geocoder.set_observer(collector)
+    try:
+        geocoder.geocode(28.6139, 77.2090, GeocodeOptions(nearest_distance=1))
+    finally:
+        geocoder.set_observer(None)
+
+    loads = collector.snapshot().loads
+    assert [(event.kind, event.resolution) for event in loads] == [
+        ("store", 5),
+        ("store", 4),
+        ("fallback_index", 5),
+    ]
+    assert {event.source for event in loads[:2]} <= {"binary", "json"}
+    assert loads[2].source == "built"
+    assert all(event.cells > 0 and event.seconds >= 0 for event in loads)
+
+
+def test_custom_observer_and_removal(stats):
+    """Custom observers only override what they need; None uninstalls them."""
+
+    class Misses(GeocodeObserver):
+        def __init__(self):
+            self.count = 0
+
+        def on_lookup(self, result, seconds):
+            self.count += result is None
+
+    geocoder = ReverseGeocoder.get_instance()
+    observer = Misses()
+    geocoder.set_observer(observer)
+    assert geocoder.observer is observer
+    geocoder.geocode(0.0, 0.0)
+    geocoder.geocode_many([0.0], [0.0])
+    geocoder.set_observer(None)
+    geocoder.geocode(0.0, 0.0)
+    assert observer.count == 1
+    assert stats.snapshot().lookups == 0
@@ -0,0 +1,137 @@
+"""Unit tests for the latitude/longitude lookup raster."""
+
+import io
+import json
+import random
+
+import h3
+import pytest
+
+from lakhua import DataLoader, DataSource, GeocodeOptions, ReverseGeocoder, StatsCollector
+from lakhua.core.raster import RasterIndex, raster_report
+
+PARENT = "853d838bfffffff"
+CHILDREN = sorted(h3.cell_to_children(h3.cell_to_parent(PARENT, 4), 5))
+STORES = {
+    5: {
+        CHILDREN[0]: {"city": "Orchha", "state": "Madhya Pradesh"},
+        CHILDREN[1]: {"city": "Orchha", "state": "Madhya Pradesh"},
+        CHILDREN[2]: {"city": "Jhansi", "state": "Uttar Pradesh"},
+    },
+    4: {h3.cell_to_parent(PARENT, 4): {"city": "Niwari", "state": "Madhya Pradesh"}},
+}
+
+
+@pytest.fixture
+def geocoder():
+    """Fixture providing a geocoder over a small dataset: three cells and their parent."""
+    source = DataSource(
+        {resolution: io.BytesIO(json.dumps(STORES[resolution]).encode()) for resolution in STORES},
+        cache=False,
+    )
+    return ReverseGeocoder.from_loader(DataLoader.from_source(source))
+
+
+def _points(raster, count, seed=0):
+    """Return reproducible random points over a raster's grid and a little beyond."""
+    rng = random.Random(seed)
+    margin = 5 * raster.step
+    return [
+        (
+            rng.uniform(raster.min_lat - margin, raster.min_lat + raster.rows * raster.step),
+            rng.uniform(raster.min_lon - margin, raster.min_lon + raster.cols * raster.step),
+        )
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("step", [0.05, 0.01])
+def test_raster_matches_h3_lookups(geocoder, step):
+    """Geocoding through the raster returns the same shared results as the H3 path."""
+    raster = geocoder.enable_raster(step)
+    points = _points(raster, 5_000)
+    with_raster = [geocoder.geocode(lat, lon) for lat, lon in points]
+    stats = StatsCollector()
+    geocoder.set_observer(stats)
+    observed = [geocoder.geocode(lat, lon) for lat, lon in points]
+    geocoder.set_observer(None)
+    geocoder.disable_raster()
+    without = [geocoder.geocode(lat, lon) for lat, lon in points]
+
+    assert all(a is b is c for a, b, c in zip(with_raster, observed, without))
+    assert stats.snapshot().lookups == len(points)
+    assert {result.city for result in without if result} == {"Orchha", "Jhansi", "Niwari"}
+    assert None in without
+    fast = [raster.find(lat, lon) for lat, lon in points]
+    assert any(slot > 0 for slot in fast)
+
+
+def test_boundary_pixels_use_h3(geocoder):
+    """Pixels on a border between different matches are left to the H3 lookup."""
+    raster = geocoder.enable_raster(0.01)
+    shared = set(h3.cell_to_boundary(CHILDREN[1])) & set(h3.cell_to_boundary(CHILDREN[2]))
+    for lat, lon in shared:
+        assert raster.find(lat, lon) == -1
+        assert geocoder.geocode(lat, lon) is geocoder.geocode_h3(h3.latlng_to_cell(lat, lon, 5))
+    center = h3.cell_to_latlng(CHILDREN[2])
+    assert raster.results[raster.find(*center)].city == "Jhansi"
+    # Outside the grid nothing is known without H3.
+    assert raster.find(raster.min_lat - 1, raster.min_lon) == -1
+
+
+def test_raster_only_serves_default_lookups(geocoder, monkeypatch):
+    """Other options and changed data bypass the raster."""
+    raster = geocoder.enable_raster(0.05)
+    lat, lon = h3.cell_to_latlng(CHILDREN[0])
+    assert raster.find(lat, lon) > 0
+
+    def failing_find(self, lat, lon):
+        raise AssertionError("raster used")
+
+    monkeypatch.setattr(RasterIndex, "find", failing_find)
+    for options in (
+        GeocodeOptions(resolution=4),
+        GeocodeOptions(fallback=False),
+        GeocodeOptions(nearest_distance=1),
+    ):
+        assert geocoder.geocode(lat, lon, options) is not None
+    with pytest.raises(AssertionError, match="raster used"):
+        geocoder.geocode(lat, lon)
+
+    geocoder._data_loader.clear_store_cache()
+    assert geocoder.geocode(lat, lon).city == "Orchha"
+    monkeypatch.undo()
+    assert geocoder.enable_raster(0.05).generation == geocoder._data_loader.generation
+    assert geocoder.raster is not raster
+
+
+def test_batches_use_the_raster(geocoder):
+    """geocode_many() resolves raster pixels without H3 and returns the same rows."""
+    raster = geocoder.enable_raster(0.01)
+    points = [*_points(raster, 2_000), (None, 1.0), ("x", 2.0), (float("nan"), 0.0)]
+    lats, lons = [lat for lat, _ in points], [lon for _, lon in points]
+
+    slots = raster.find_many(lats, lons)
+    assert slots[:-3] == [raster.find(lat, lon) for lat, lon in points[:-3]]
+    assert slots[-3:] == [-1, -1, -1]
+    assert any(slot > 0 for slot in slots)
+
+    with_raster = geocoder.geocode_many(lats, lons)
+    geocoder.disable_raster()
+    without = geocoder.geocode_many(lats, lons)
+    for column in ("codes", "matched_h3", "matched_resolution", "match_kind"):
+        assert getattr(with_raster, column) == getattr(without, column)
+
+
+def test_raster_report(geocoder):
+    """Reports size the grid and find the raster exact; finer steps skip H3 more often."""
+    loader = geocoder._data_loader
+    coarse, fine = raster_report([0.05, 0.01], loader, samples=2_000, seed=1)
+    assert (coarse.step, coarse.samples) == (0.05, 2_000)
+    assert coarse.memory_bytes == coarse.rows * coarse.cols * 2
+    assert fine.memory_bytes > coarse.memory_bytes
+    assert fine.unresolved_share < coarse.unresolved_share
+    assert fine.fast_share > coarse.fast_share
+    assert coarse.accuracy == fine.accuracy == 1.0
+    with pytest.raises(ValueError, match="step must be at least"):
+        RasterIndex.from_loader(loader, 0.0)
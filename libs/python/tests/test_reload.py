@@ -0,0 +1,136 @@
+"""Unit tests for atomic dataset reloads."""
+
+import json
+import threading
+
+import h3
+import pytest
+
+from lakhua import DataLoader, geocode, geocode_h3
+from lakhua.core import constants as constants_module
+from lakhua.core import data_loader as data_loader_module
+
+DELHI_CELL = "8560145bfffffff"
+ORCHHA_CELL = "853d838bfffffff"
+
+
+def _write_stores(data_dir, city):
+    """Write a small two-resolution dataset whose Delhi cell is named city."""
+    stores = {
+        5: {
+            DELHI_CELL: {"city": city, "state": "Delhi"},
+            ORCHHA_CELL: {"city": "Orchha", "state": "Madhya Pradesh"},
+        },
+        4: {h3.cell_to_parent(ORCHHA_CELL, 4): {"city": "Orchha", "state": "Madhya Pradesh"}},
+    }
+    for resolution, store in stores.items():
+        path = data_dir / f"reverse_geo_{resolution}.json"
+        temp = path.with_suffix(".tmp")
+        temp.write_text(json.dumps(store), encoding="utf-8")
+        temp.replace(path)
+
+
+@pytest.fixture
+def data_dir(monkeypatch, tmp_path):
+    """Point the shared loader at a temporary data directory."""
+
+    def data_file(resolution):
+        return tmp_path / f"reverse_geo_{resolution}.json"
+
+    monkeypatch.setattr(constants_module, "get_data_file_path", data_file)
+    monkeypatch.setattr(data_loader_module, "get_data_file_path", data_file)
+    monkeypatch.setattr(data_loader_module, "get_binary_file_path", lambda: tmp_path / "geo.bin")
+    monkeypatch.setenv("LAKHUA_CACHE_DIR", str(tmp_path / "cache"))
+    _write_stores(tmp_path, "New Delhi")
+    loader = DataLoader.get_instance()
+    loader.clear_store_cache()
+    yield tmp_path
+    loader.clear_store_cache()
+
+
+def test_reload_swaps_in_new_data(data_dir):
+    """A reload publishes the new data and version in one step."""
+    loader = DataLoader.get_instance()
+    assert loader.dataset_version is None
+    assert geocode_h3(DELHI_CELL).city == "New Delhi"
+    old_version = loader.dataset_version
+    assert old_version is not None
+
+    _write_stores(data_dir, "Dilli")
+    future = loader.reload()
+    new_version = future.result(timeout=60)
+
+    assert new_version == loader.dataset_version != old_version
+    assert geocode_h3(DELHI_CELL).city == "Dilli"
+    assert loader.is_ready()
+
+
+def test_reload_of_same_data_keeps_version(data_dir):
+    """Versions identify content, whether the data came from JSON or the binary store."""
+    loader = DataLoader.get_instance()
+    first = loader.reload(background=False).result()
+    # The first reload parsed JSON and compiled the binary store; this one maps it.
+    assert (data_dir / "cache" / f"reverse_geo-{first}.bin").exists()
+    assert loader.reload(background=False).result() == first
+
+
+def test_failed_reload_keeps_current_data(data_dir):
+    """Invalid data is rejected and lookups keep using the current version."""
+    loader = DataLoader.get_instance()
+    loader.reload(background=False).result()
+    version = loader.dataset_version
+
+    (data_dir / "reverse_geo_5.json").write_text("{}", encoding="utf-8")
+    future = loader.reload()
+    with pytest.raises(ValueError, match="no cells at resolution 5"):
+        future.result(timeout=60)
+    assert loader.dataset_version == version
+    assert geocode_h3(DELHI_CELL).city == "New Delhi"
+
+
+def test_lookups_continue_during_reload():
+    """Lookups running while reloads swap the data never miss or fail."""
+    loader = DataLoader.get_instance()
+    loader.preload()
+    expected = geocode(28.6139, 77.2090)
+    stop = threading.Event()
+    results = []
+
+    def lookups():
+        while not stop.is_set():
+            results.append(geocode(28.6139, 77.2090))
+
+    thread = threading.Thread(target=lookups)
+    thread.start()
+    try:
+        for _ in range(3):
+            loader.reload().result(timeout=60)
+    finally:
+        stop.set()
+        thread.join()
+    assert results
+    assert all(result is not None and result.city == expected.city for result in results)
+
+
+def test_watch_reloads_on_change(data_dir):
+    """The watcher reloads when a data file changes, until stopped."""
+    loader = DataLoader.get_instance()
+    loader.preload()
+    reloaded = threading.Event()
+    versions = []
+
+    def on_reload(version):
+        versions.append(version)
+        reloaded.set()
+
+    watcher = loader.watch(interval=0.05, on_reload=on_reload)
+    try:
+        _write_stores(data_dir, "Dilli")
+        assert reloaded.wait(timeout=30)
+    finally:
+        watcher.stop()
+    assert not watcher.running
+    assert versions[0] == loader.dataset_version
+    assert geocode_h3(DELHI_CELL).city == "Dilli"
+    with pytest.raises(ValueError, match="interval"):
+        loader.watch(interval=0)
@@ -0,0 +1,146 @@
+"""Unit tests for loading data from user-supplied sources."""
+
+import gzip
+import io
+import json
+
+import h3
+import pytest
+
+from lakhua import DataLoader, DataSource, ReverseGeocoder, geocode_h3
+from lakhua.core import constants as constants_module
+from lakhua.core import data_loader as data_loader_module
+
+DELHI_CELL = "8560145bfffffff"
+ORCHHA_CELL = "853d838bfffffff"
+STORES = {
+    5: {
+        DELHI_CELL: {"city": "Dilli", "state": "Delhi"},
+        ORCHHA_CELL: {"city": "Orchha", "state": "Madhya Pradesh"},
+    },
+    4: {h3.cell_to_parent(ORCHHA_CELL, 4): {"city": "Orchha", "state": "Madhya Pradesh"}},
+}
+
+
+def _encoded(resolution):
+    """Return one resolution of the test dataset as JSON bytes."""
+    return json.dumps(STORES[resolution]).encode()
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Fixture providing a directory with the test dataset as plain JSON."""
+    directory = tmp_path / "data"
+    directory.mkdir()
+    for resolution in STORES:
+        (directory / f"reverse_geo_{resolution}.json").write_bytes(_encoded(resolution))
+    return directory
+
+
+def test_loader_from_directory(data_dir, tmp_path):
+    """A loader built from a directory serves its data, independently of the default one."""
+    loader = DataLoader.from_directory(data_dir, cache_dir=tmp_path / "cache")
+    geocoder = ReverseGeocoder.from_loader(loader)
+    assert loader is not DataLoader.get_instance()
+    assert geocoder is not ReverseGeocoder.get_instance()
+
+    assert geocoder.geocode_h3(DELHI_CELL).city == "Dilli"
+    assert geocoder.geocode_h3(h3.cell_to_parent(DELHI_CELL, 4)) is None
+    assert loader.is_ready()
+    assert loader.dataset_version is not None
+    assert geocode_h3(DELHI_CELL).city != "Dilli"
+
+
+def test_compressed_and_file_object_sources(tmp_path):
+    """Gzip-compressed files and open file objects are read like plain JSON files."""
+    compressed = tmp_path / "r5.json.gz"
+    compressed.write_bytes(gzip.compress(_encoded(5)))
+    source = DataSource({5: compressed, 4: io.BytesIO(_encoded(4))}, cache=False)
+    loader = DataLoader.from_source(source)
+    assert ReverseGeocoder.from_loader(loader).geocode_h3(ORCHHA_CELL).city == "Orchha"
+
+    plain = DataLoader.from_source(
+        DataSource({5: io.BytesIO(_encoded(5)), 4: io.BytesIO(_encoded(4))}, cache=False)
+    )
+    plain.preload()
+    # Versions identify the file contents as stored, so compression changes them.
+    assert plain.dataset_version not in (None, loader.dataset_version)
+    with pytest.raises(ValueError, match="no files"):
+        plain.watch()
+
+
+def test_zstd_directory(tmp_path):
+    """A directory of zstd-compressed files is found and decompressed."""
+    zstandard = pytest.importorskip("zstandard")
+    for resolution in STORES:
+        path = tmp_path / f"reverse_geo_{resolution}.json.zst"
+        path.write_bytes(zstandard.ZstdCompressor().compress(_encoded(resolution)))
+    loader = DataLoader.from_directory(tmp_path, cache=False)
+    assert ReverseGeocoder.from_loader(loader).geocode_h3(DELHI_CELL).city == "Dilli"
+
+
+def test_cache_skips_parsing(data_dir, tmp_path, monkeypatch):
+    """A second loader of the same files maps the cached copy instead of parsing."""
+    cache_dir = tmp_path / "cache"
+    first = DataLoader.from_directory(data_dir, cache_dir=cache_dir)
+    first.preload()
+    cached = list(cache_dir.iterdir())
+    assert [path.name for path in cached] == [f"reverse_geo-{first.dataset_version}.bin"]
+
+    def failing_parse(raw, resolution, name):
+        raise AssertionError("parsed instead of using the cache")
+
+    monkeypatch.setattr(data_loader_module, "parse_store", failing_parse)
+    second = DataLoader.from_directory(data_dir, cache_dir=cache_dir)
+    assert ReverseGeocoder.from_loader(second).geocode_h3(DELHI_CELL).city == "Dilli"
+    assert second.dataset_version == first.dataset_version
+
+    # A damaged cache file is ignored and the source parsed again.
+    monkeypatch.undo()
+    cached[0].write_bytes(b"not a binary store")
+    third = DataLoader.from_directory(data_dir, cache_dir=cache_dir)
+    assert ReverseGeocoder.from_loader(third).geocode_h3(DELHI_CELL).city == "Dilli"
+
+
+@pytest.mark.parametrize(
+    ("contents", "message"),
+    [
+        (b"{not json", "corrupt data file"),
+        (b"[]", "expected a JSON object"),
+        (json.dumps({"not-a-cell": {"city": "X"}}).encode(), "isn't an H3 cell at resolution 5"),
+        (json.dumps({h3.cell_to_parent(DELHI_CELL, 4): {}}).encode(), "resolution 5"),
+        (json.dumps({DELHI_CELL: {"city": 1}}).encode(), "object of strings"),
+        (json.dumps({DELHI_CELL: {}}).encode(), "no cells at resolution 5"),
+    ],
+)
+def test_invalid_data_fails_loudly(data_dir, contents, message):
+    """Corrupt or invalid data raises on load instead of serving misses."""
+    (data_dir / "reverse_geo_5.json").write_bytes(contents)
+    loader = DataLoader.from_directory(data_dir, cache=False)
+    with pytest.raises(ValueError, match=message):
+        loader.preload()
+    assert not loader.is_loaded(5)
+
+
+def test_missing_data_fails_loudly(data_dir, tmp_path, monkeypatch):
+    """Missing data files raise instead of loading as empty data."""
+    (data_dir / "reverse_geo_4.json").unlink()
+    with pytest.raises(FileNotFoundError, match="resolution 4"):
+        DataLoader.from_directory(data_dir)
+    with pytest.raises(ValueError, match="one data file per resolution"):
+        DataSource({5: data_dir / "reverse_geo_5.json"})
+
+    def missing_file(resolution):
+        return tmp_path / f"missing_{resolution}.json"
+
+    monkeypatch.setattr(constants_module, "get_data_file_path", missing_file)
+    monkeypatch.setattr(data_loader_module, "get_data_file_path", missing_file)
+    monkeypatch.setattr(data_loader_module, "get_binary_file_path", lambda: tmp_path / "none.bin")
+    loader = DataLoader.get_instance()
+    loader.clear_store_cache()
+    try:
+        with pytest.raises(FileNotFoundError, match="resolution 5"):
+            geocode_h3(DELHI_CELL)
+    finally:
+        monkeypatch.undo()
+        loader.clear_store_cache()
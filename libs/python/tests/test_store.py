@@ -0,0 +1,82 @@
+"""Unit tests for the compact lakhua store backend."""
+
+import h3
+import pytest
+
+from lakhua import DataLoader
+from lakhua.core.constants import read_reverse_geo_store
+from lakhua.core.store import AttributeTable, CompactStore
+
+RAW_STORE = {
+    "8560145bfffffff": {
+        "city": "New Delhi",
+        "state": "Delhi",
+        "district": "Central Delhi",
+        "pincode": "110001",
+    },
+    "853d838bfffffff": {"city": "Orchha", "state": "Madhya Pradesh"},
+    "8560b693fffffff": {},
+}
+
+
+def test_find_uses_integer_cells():
+    """Integer lookups return positions for present cells and -1 otherwise."""
+    store = CompactStore.from_mapping(RAW_STORE)
+    position = store.find(h3.str_to_int("853d838bfffffff"))
+    assert position >= 0
+    assert store.row_at(position) == ("Orchha", "Madhya Pradesh", None, None)
+    assert h3.int_to_str(store.cell_at(position)) == "853d838bfffffff"
+    assert store.find(h3.str_to_int("8660145bfffffff")) == -1
+
+
+def test_mapping_compatibility():
+    """The store still reads like the JSON dictionary it was built from."""
+    store = CompactStore.from_mapping(RAW_STORE)
+    assert len(store) == 2  # empty metadata is never a match
+    assert store["8560145bfffffff"] == RAW_STORE["8560145bfffffff"]
+    assert store.get("853d838bfffffff") == RAW_STORE["853d838bfffffff"]
+    assert store.get("8560b693fffffff") is None
+    assert store.get("not-a-cell") is None
+    assert sorted(store) == sorted(["8560145bfffffff", "853d838bfffffff"])
+
+
+def test_loaded_store_matches_json():
+    """Every cell in the bundled data reads back unchanged from the compact store."""
+    loader = DataLoader.get_instance()
+    for resolution in (4, 5):
+        raw = read_reverse_geo_store(resolution)
+        store = loader.load_resolution_store(resolution)
+        assert len(store) == len(raw)
+        assert all(store[key] == value for key, value in raw.items())
+
+
+def test_attribute_table_deduplicates_rows():
+    """Equal location tuples share one code, even across stores."""
+    table = AttributeTable()
+    store_5 = CompactStore.from_mapping(RAW_STORE, table)
+    store_4 = CompactStore.from_mapping(
+        {"843d839ffffffff": {"city": "Orchha", "state": "Madhya Pradesh"}}, table
+    )
+    assert len(table) == 2
+    orchha_5 = store_5.code_at(store_5.find(h3.str_to_int("853d838bfffffff")))
+    orchha_4 = store_4.code_at(store_4.find(h3.str_to_int("843d839ffffffff")))
+    assert orchha_5 == orchha_4
+    assert store_4.attributes is store_5.attributes
+
+
+def test_attribute_table_seal_and_column():
+    """Sealed tables keep their codes and still accept new rows."""
+    table = AttributeTable()
+    first = table.intern(("Konta", "Chhattisgarh", "Konta Tahsil", "494114"))
+    second = table.intern(("Penta", "Chhattisgarh", "Konta Tahsil", None))
+    table.seal()
+    assert table.intern(("Konta", "Chhattisgarh", "Konta Tahsil", "494114")) == first
+    third = table.intern(("Orchha", "Madhya Pradesh", None, None))
+    assert (first, second, third) == (0, 1, 2)
+
+    categories, field_codes = table.column("state")
+    assert categories == ["Chhattisgarh", "Madhya Pradesh"]
+    assert list(field_codes) == [0, 0, 1]
+    assert table.column("district")[0] == ["Konta Tahsil", None]
+    with pytest.raises(ValueError, match="unknown attribute field"):
+        table.column("country")
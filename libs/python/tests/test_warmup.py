@@ -0,0 +1,70 @@
+"""Unit tests for warm-up and readiness checks."""
+
+import threading
+
+import pytest
+
+import lakhua
+from lakhua import DataLoader
+from lakhua.core import data_loader as data_loader_module
+
+
+@pytest.fixture
+def loader():
+    """Fixture providing the shared loader with nothing loaded yet."""
+    instance = DataLoader.get_instance()
+    instance.clear_store_cache()
+    yield instance
+    instance.clear_store_cache()
+
+
+def test_background_warmup_makes_lookups_ready(loader):
+    """warmup() loads on another thread and is_ready() flips once it's done."""
+    assert not lakhua.is_ready()
+    future = lakhua.warmup()
+    assert future.result(timeout=60) is None
+    assert lakhua.is_ready()
+    assert all(loader.is_loaded(resolution) for resolution in lakhua.SUPPORTED_RESOLUTIONS)
+    assert lakhua.geocode(28.6139, 77.2090) is not None
+
+    loader.clear_store_cache()
+    assert not lakhua.is_ready()
+
+
+def test_blocking_warmup_of_some_resolutions(loader):
+    """A foreground warm-up returns a finished future and only loads what was asked."""
+    future = lakhua.warmup((4,), background=False, nearest=True)
+    assert future.done()
+    assert lakhua.is_ready((4,))
+    assert not lakhua.is_ready()
+    assert not loader.is_loaded(5)
+
+
+def test_warmup_runs_off_the_calling_thread(loader, monkeypatch):
+    """Background loads happen on a separate thread."""
+    threads = []
+    preload = loader.preload
+
+    def recording_preload(resolutions, debug=False):
+        threads.append(threading.current_thread())
+        preload(resolutions, debug)
+
+    monkeypatch.setattr(loader, "preload", recording_preload)
+    loader.warmup().result(timeout=60)
+    assert len(threads) == 1
+    assert threads[0] is not threading.current_thread()
+
+
+def test_warmup_failure_is_reported(loader, monkeypatch, tmp_path):
+    """A load error is raised from the future and the loader stays not ready."""
+
+    def failing_read(resolution):
+        raise ValueError(f"corrupt r{resolution}")
+
+    monkeypatch.setattr(data_loader_module, "read_reverse_geo_store", failing_read)
+    monkeypatch.setattr(data_loader_module, "get_binary_file_path", lambda: tmp_path / "none.bin")
+
+    future = lakhua.warmup()
+    with pytest.raises(ValueError, match="corrupt"):
+        future.result(timeout=60)
+    assert not lakhua.is_ready()